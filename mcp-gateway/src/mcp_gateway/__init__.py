@@ -0,0 +1,11 @@
+# Main function
+def main():
+    # Import the gateway
+    from mcp_gateway.server import run
+
+    # Run the gateway
+    run()
+
+
+# Export main function
+__all__ = ["main"]
@@ -0,0 +1,226 @@
+"""
+Gateway module for mcp-gateway.
+Hosts the News API, OpenWeather and SerpAPI Google MCP servers in one process, each
+mounted under its own path prefix of one Starlette app, so they share one interpreter,
+one event loop and one uvicorn.
+"""
+
+# Standard library imports
+import argparse
+import importlib
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable
+
+# Third party imports, the exposition code of the servers is shared
+import uvicorn
+from news_api_mcp_server.utils.metrics import CONTENT_TYPE, merge_expositions
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Mount, Route
+
+# Package of each server the gateway can host, by path prefix
+SERVERS = {
+    "news": "news_api_mcp_server",
+    "weather": "open_weather_mcp_server",
+    "serpapi": "serpapi_google_mcp_server",
+}
+
+
+# Gateway hosting several MCP servers in one app
+class Gateway:
+    """
+    Gateway hosting several MCP servers in one app. Each server keeps its own tools,
+    upstream client, caches, metrics and routes, served under /{prefix}.
+
+    Attributes:
+        servers (Dict[str, Any]): The hosted servers by path prefix
+
+    Methods:
+        lifespan(app: Starlette) -> AsyncIterator[None]: Run the lifespan of every server
+        handle_health(request: Request) -> PlainTextResponse: Serve the liveness of the gateway
+        handle_ready(request: Request) -> JSONResponse: Serve the readiness of every server
+        handle_metrics(request: Request) -> Response: Serve the metrics of every server
+        create_app(transport: str, debug: bool) -> Starlette: Build the app
+    """
+
+    # Constructor
+    def __init__(self, prefixes: Iterable[str] = SERVERS):
+        """
+        Build the hosted servers.
+
+        Args:
+            prefixes (Iterable[str]): The path prefixes of the servers to host, keys of SERVERS
+        """
+
+        # Build each server through its cached factory
+        self.servers: Dict[str, Any] = {
+            prefix: importlib.import_module(f"{SERVERS[prefix]}.server").get_server()
+            for prefix in prefixes
+        }
+
+    # Method to manage the application lifespan
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """Run the lifespan of every server, mounted apps get no lifespan events.
+
+        Args:
+            app (Starlette): The Starlette application.
+
+        Yields:
+            None: Control back to the application while it is running.
+        """
+
+        # Start the servers in order and stop them in reverse order
+        async with AsyncExitStack() as stack:
+            for server in self.servers.values():
+                await stack.enter_async_context(server.lifespan(app))
+
+            # Run the application
+            yield
+
+    # Method to serve the liveness of the gateway
+    async def handle_health(self, request: Request) -> PlainTextResponse:
+        """Serve the liveness of the gateway.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            PlainTextResponse: A 200 OK response.
+        """
+
+        # Return the response
+        return PlainTextResponse("OK")
+
+    # Method to serve the readiness of every server
+    async def handle_ready(self, request: Request) -> JSONResponse:
+        """Serve the readiness of every server, the gateway is ready when all are.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            JSONResponse: The report of each server, 200 when all are ready and 503 when not.
+        """
+
+        # Judge the readiness of each server
+        reports = {
+            prefix: server.ready_report() for prefix, server in self.servers.items()
+        }
+        ready = all(server_ready for server_ready, _ in reports.values())
+
+        # Return the reports
+        return JSONResponse(
+            {
+                "status": "ready" if ready else "not_ready",
+                "servers": {prefix: report for prefix, (_, report) in reports.items()},
+            },
+            status_code=200 if ready else 503,
+        )
+
+    # Method to serve the metrics of every server
+    async def handle_metrics(self, request: Request) -> Response:
+        """Serve the metrics of every server in one exposition, each sample labeled with its server.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The merged exposition text.
+        """
+
+        # Render the metrics of each server
+        expositions = {
+            prefix: (await server.handle_metrics(request)).body.decode("utf-8")
+            for prefix, server in self.servers.items()
+        }
+
+        # Return the merged metrics
+        return Response(
+            merge_expositions(expositions, label="server"), media_type=CONTENT_TYPE
+        )
+
+    # Method to build the app
+    def create_app(self, transport: str = "sse", debug: bool = False) -> Starlette:
+        """
+        Build the Starlette app, with the app of each server mounted under its prefix.
+
+        Args:
+            transport (str): Serve "sse", "streamable-http" or "both"
+            debug (bool): Debug mode
+
+        Returns:
+            Starlette: The app
+        """
+
+        # Return the Starlette app
+        return Starlette(
+            debug=debug,
+            lifespan=self.lifespan,
+            routes=[
+                # Gateway health, readiness and metrics routes
+                Route("/health", endpoint=self.handle_health, methods=["GET"]),
+                Route("/ready", endpoint=self.handle_ready, methods=["GET"]),
+                Route("/metrics", endpoint=self.handle_metrics, methods=["GET"]),
+                # Server apps, each under its prefix
+                *(
+                    Mount(
+                        f"/{prefix}",
+                        app=server.create_app(transport, debug, root_path=f"/{prefix}"),
+                    )
+                    for prefix, server in self.servers.items()
+                ),
+            ],
+        )
+
+
+# Run the gateway
+def run() -> None:
+    """Run the gateway."""
+
+    # Initialize the parser
+    parser = argparse.ArgumentParser(
+        description="Run the MCP servers in one process behind path prefixes"
+    )
+
+    # Add arguments
+    parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--debug", type=bool, default=False, help="Debug mode")
+    parser.add_argument(
+        "--transport",
+        type=str,
+        choices=["sse", "streamable-http", "both"],
+        default="sse",
+        help="Serve SSE at /{prefix}/sse, stateless streamable HTTP at /{prefix}/mcp, or both",
+    )
+    parser.add_argument(
+        "--servers",
+        nargs="+",
+        choices=list(SERVERS),
+        default=list(SERVERS),
+        help="Servers to host, each under its own path prefix",
+    )
+
+    # Parse the arguments
+    args = parser.parse_args()
+
+    # Build the servers
+    gateway = Gateway(dict.fromkeys(args.servers))
+
+    # Route the uvicorn logs through the log thread of the first server
+    logger = importlib.import_module(f"{SERVERS[args.servers[0]]}.utils.logger")
+    logger.configure_uvicorn_logging()
+
+    # Run the gateway
+    uvicorn.run(
+        gateway.create_app(args.transport, args.debug),
+        host=args.host,
+        port=args.port,
+        log_config=None,
+    )
+
+
+# Exports
+__all__ = ["Gateway", "SERVERS", "run"]
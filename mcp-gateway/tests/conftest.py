@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the tests of mcp-gateway.
+"""
+
+# Standard library imports
+import os
+
+# Third party imports
+import pytest
+
+# Keep the background upstream probes of the servers off, the tests have no network
+for prefix in ("NEWS_API", "OPEN_WEATHER", "SERPAPI"):
+    os.environ.setdefault(f"{prefix}_PROBE_INTERVAL", "0")
+
+
+# Backend of the async tests
+@pytest.fixture
+def anyio_backend() -> str:
+    """
+    Run the async tests on asyncio, the event loop the gateway runs on.
+
+    Returns:
+        str: The backend name
+    """
+
+    # Return the backend
+    return "asyncio"
@@ -0,0 +1,223 @@
+"""
+Tests for the gateway module of mcp-gateway.
+"""
+
+# Standard library imports
+import asyncio
+import importlib
+from typing import Any, Dict, List
+
+# Third party imports
+import httpx
+import pytest
+
+# Local imports
+from mcp_gateway.server import SERVERS, Gateway
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Gateway hosting the three servers
+@pytest.fixture
+def gateway(monkeypatch, tmp_path) -> Gateway:
+    """
+    Build a gateway hosting fresh copies of the three servers.
+
+    Args:
+        monkeypatch: Moves the working directory
+        tmp_path: Keeps the result cache the SerpApi server opens out of the tree
+
+    Returns:
+        Gateway: The gateway
+    """
+
+    # Build the servers in a temporary directory, not from the cache of a previous test
+    monkeypatch.chdir(tmp_path)
+    for package in SERVERS.values():
+        importlib.import_module(f"{package}.server").get_server.cache_clear()
+
+    # Return the gateway
+    return Gateway()
+
+
+# Client of the gateway app, with the lifespan of every server running
+@pytest.fixture
+async def client(gateway):
+    """
+    Run the gateway app with its lifespan, which runs the lifespan of every server.
+
+    Args:
+        gateway: The gateway
+
+    Yields:
+        httpx.AsyncClient: A client of the app, with the app in its "app" attribute
+    """
+
+    app = gateway.create_app("both")
+
+    # Run the lifespan around the requests, the test client does not send its events
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://test"
+        ) as client:
+            client.app = app
+            yield client
+
+
+# Read the first event of an SSE stream
+async def first_event(app: Any, path: str) -> Dict[str, Any]:
+    """
+    Open an SSE stream on the app, read its first event and disconnect.
+
+    Args:
+        app (Any): The ASGI app
+        path (str): The path of the stream
+
+    Returns:
+        Dict[str, Any]: The response status, headers and the text of the first event
+    """
+
+    messages: List[Dict[str, Any]] = []
+    received = asyncio.Event()
+    disconnected = asyncio.Event()
+
+    # Function to send the request, then the disconnect once the event arrived
+    sent = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    # Function to collect the response until a body carries an event
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+        if message["type"] == "http.response.body" and b"event:" in message.get(
+            "body", b""
+        ):
+            received.set()
+
+    # Open the stream
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 1),
+        "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+
+    try:
+        # Wait for the first event
+        await asyncio.wait_for(received.wait(), timeout=5)
+
+    finally:
+        # Disconnect, and stop the session the stream started
+        disconnected.set()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    # Return the response
+    start = next(
+        message for message in messages if message["type"] == "http.response.start"
+    )
+    return {
+        "status": start["status"],
+        "headers": {name.decode(): value.decode() for name, value in start["headers"]},
+        "body": b"".join(
+            message.get("body", b"")
+            for message in messages
+            if message["type"] == "http.response.body"
+        ).decode(),
+    }
+
+
+async def test_health(client):
+    """The gateway is live once its servers started."""
+
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+
+
+async def test_ready_aggregates_every_server(client, gateway):
+    """The readiness report holds the report of each server under its prefix."""
+
+    response = await client.get("/ready")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["status"] == "ready"
+    assert list(report["servers"]) == ["news", "weather", "serpapi"]
+    for prefix, server in gateway.servers.items():
+        assert report["servers"][prefix] == server.ready_report()[1]
+        assert (await client.get(f"/{prefix}/ready")).status_code == 200
+
+
+async def test_ready_fails_when_a_server_is_not_ready(client, gateway, monkeypatch):
+    """The gateway is not ready when any server is not."""
+
+    report = gateway.servers["weather"].ready_report()[1]
+    monkeypatch.setattr(
+        gateway.servers["weather"], "ready_report", lambda: (False, report)
+    )
+
+    response = await client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+
+async def test_metrics_are_merged_with_a_server_label(client):
+    """One exposition holds the metrics of every server, told apart by a label."""
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    for prefix in ("news", "weather", "serpapi"):
+        assert any(f'{{server="{prefix}"' in line for line in lines)
+
+    # The metadata of a metric the servers share is kept once
+    metadata = [line for line in lines if line.startswith("# TYPE")]
+    assert len(metadata) == len(set(metadata))
+
+
+async def test_sse_endpoints_carry_their_prefix(client):
+    """
+    The SSE stream of each server tells clients to post under its prefix. The streams
+    are opened in one test, sse-starlette keeps its exit event across event loops.
+    """
+
+    for prefix in ("news", "weather", "serpapi"):
+        response = await first_event(client.app, f"/{prefix}/sse")
+
+        assert response["status"] == 200
+        assert response["headers"]["content-type"].startswith("text/event-stream")
+        assert "event: endpoint" in response["body"]
+        assert f"data: /{prefix}/messages/?session_id=" in response["body"]
+
+
+@pytest.mark.parametrize("prefix", ["news", "weather", "serpapi"])
+async def test_streamable_http_under_the_prefix(client, prefix):
+    """The stateless streamable HTTP endpoint of each server is served under its prefix."""
+
+    response = await client.post(
+        f"/{prefix}/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["result"]["tools"]
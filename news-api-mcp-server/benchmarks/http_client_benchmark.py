@@ -0,0 +1,161 @@
+"""
+HTTP client benchmark for news-api-mcp-server.
+Compares requests/sec of a per-call httpx client against the shared pooled client,
+both talking to a local stub of the News API.
+
+Usage:
+    python benchmarks/http_client_benchmark.py --requests 500 --concurrency 20
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable
+
+# Third party imports
+import httpx
+
+# Use a dummy API key, the stub server does not check it
+os.environ.setdefault("NEWS_API_KEY", "benchmark")
+
+# Local imports
+from news_api_mcp_server.tools import get_news
+from news_api_mcp_server.utils.http_client import create_http_client
+
+# Stub payload shaped like a News API /v2/everything response
+STUB_PAYLOAD = json.dumps(
+    {
+        "status": "ok",
+        "totalResults": 5,
+        "articles": [
+            {
+                "source": {"id": None, "name": "Example News"},
+                "author": "Jane Doe",
+                "title": f"Example article {i}",
+                "description": "A short description of the article.",
+                "url": f"https://example.com/articles/{i}",
+                "urlToImage": f"https://example.com/images/{i}.jpg",
+                "publishedAt": "2025-01-01T00:00:00Z",
+                "content": "Lorem ipsum dolor sit amet. " * 20,
+            }
+            for i in range(5)
+        ],
+    }
+).encode()
+
+
+# Stub News API request handler
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve a fixed News API payload over keep-alive HTTP/1.1."""
+
+    # Keep connections open between requests
+    protocol_version = "HTTP/1.1"
+
+    # Handle GET requests
+    def do_GET(self) -> None:
+        """Serve the stub payload."""
+
+        # Send the response
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(STUB_PAYLOAD)
+
+    # Silence the request log
+    def log_message(self, format: str, *args) -> None:
+        """Disable per-request logging."""
+
+
+# Run a batch of calls and return requests/sec
+async def run_batch(
+    call: Callable[[], Awaitable[object]], requests: int, concurrency: int
+) -> float:
+    """
+    Run a batch of calls with bounded concurrency.
+
+    Args:
+        call (Callable[[], Awaitable[object]]): The call to benchmark
+        requests (int): Total number of calls
+        concurrency (int): Number of concurrent calls
+
+    Returns:
+        float: Requests per second
+    """
+
+    # Bound the concurrency
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Run a single call
+    async def worker() -> None:
+        async with semaphore:
+            await call()
+
+    # Time the batch
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    # Return requests per second
+    return requests / elapsed
+
+
+# Main benchmark
+async def main(requests: int, concurrency: int) -> None:
+    """
+    Benchmark per-call clients against the shared pooled client.
+
+    Args:
+        requests (int): Total number of calls per scenario
+        concurrency (int): Number of concurrent calls
+    """
+
+    # Start the stub server on a free port
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    # Before: a fresh client per call
+    async def per_call_client() -> None:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            await get_news(client=client, topic="python", page_size=5)
+
+    # After: the shared pooled client
+    pooled = create_http_client(base_url=base_url)
+
+    async def pooled_client() -> None:
+        await get_news(client=pooled, topic="python", page_size=5)
+
+    try:
+        # Run both scenarios
+        before = await run_batch(per_call_client, requests, concurrency)
+        after = await run_batch(pooled_client, requests, concurrency)
+
+    finally:
+        # Clean up
+        await pooled.aclose()
+        stub.shutdown()
+
+    # Report the results
+    print(f"requests={requests} concurrency={concurrency}")
+    print(f"per-call client: {before:10.1f} req/s")
+    print(f"pooled client:   {after:10.1f} req/s")
+    print(f"speedup:         {after / before:10.2f}x")
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the News API client")
+    parser.add_argument("--requests", type=int, default=500, help="Calls per run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent calls")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    asyncio.run(main(args.requests, args.concurrency))
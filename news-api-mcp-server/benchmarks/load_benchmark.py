@@ -0,0 +1,677 @@
+"""
+Load benchmark for news-api-mcp-server.
+Runs a mix of tool calls over concurrent SSE sessions, with the server talking to a
+local stub of the News API that adds latency and errors, and reports throughput,
+latency percentiles, peak RSS and event loop lag. Runs fully offline, on recorded
+fixtures if a corpus is given.
+
+Usage:
+    python benchmarks/load_benchmark.py --sessions 32 --duration 30 --latency-ms 80 --error-rate 0.01
+    python benchmarks/load_benchmark.py --corpus fixtures/news-api-mcp-server.jsonl.gz
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import string
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Third party imports
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Local imports
+from news_api_mcp_server.utils.fixtures import FixtureCorpus
+from serializer_benchmark import make_articles
+
+# Tool mix, the relative weight of each tool
+DEFAULT_MIX = "get-news=3,get-headlines=1"
+
+# Body of every News API response, keyed by path
+STUB_PAYLOADS = {
+    path: json.dumps(
+        {"status": "ok", "totalResults": 20, "articles": make_articles(20)}
+    ).encode()
+    for path in ("/v2/everything", "/v2/top-headlines")
+}
+
+# Body of a failed News API response
+STUB_ERROR = json.dumps(
+    {"status": "error", "code": "unexpectedError", "message": "Stub error"}
+).encode()
+
+
+# Stub News API request handler
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve News API payloads after a random latency, failing some requests."""
+
+    # Keep connections open between requests
+    protocol_version = "HTTP/1.1"
+
+    # Handle GET requests
+    def do_GET(self) -> None:
+        """Serve the payload of the request, or an error at the error rate."""
+
+        # Wait for the latency and decide the outcome
+        failed = self.server.delay()
+
+        # Pick the body, recorded if a corpus is given
+        url = urlsplit(self.path)
+        body, status = STUB_PAYLOADS.get(url.path), 200
+        if self.server.corpus is not None:
+            fixture = self.server.corpus.get(f"GET {url.path}", parse_qsl(url.query))
+            if fixture is not None:
+                body, status = fixture["body"].encode(), fixture["status_code"]
+        if failed:
+            body, status = STUB_ERROR, 500
+        elif body is None:
+            body, status = STUB_ERROR, 404
+
+        # Send the response
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Handle HEAD requests
+    def do_HEAD(self) -> None:
+        """Answer the readiness probe at once."""
+
+        # Send the response
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    # Silence the request log
+    def log_message(self, format: str, *args) -> None:
+        """Disable per-request logging."""
+
+
+# Stub News API with latency and errors
+class StubUpstream(ThreadingHTTPServer):
+    """
+    Stub News API on a free local port. Each request waits for a latency drawn from a
+    log-normal distribution and fails with a 500 at the error rate.
+
+    Attributes:
+        latency (float): Median latency in seconds
+        sigma (float): Spread of the log-normal latency, 0 for a fixed latency
+        error_rate (float): Fraction of requests that fail
+        corpus (Optional[FixtureCorpus]): Recorded fixtures served in place of the stub payloads
+        requests (int): Requests served
+        errors (int): Requests failed on purpose
+
+    Methods:
+        url() -> str: Get the base URL of the stub
+        delay() -> bool: Wait for the latency of a request and decide whether it fails
+        handle_error(request: Any, client_address: Any) -> None: Report errors other than dropped connections
+    """
+
+    # Handle each connection on its own thread
+    daemon_threads = True
+
+    # Constructor
+    def __init__(
+        self,
+        latency: float,
+        sigma: float,
+        error_rate: float,
+        seed: int,
+        corpus: Optional[FixtureCorpus] = None,
+    ):
+        """
+        Start listening on a free local port.
+
+        Args:
+            latency (float): Median latency in seconds
+            sigma (float): Spread of the log-normal latency, 0 for a fixed latency
+            error_rate (float): Fraction of requests that fail
+            seed (int): Seed of the latency and error draws
+            corpus (Optional[FixtureCorpus]): Recorded fixtures served in place of the stub payloads. Defaults to None.
+        """
+
+        # Listen on a free port
+        super().__init__(("127.0.0.1", 0), StubHandler)
+
+        # Set the configuration
+        self.latency = latency
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.corpus = corpus
+
+        # Initialize the draws and the counters
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    # Get the base URL of the stub
+    def url(self) -> str:
+        """
+        Get the base URL of the stub.
+
+        Returns:
+            str: The base URL
+        """
+
+        # Return the URL
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    # Wait for the latency of a request and decide whether it fails
+    def delay(self) -> bool:
+        """
+        Wait for the latency of a request and decide whether it fails.
+
+        Returns:
+            bool: Whether the request fails
+        """
+
+        # Draw the latency and the outcome
+        with self._lock:
+            latency = self.latency * math.exp(self.sigma * self._random.gauss(0, 1))
+            failed = self._random.random() < self.error_rate
+            self.requests += 1
+            self.errors += failed
+
+        # Wait for the latency
+        time.sleep(latency)
+
+        # Return the outcome
+        return failed
+
+    # Report errors other than dropped connections
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """
+        Report errors other than dropped connections, hedged and timed out requests
+        close their connection before the stub answers.
+
+        Args:
+            request (Any): The request socket
+            client_address (Any): The client address
+        """
+
+        # If the client dropped the connection, ignore it
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+
+        # Report the error
+        super().handle_error(request, client_address)
+
+
+# Find a free port
+def free_port() -> int:
+    """
+    Find a free local port.
+
+    Returns:
+        int: The port
+    """
+
+    # Bind to port 0 and return the port the OS picked
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Parse the tool mix
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse a tool mix formatted as "tool=weight,tool=weight".
+
+    Args:
+        value (str): The tool mix
+
+    Returns:
+        Dict[str, float]: The weight of each tool
+    """
+
+    # Split each tool from its weight
+    return {
+        name.strip(): float(weight)
+        for name, weight in (item.split("=") for item in value.split(",") if item)
+    }
+
+
+# Build the arguments of a tool call
+def make_arguments(name: str, rng: random.Random, distinct: int) -> Dict[str, Any]:
+    """
+    Build the arguments of a tool call, drawn from a fixed number of distinct values so
+    the share of repeated calls stays the same from run to run.
+
+    Args:
+        name (str): The tool name
+        rng (random.Random): The random draws of the session
+        distinct (int): Number of distinct argument values per tool
+
+    Returns:
+        Dict[str, Any]: The arguments
+    """
+
+    number = rng.randrange(distinct)
+
+    # Build the arguments of the tool
+    if name == "get-headlines":
+        letters = string.ascii_lowercase
+        country = letters[number // 26 % 26] + letters[number % 26]
+        return {"country": country, "page_size": 10}
+    return {"topic": f"topic-{number}", "page_size": 10}
+
+
+# Drive SSE sessions from one client process
+def drive(
+    url: str,
+    sessions: int,
+    duration: float,
+    mix: Dict[str, float],
+    distinct: int,
+    seed: int,
+) -> List[Tuple[str, float, bool]]:
+    """
+    Call a mix of tools in a loop over several SSE sessions.
+
+    Args:
+        url (str): The SSE endpoint
+        sessions (int): Number of concurrent sessions
+        duration (float): Seconds to keep calling
+        mix (Dict[str, float]): The weight of each tool
+        distinct (int): Number of distinct argument values per tool
+        seed (int): Seed of the first session, each session draws from its own seed
+
+    Returns:
+        List[Tuple[str, float, bool]]: The tool, latency in seconds and failure of every call
+    """
+
+    calls: List[Tuple[str, float, bool]] = []
+    names, weights = list(mix), list(mix.values())
+
+    # Run one session
+    async def session(number: int, ready: asyncio.Barrier) -> None:
+        rng = random.Random(seed + number)
+        async with sse_client(url) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as client:
+                await client.initialize()
+
+                # Start calling once every session is open
+                await ready.wait()
+                deadline = time.monotonic() + duration
+                while time.monotonic() < deadline:
+                    name = rng.choices(names, weights)[0]
+                    arguments = make_arguments(name, rng, distinct)
+                    start = time.perf_counter()
+                    result = await client.call_tool(name, arguments)
+                    calls.append((name, time.perf_counter() - start, result.isError))
+
+    # Run every session until the deadline
+    async def run() -> None:
+        ready = asyncio.Barrier(sessions)
+        await asyncio.gather(*(session(i, ready) for i in range(sessions)))
+
+    asyncio.run(run())
+
+    # Return the calls
+    return calls
+
+
+# Read a memory figure of a process
+def read_memory(pid: int, field: str) -> Optional[int]:
+    """
+    Read a memory figure of a process from /proc, on Linux.
+
+    Args:
+        pid (int): The process id
+        field (str): The field of /proc/<pid>/status, such as "VmHWM" for the peak RSS
+
+    Returns:
+        Optional[int]: The figure in bytes, or None where /proc is not available
+    """
+
+    try:
+        # Find the field, it is given in kB
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+
+    # Handle a platform without /proc
+    except OSError:
+        return None
+
+    # Return None if the field is missing
+    return None
+
+
+# Watch the server while it is under load
+class Watcher(threading.Thread):
+    """
+    Poll the server's /ready report and its memory while it is under load.
+
+    Attributes:
+        lags (List[float]): Maximum recent event loop lag of each poll, in seconds
+        not_ready (int): Polls that found the server not ready
+        polls (int): Polls made
+        peak_rss (Optional[int]): Peak RSS of the server in bytes
+
+    Methods:
+        run() -> None: Poll until stopped
+        stop() -> None: Stop polling and read the peak RSS
+    """
+
+    # Constructor
+    def __init__(self, base_url: str, pid: int, interval: float = 0.5):
+        """
+        Initialize the watcher.
+
+        Args:
+            base_url (str): Base URL of the server
+            pid (int): Process id of the server
+            interval (float): Seconds between polls
+        """
+
+        # Initialize the thread
+        super().__init__(daemon=True)
+
+        # Set the configuration
+        self.base_url = base_url
+        self.pid = pid
+        self.interval = interval
+
+        # Initialize the figures
+        self.lags: List[float] = []
+        self.not_ready = 0
+        self.polls = 0
+        self.peak_rss: Optional[int] = None
+        self._stopped = threading.Event()
+
+    # Poll until stopped
+    def run(self) -> None:
+        """Poll the readiness report until stopped."""
+
+        with httpx.Client(timeout=5) as client:
+            while not self._stopped.wait(self.interval):
+                try:
+                    # Read the readiness report
+                    response = client.get(f"{self.base_url}/ready")
+                    report = response.json()
+
+                # Handle a server too busy to answer
+                except (httpx.HTTPError, ValueError):
+                    self.polls += 1
+                    self.not_ready += 1
+                    continue
+
+                # Record the figures
+                self.polls += 1
+                self.not_ready += response.status_code != 200
+                self.lags.append(report["event_loop"]["max_lag"])
+
+    # Stop polling and read the peak RSS
+    def stop(self) -> None:
+        """Stop polling, and read the peak RSS while the server is still running."""
+
+        # Stop polling
+        self._stopped.set()
+        self.join()
+
+        # Read the peak RSS
+        self.peak_rss = read_memory(self.pid, "VmHWM")
+
+
+# Summarize latencies
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize latencies in milliseconds.
+
+    Args:
+        latencies (List[float]): Latencies in seconds
+
+    Returns:
+        Dict[str, float]: The p50, p95, p99 and max latency in milliseconds
+    """
+
+    # If there are too few latencies for percentiles, repeat the only one
+    if len(latencies) < 2:
+        latencies = latencies * 2 or [0.0, 0.0]
+
+    # Return the percentiles
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "p50": round(quantiles[49] * 1e3, 2),
+        "p95": round(quantiles[94] * 1e3, 2),
+        "p99": round(quantiles[98] * 1e3, 2),
+        "max": round(max(latencies) * 1e3, 2),
+    }
+
+
+# Main benchmark
+def main(
+    sessions: int,
+    clients: int,
+    duration: float,
+    mix: Dict[str, float],
+    distinct: int,
+    latency: float,
+    sigma: float,
+    error_rate: float,
+    seed: int,
+    corpus: Optional[str],
+    output: Optional[str],
+) -> None:
+    """
+    Load the server with a mix of tool calls and report the results.
+
+    Args:
+        sessions (int): Total number of SSE sessions
+        clients (int): Number of client processes
+        duration (float): Seconds to keep calling
+        mix (Dict[str, float]): The weight of each tool
+        distinct (int): Number of distinct argument values per tool
+        latency (float): Median latency of the stub in seconds
+        sigma (float): Spread of the log-normal stub latency
+        error_rate (float): Fraction of stub requests that fail
+        seed (int): Seed of the stub and the sessions
+        corpus (Optional[str]): Path of recorded fixtures the stub serves
+        output (Optional[str]): Path of a JSON file the results are written to
+    """
+
+    # Start the stub News API
+    stub = StubUpstream(
+        latency, sigma, error_rate, seed, FixtureCorpus(corpus) if corpus else None
+    )
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+    # Start the server against the stub, without pacing so the stub sets the pace
+    port = free_port()
+    env = {
+        **os.environ,
+        "NEWS_API_KEY": "benchmark",
+        "NEWS_API_BASE_URL": stub.url(),
+        "NEWS_API_PROBE_URL": stub.url(),
+        "NEWS_API_HTTP2": "false",
+        "NEWS_API_RATE_LIMIT": "0",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from news_api_mcp_server import main; main()",
+            "--host=127.0.0.1",
+            f"--port={port}",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        # Wait for the server
+        base_url = f"http://127.0.0.1:{port}"
+        for _ in range(600):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.HTTPError:
+                time.sleep(0.05)
+
+        # Watch the server while it is under load
+        watcher = Watcher(base_url, server.pid)
+        watcher.start()
+
+        # Spread the sessions over the client processes
+        per_client = [
+            sessions // clients + (i < sessions % clients) for i in range(clients)
+        ]
+        jobs = [
+            (
+                f"{base_url}/sse",
+                count,
+                duration,
+                mix,
+                distinct,
+                seed + sum(per_client[:i]),
+            )
+            for i, count in enumerate(per_client)
+            if count
+        ]
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.starmap(drive, jobs)
+
+        # Stop watching
+        watcher.stop()
+
+    finally:
+        # Stop the server, killing it if open streams hold up the shutdown
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+        # Stop the stub
+        stub.shutdown()
+
+    # Gather the results
+    calls = [call for result in results for call in result]
+    failed = sum(failed for _, _, failed in calls)
+    report = {
+        "sessions": sessions,
+        "duration": duration,
+        "upstream": {
+            "latency_ms": latency * 1e3,
+            "sigma": sigma,
+            "error_rate": error_rate,
+            "requests": stub.requests,
+            "errors": stub.errors,
+        },
+        "calls": len(calls),
+        "errors": failed,
+        "throughput": round(len(calls) / duration, 1),
+        "latency_ms": summarize([latency for _, latency, _ in calls]),
+        "tools": {
+            name: {
+                "calls": len(
+                    latencies := [lat for tool, lat, _ in calls if tool == name]
+                ),
+                "errors": sum(failed for tool, _, failed in calls if tool == name),
+                "latency_ms": summarize(latencies),
+            }
+            for name in mix
+        },
+        "peak_rss_mb": (
+            round(watcher.peak_rss / 2**20, 1) if watcher.peak_rss is not None else None
+        ),
+        "event_loop_lag_ms": {
+            "max": round(max(watcher.lags, default=0.0) * 1e3, 2),
+            "mean": round(statistics.fmean(watcher.lags or [0.0]) * 1e3, 2),
+        },
+        "not_ready": f"{watcher.not_ready}/{watcher.polls}",
+    }
+
+    # Report the results
+    print(
+        f"sessions={sessions} clients={len(jobs)} duration={duration:g}s"
+        f" upstream latency={latency * 1e3:g} ms sigma={sigma:g}"
+        f" error_rate={error_rate:.1%}"
+    )
+    print(
+        f"calls={report['calls']} errors={failed} throughput={report['throughput']} calls/s"
+        f"  p50={report['latency_ms']['p50']} ms p95={report['latency_ms']['p95']} ms"
+        f" p99={report['latency_ms']['p99']} ms"
+    )
+    for name, tool in report["tools"].items():
+        print(
+            f"  {name:<16} calls={tool['calls']:<7} errors={tool['errors']:<5}"
+            f" p50={tool['latency_ms']['p50']} ms p95={tool['latency_ms']['p95']} ms"
+            f" p99={tool['latency_ms']['p99']} ms"
+        )
+    print(
+        f"upstream requests={stub.requests} errors={stub.errors}"
+        f"  peak rss={report['peak_rss_mb']} MB"
+        f"  event loop lag max={report['event_loop_lag_ms']['max']} ms"
+        f" mean={report['event_loop_lag_ms']['mean']} ms"
+        f"  not ready={report['not_ready']} polls"
+    )
+
+    # If an output file is given, write the results to it
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Load test the server offline")
+    parser.add_argument("--sessions", type=int, default=32, help="SSE sessions")
+    parser.add_argument(
+        "--clients", type=int, default=min(4, os.cpu_count()), help="Client processes"
+    )
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help="Tool weights as tool=weight,tool=weight"
+    )
+    parser.add_argument(
+        "--distinct", type=int, default=100, help="Distinct arguments per tool"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=80, help="Median upstream latency"
+    )
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="Log-normal latency spread"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.01, help="Fraction of upstream errors"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the random draws")
+    parser.add_argument("--corpus", help="Serve recorded fixtures from the stub")
+    parser.add_argument("--output", help="Write the results to a JSON file")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(
+        args.sessions,
+        args.clients,
+        args.duration,
+        parse_mix(args.mix),
+        args.distinct,
+        args.latency_ms / 1e3,
+        args.latency_sigma,
+        args.error_rate,
+        args.seed,
+        args.corpus,
+        args.output,
+    )
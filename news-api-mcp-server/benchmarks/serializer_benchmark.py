@@ -0,0 +1,136 @@
+"""
+Serializer benchmark for news-api-mcp-server.
+Compares the encode time and output size of each installed JSON backend against
+the previous json.dumps call, over payloads shaped like News API responses.
+
+Usage:
+    python benchmarks/serializer_benchmark.py --number 2000
+    python benchmarks/serializer_benchmark.py --payload recorded_articles.json
+    python benchmarks/serializer_benchmark.py --corpus fixtures/news-api-mcp-server.jsonl.gz
+"""
+
+# Standard library imports
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+# Local imports
+from news_api_mcp_server.utils.fixtures import FixtureCorpus
+from news_api_mcp_server.utils.serializer import BACKENDS, Serializer
+
+
+# Build a list of articles shaped like a News API response
+def make_articles(count: int) -> list:
+    """
+    Build a list of articles shaped like a News API response.
+
+    Args:
+        count (int): Number of articles
+
+    Returns:
+        list: The articles
+    """
+
+    # Return the articles
+    return [
+        {
+            "source": {"id": None, "name": "Example News"},
+            "author": "Jane Doe",
+            "title": f"Example article {i} — with a non-ASCII dash",
+            "description": "A short description of the article. " * 3,
+            "url": f"https://example.com/articles/{i}",
+            "urlToImage": f"https://example.com/images/{i}.jpg",
+            "publishedAt": "2025-01-01T00:00:00Z",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 4,
+        }
+        for i in range(count)
+    ]
+
+
+# Time one encode function
+def time_encode(encode: Callable[[Any], str], payload: Any, number: int) -> float:
+    """
+    Time one encode function.
+
+    Args:
+        encode (Callable[[Any], str]): The encode function
+        payload (Any): The payload to encode
+        number (int): Number of encodes per run
+
+    Returns:
+        float: Best time per encode in microseconds
+    """
+
+    # Take the best of a few runs to reduce noise
+    best = min(timeit.repeat(lambda: encode(payload), number=number, repeat=5))
+
+    # Return microseconds per encode
+    return best / number * 1e6
+
+
+# Main benchmark
+def main(payloads: Dict[str, Any], number: int) -> None:
+    """
+    Benchmark every installed backend over every payload.
+
+    Args:
+        payloads (Dict[str, Any]): The payloads by name
+        number (int): Number of encodes per run
+    """
+
+    for name, payload in payloads.items():
+        # Time the previous encode path as the baseline
+        baseline = time_encode(json.dumps, payload, number)
+        size = len(json.dumps(payload).encode())
+        print(f"\n{name}")
+        print(
+            f"  {'json.dumps (before)':<20} {baseline:9.1f} us {1:6.2f}x {size:9d} bytes"
+        )
+
+        for backend in BACKENDS:
+            try:
+                # Build the serializer
+                serializer = Serializer(backend=backend, compact=True)
+
+            except ImportError:
+                # Skip the backends that are not installed
+                print(f"  {backend:<20} not installed")
+                continue
+
+            # Time the serializer
+            elapsed = time_encode(serializer.dumps, payload, number)
+            size = len(serializer.dumps(payload).encode())
+            print(
+                f"  {backend:<20} {elapsed:9.1f} us {baseline / elapsed:6.2f}x"
+                f" {size:9d} bytes"
+            )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends")
+    parser.add_argument("--number", type=int, default=2000, help="Encodes per run")
+    parser.add_argument("--payload", type=str, help="Recorded JSON payload to use")
+    parser.add_argument("--corpus", type=str, help="Recorded fixtures to use")
+    args = parser.parse_args()
+
+    # Use the recorded payload, the recorded fixtures, or the representative ones
+    if args.payload:
+        with open(args.payload, "rb") as file:
+            payloads = {args.payload: json.load(file)}
+    elif args.corpus:
+        payloads = {
+            fixture["key"]: json.loads(fixture["body"])
+            for fixture in FixtureCorpus(args.corpus).fixtures()
+            if fixture["status_code"] == 200
+        }
+    else:
+        payloads = {
+            "get-headlines (page_size=5)": make_articles(5),
+            "get-news (page_size=25)": make_articles(25),
+        }
+
+    # Run the benchmark
+    main(payloads, args.number)
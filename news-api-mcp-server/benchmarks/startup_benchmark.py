@@ -0,0 +1,172 @@
+"""
+Startup benchmark for news-api-mcp-server.
+Measures the cold start of the server: the import time of its modules, from
+python -X importtime, and the time from process start to the first /health OK.
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 10 --top 15
+"""
+
+# Standard library imports
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Third party imports
+import httpx
+
+# Module the server is built in
+SERVER_MODULE = "news_api_mcp_server.server"
+
+# Environment of the server processes
+SERVER_ENV = {**os.environ, "NEWS_API_KEY": "benchmark"}
+
+# Line written by python -X importtime for each imported module
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+# Find a free port
+def free_port() -> int:
+    """
+    Find a free local port.
+
+    Returns:
+        int: The port
+    """
+
+    # Bind to port 0 and return the port the OS picked
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Measure the import time of the server module
+def import_times() -> Tuple[float, Dict[str, Tuple[float, float]]]:
+    """
+    Import the server module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple[float, Dict[str, Tuple[float, float]]]: The total import time in seconds, and the self and cumulative seconds of each module
+    """
+
+    # Import the server module, the report is written to stderr
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {SERVER_MODULE}"],
+        env=SERVER_ENV,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total = 0.0
+    modules = {}
+    for line in result.stderr.splitlines():
+        # Skip anything but the report lines
+        if (match := IMPORT_TIME_LINE.match(line)) is None:
+            continue
+
+        # Record the module, times are in microseconds
+        own, cumulative, indent, name = match.groups()
+        modules[name] = (int(own) / 1e6, int(cumulative) / 1e6)
+
+        # Top-level imports add up to the total
+        if not indent:
+            total += int(cumulative) / 1e6
+
+    # Return the times
+    return total, modules
+
+
+# Measure the time to the first /health OK
+def time_to_health() -> float:
+    """
+    Start the server and poll /health until it answers.
+
+    Returns:
+        float: Seconds from process start to the first successful /health
+    """
+
+    # Start the server
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from news_api_mcp_server import main; main()",
+            "--host=127.0.0.1",
+            f"--port={port}",
+        ],
+        env=SERVER_ENV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        # Poll until the server answers
+        with httpx.Client() as client:
+            while True:
+                try:
+                    client.get(f"http://127.0.0.1:{port}/health").raise_for_status()
+                    return time.perf_counter() - start
+                except httpx.HTTPError:
+                    # If the server died, stop waiting
+                    if server.poll() is not None:
+                        raise RuntimeError("The server exited before it was ready")
+                    time.sleep(0.005)
+
+    finally:
+        # Stop the server
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+# Main benchmark
+def main(runs: int, top: int) -> None:
+    """
+    Report the import time of the server and its time to the first /health OK.
+
+    Args:
+        runs (int): Number of cold starts to measure
+        top (int): Number of slowest modules to list
+    """
+
+    # Measure the imports
+    total, modules = import_times()
+    print(f"import {SERVER_MODULE}: {total * 1e3:.1f} ms")
+
+    # List the modules that take longest to import, including their own imports
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (own, cumulative) in slowest[:top]:
+        print(
+            f"  {cumulative * 1e3:8.1f} ms cumulative {own * 1e3:7.1f} ms self  {name}"
+        )
+
+    # Measure the cold starts
+    timings: List[float] = [time_to_health() for _ in range(runs)]
+    print(
+        f"first /health OK over {runs} runs: min={min(timings) * 1e3:.1f} ms"
+        f" median={statistics.median(timings) * 1e3:.1f} ms"
+        f" max={max(timings) * 1e3:.1f} ms"
+    )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the server cold start")
+    parser.add_argument("--runs", type=int, default=10, help="Cold starts to measure")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(args.runs, args.top)
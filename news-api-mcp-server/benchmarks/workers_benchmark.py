@@ -0,0 +1,222 @@
+"""
+Workers benchmark for news-api-mcp-server.
+Measures tool calls/sec over SSE sessions as the number of worker processes grows,
+with the server talking to a local stub of the News API.
+
+Usage:
+    python benchmarks/workers_benchmark.py --workers 1 2 4 --sessions 32 --duration 10
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from typing import List
+
+# Third party imports
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Local imports
+from http_client_benchmark import StubHandler
+
+
+# Find a free port
+def free_port() -> int:
+    """
+    Find a free local port.
+
+    Returns:
+        int: The port
+    """
+
+    # Bind to port 0 and return the port the OS picked
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Drive SSE sessions from one client process
+def drive(url: str, sessions: int, duration: float, offset: int) -> List[float]:
+    """
+    Call get-news in a loop over several SSE sessions.
+
+    Args:
+        url (str): The SSE endpoint
+        sessions (int): Number of concurrent sessions
+        duration (float): Seconds to keep calling
+        offset (int): Offset of the session numbers, so topics differ across processes
+
+    Returns:
+        List[float]: Latency of every call, in seconds
+    """
+
+    latencies: List[float] = []
+
+    # Run one session
+    async def session(number: int, deadline: float) -> None:
+        async with sse_client(url) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as client:
+                await client.initialize()
+
+                # Each session asks for its own topic, so calls are not coalesced
+                arguments = {"topic": f"topic-{number}", "page_size": 5}
+                while time.monotonic() < deadline:
+                    start = time.perf_counter()
+                    await client.call_tool("get-news", arguments)
+                    latencies.append(time.perf_counter() - start)
+
+    # Run every session until the deadline
+    async def run() -> None:
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(session(offset + i, deadline) for i in range(sessions)))
+
+    asyncio.run(run())
+
+    # Return the latencies
+    return latencies
+
+
+# Benchmark one worker count
+def measure(
+    workers: int, stub_url: str, clients: int, sessions: int, duration: float
+) -> List[float]:
+    """
+    Start the server with a worker count and load it from several client processes.
+
+    Args:
+        workers (int): Number of worker processes
+        stub_url (str): Base URL of the stub News API
+        clients (int): Number of client processes
+        sessions (int): Total number of SSE sessions
+        duration (float): Seconds to keep calling
+
+    Returns:
+        List[float]: Latency of every call, in seconds
+    """
+
+    # Start the server against the stub
+    port = free_port()
+    env = {
+        **os.environ,
+        "NEWS_API_KEY": "benchmark",
+        "NEWS_API_BASE_URL": stub_url,
+        "NEWS_API_HTTP2": "false",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from news_api_mcp_server import main; main()",
+            "--host=127.0.0.1",
+            f"--port={port}",
+            f"--workers={workers}",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        # Wait for the server
+        base_url = f"http://127.0.0.1:{port}"
+        for _ in range(600):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.HTTPError:
+                time.sleep(0.05)
+
+        # Spread the sessions over the client processes
+        per_client = [
+            sessions // clients + (i < sessions % clients) for i in range(clients)
+        ]
+        jobs = [
+            (f"{base_url}/sse", count, duration, sum(per_client[:i]))
+            for i, count in enumerate(per_client)
+            if count
+        ]
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.starmap(drive, jobs)
+
+    finally:
+        # Stop the server, killing it if open streams hold up the shutdown
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    # Return every latency
+    return [latency for result in results for latency in result]
+
+
+# Main benchmark
+def main(workers: List[int], clients: int, sessions: int, duration: float) -> None:
+    """
+    Benchmark tool calls/sec for each worker count.
+
+    Args:
+        workers (List[int]): Worker counts to measure
+        clients (int): Number of client processes
+        sessions (int): Total number of SSE sessions
+        duration (float): Seconds to keep calling per worker count
+    """
+
+    # Start the stub server on a free port
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    # Report the setup
+    print(
+        f"cpus={os.cpu_count()} clients={clients} sessions={sessions}"
+        f" duration={duration:g}s"
+    )
+
+    baseline = None
+    try:
+        for count in workers:
+            # Measure the worker count
+            latencies = measure(count, stub_url, clients, sessions, duration)
+            rate = len(latencies) / duration
+            baseline = baseline or rate
+
+            # Report the results
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"workers={count:<3} {rate:9.1f} calls/s {rate / baseline:6.2f}x"
+                f"  p50={quantiles[49] * 1e3:7.1f} ms p99={quantiles[98] * 1e3:7.1f} ms"
+            )
+
+    finally:
+        # Clean up
+        stub.shutdown()
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker serving")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts"
+    )
+    parser.add_argument(
+        "--clients", type=int, default=os.cpu_count(), help="Client processes"
+    )
+    parser.add_argument("--sessions", type=int, default=32, help="SSE sessions")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per run")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(args.workers, args.clients, args.sessions, args.duration)
@@ -1,7 +1,8 @@
 # Standard library imports
 import argparse
-import json
-from typing import Dict, List, Optional, Union
+import functools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 # Third party imports
 import mcp.types as types
@@ -10,14 +11,40 @@ from mcp.server import Server
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 
 # Import health routes
 from news_api_mcp_server.health import health_routes
-from news_api_mcp_server.tools import get_headlines, get_news
+
+# Import tools, each tool module is loaded when its tool is first called
+from news_api_mcp_server import tools
 
 # Local imports
-from news_api_mcp_server.utils.logger import get_logger
+from news_api_mcp_server.utils.circuit_breaker import CircuitBreakers
+from news_api_mcp_server.utils.fixtures import NEWS_API_FIXTURES_MODE
+from news_api_mcp_server.utils.http_client import create_http_client, pool_stats
+from news_api_mcp_server.utils.logger import (
+    configure_uvicorn_logging,
+    get_logger,
+    log_stats,
+)
+from news_api_mcp_server.utils.metrics import CONTENT_TYPE, Metrics, current_tool
+from news_api_mcp_server.utils.projection import (
+    FIELDS_SCHEMA,
+    Fields,
+    ProjectionCache,
+    parse_fields,
+    project,
+)
+from news_api_mcp_server.utils.rate_limiter import RateLimiter
+from news_api_mcp_server.utils.readiness import Readiness, UpstreamProbe
+from news_api_mcp_server.utils.retry import RetryPolicy
+from news_api_mcp_server.utils.serializer import Serializer
+from news_api_mcp_server.utils.single_flight import SingleFlight
+from news_api_mcp_server.utils.streamable_http import StreamableHTTPTransport
+from news_api_mcp_server.utils.tool_catalog import ToolCatalog
+from news_api_mcp_server.utils.workers import run_workers
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -32,6 +59,47 @@ class NewsAPIMCPServer:
         # Initialize the server
         self.server = Server("news-api-mcp-server")
 
+        # Initialize the rate limiter, one token bucket per upstream host
+        self.rate_limiter = RateLimiter()
+
+        # Initialize the retry policy for idempotent upstream requests
+        self.retry_policy = RetryPolicy()
+
+        # Initialize the circuit breakers, one per upstream host and tool
+        self.circuit_breakers = CircuitBreakers()
+
+        # Initialize the shared HTTP client, paced by the rate limiter
+        self.http_client = create_http_client(
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breakers=self.circuit_breakers,
+        )
+
+        # Initialize the single-flight group for identical concurrent calls
+        self.single_flight = SingleFlight()
+
+        # Initialize the cache of slim projections, kept apart from full results
+        self.projection_cache = ProjectionCache()
+
+        # Initialize the serializer for tool results
+        self.serializer = Serializer()
+
+        # Build the tool list once, it never changes at runtime
+        self.tool_catalog = ToolCatalog(self._build_tools())
+
+        # Allocate the metrics of every tool once
+        self.metrics = Metrics(tool.name for tool in self.tool_catalog.tools)
+
+        # Initialize the readiness, measured in the background while the app runs,
+        # the upstream is not probed while fixtures are replayed
+        self.readiness = Readiness(
+            probe=(
+                UpstreamProbe(interval=0)
+                if NEWS_API_FIXTURES_MODE == "replay"
+                else None
+            )
+        )
+
         # Register handlers
         self._register_handlers()
 
@@ -40,12 +108,58 @@ class NewsAPIMCPServer:
         """Register the handlers for the News API MCP Server."""
 
         # Tools handlers
-        self.server.list_tools()(self.handle_list_tools)
+        self.server.request_handlers[types.ListToolsRequest] = (
+            self.tool_catalog.handle_list_tools
+        )
         self.server.call_tool()(self.handle_call_tool)
 
-    # Method to handle list tools
-    async def handle_list_tools(self) -> List[types.Tool]:
-        """Handle the list tools request.
+    # Method to manage the application lifespan
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """Manage the application lifespan.
+
+        Args:
+            app (Starlette): The Starlette application.
+
+        Yields:
+            None: Control back to the application while it is running.
+        """
+
+        # Log the serializer backend
+        logger.info(f"JSON serializer: {self.serializer.info()}")
+
+        # Start measuring the event loop lag and probing the upstream
+        self.readiness.start()
+
+        try:
+            # Run the application
+            yield
+
+        finally:
+            # Stop the readiness monitors
+            await self.readiness.stop()
+
+            # Log the coalescing counters
+            logger.info(f"Single-flight stats: {self.single_flight.stats()}")
+
+            # Log the projection cache counters
+            logger.info(f"Projection cache stats: {self.projection_cache.stats()}")
+
+            # Log the rate limiter counters
+            logger.info(f"Rate limiter stats: {self.rate_limiter.stats()}")
+
+            # Log the retry and hedging counters
+            logger.info(f"Retry stats: {self.retry_policy.stats()}")
+
+            # Log the circuit breaker counters
+            logger.info(f"Circuit breaker stats: {self.circuit_breakers.stats()}")
+
+            # Close the shared HTTP client
+            await self.http_client.aclose()
+
+    # Method to build the tool definitions
+    def _build_tools(self) -> List[types.Tool]:
+        """Build the tool definitions, called once at startup.
 
         Returns:
             List[types.Tool]: The list of tools.
@@ -67,6 +181,7 @@ class NewsAPIMCPServer:
                             "type": "number",
                             "description": "Number of results to return (1-25)",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["topic", "page_size"],
                 },
@@ -85,6 +200,7 @@ class NewsAPIMCPServer:
                             "type": "number",
                             "description": "Number of results to return (1-25)",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["country", "page_size"],
                 },
@@ -105,8 +221,105 @@ class NewsAPIMCPServer:
             List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
         """
 
+        # Get the metrics of the tool and time the call against them
+        tool = self.metrics.tool(name)
+        token = current_tool.set(tool)
+        start = tool.start()
+
+        try:
+            # Handle the call
+            content = await self._handle_call_tool(name, arguments)
+
+        # Handle any exception, including cancellation
+        except BaseException as e:
+            # Record the failure
+            tool.fail(start, e)
+            raise
+
+        finally:
+            # Stop attributing upstream requests to the tool
+            current_tool.reset(token)
+
+        # Record the call
+        tool.finish(start, len(content[0].text))
+
+        # Return the content
+        return content
+
+    # Method to handle call tool without metrics
+    async def _handle_call_tool(
+        self, name: str, arguments: Optional[Dict]
+    ) -> List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]:
+        """Handle the call tool request, coalescing calls and serving cached projections.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Optional[Dict]): The arguments for the tool.
+
+        Returns:
+            List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
+        """
+
         # Default to empty dict if arguments is None
-        arguments = arguments or {}
+        arguments = dict(arguments or {})
+
+        # Split off the projection, it applies to the result rather than the tool
+        fields = parse_fields(arguments.pop("fields", None))
+
+        # Build the call key, equal projections share it
+        key = self.single_flight.make_key(name, {**arguments, "fields": fields})
+
+        # If a slim projection of this call is cached
+        if fields and (text := self.projection_cache.get(key)) is not None:
+            # Return the cached projection
+            return [types.TextContent(type="text", text=text)]
+
+        # Share one upstream call between identical concurrent calls
+        return await self.single_flight.run(
+            key, lambda: self._respond(name, arguments, fields, key)
+        )
+
+    # Method to call a tool and serialize its result
+    async def _respond(
+        self, name: str, arguments: Dict, fields: Optional[Fields], key: str
+    ) -> List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]:
+        """Call a tool, project its result onto the requested fields and serialize it.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Dict): The arguments for the tool, without the fields.
+            fields (Optional[Fields]): The parsed projection, or None for the full result.
+            key (str): The call key, used to cache the projection.
+
+        Returns:
+            List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
+        """
+
+        # Call the tool
+        result = await self._call_tool(name, arguments)
+
+        # Project the result before serializing it
+        text = self.serializer.dumps(project(result, fields))
+
+        # If a projection was requested
+        if fields:
+            # Cache the slim projection
+            self.projection_cache.set(key, text)
+
+        # Return the content
+        return [types.TextContent(type="text", text=text)]
+
+    # Method to call a tool
+    async def _call_tool(self, name: str, arguments: Dict) -> Any:
+        """Call a tool without request coalescing or serialization.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Dict): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool.
+        """
 
         # Match the name of the tool
         match name:
@@ -124,10 +337,12 @@ class NewsAPIMCPServer:
                 page_size = int(arguments.get("page_size", 5))
 
                 # Call the function with extracted parameters
-                result = await get_news(topic=topic, page_size=page_size)
-                
+                result = await tools.get_news(
+                    client=self.http_client, topic=topic, page_size=page_size
+                )
+
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get headlines
             case "get-headlines":
@@ -143,21 +358,119 @@ class NewsAPIMCPServer:
                 page_size = int(arguments.get("page_size", 5))
 
                 # Call the function with extracted parameters
-                result = await get_headlines(country=country, page_size=page_size)
-                
+                result = await tools.get_headlines(
+                    client=self.http_client, country=country, page_size=page_size
+                )
+
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Default
             case _:
                 raise ValueError(f"Tool {name} not found")
 
-    # Method to run the server
-    def run(self):
-        """Run the server."""
+    # Method to serve the metrics
+    async def handle_metrics(self, request: Request) -> Response:
+        """Serve the metrics in the Prometheus text format.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The exposition text.
+        """
+
+        # Render the tool metrics with the component counters
+        text = self.metrics.render(
+            {
+                "single_flight": self.single_flight.stats(),
+                "projection_cache": self.projection_cache.stats(),
+                "rate_limiter": self.rate_limiter.stats(),
+                "retry": self.retry_policy.stats(),
+                "circuit_breaker": self.circuit_breakers.stats(),
+                "logging": log_stats(),
+            }
+        )
+
+        # Return the metrics
+        return Response(text, media_type=CONTENT_TYPE)
+
+    # Method to serve the circuit breaker states
+    async def handle_circuits(self, request: Request) -> JSONResponse:
+        """Serve the state of every circuit breaker.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            JSONResponse: The states, "degraded" while any circuit is not closed.
+        """
+
+        # Get the states
+        circuits = self.circuit_breakers.states()
+
+        # Return the states
+        return JSONResponse(
+            {
+                "status": (
+                    "ok"
+                    if all(state == "closed" for state in circuits.values())
+                    else "degraded"
+                ),
+                "circuits": circuits,
+            }
+        )
+
+    # Method to judge readiness
+    def ready_report(self) -> Tuple[bool, Dict[str, Any]]:
+        """Judge readiness from figures measured in the background.
+
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Whether the replica is ready, and the report.
+        """
+
+        # Judge readiness, the upstream is not contacted
+        return self.readiness.report(
+            in_flight=self.metrics.in_flight(),
+            pool=pool_stats(self.http_client),
+            caches={"projection_cache": self.projection_cache.stats()},
+        )
+
+    # Method to serve the readiness
+    async def handle_ready(self, request: Request) -> JSONResponse:
+        """Serve the readiness of the replica from figures measured in the background.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            JSONResponse: The readiness report, 200 when ready and 503 when not.
+        """
+
+        # Judge readiness
+        ready, report = self.ready_report()
+
+        # Return the report
+        return JSONResponse(report, status_code=200 if ready else 503)
+
+    # Method to build the app
+    def create_app(
+        self, transport: str = "sse", debug: bool = False, root_path: str = ""
+    ) -> Starlette:
+        """
+        Build the Starlette app.
+
+        Args:
+            transport (str): Serve "sse", "streamable-http" or "both"
+            debug (bool): Debug mode
+            root_path (str): Path prefix the app is mounted under, for the message endpoint sent to SSE clients
+
+        Returns:
+            Starlette: The app
+        """
 
         # Initialize the server
-        sse = SseServerTransport("/messages/")
+        sse = SseServerTransport(f"{root_path}/messages/")
 
         # Function to handle the SSE
         async def handle_sse(request: Request) -> None:
@@ -173,6 +486,57 @@ class NewsAPIMCPServer:
                     self.server.create_initialization_options(),
                 )
 
+        # Initialize the transport routes
+        transport_routes = []
+
+        # If the SSE transport is enabled
+        if transport in ("sse", "both"):
+            # SSE routes
+            transport_routes += [
+                Route("/sse", endpoint=handle_sse),
+                Mount("/messages/", app=sse.handle_post_message),
+            ]
+
+        # If the streamable HTTP transport is enabled
+        if transport in ("streamable-http", "both"):
+            # Stateless streamable HTTP route, any worker can answer any request
+            streamable_http = StreamableHTTPTransport(self.server)
+            transport_routes.append(
+                Route(
+                    "/mcp",
+                    endpoint=streamable_http.handle,
+                    methods=["GET", "POST", "DELETE"],
+                )
+            )
+
+        # Return the Starlette app
+        return Starlette(
+            debug=debug,
+            lifespan=self.lifespan,
+            routes=[
+                # Transport routes
+                *transport_routes,
+                # Tool list route, versioned with an ETag
+                Route(
+                    "/tools", endpoint=self.tool_catalog.handle_http, methods=["GET"]
+                ),
+                # Add health routes
+                *health_routes,
+                # Circuit breaker states route
+                Route(
+                    "/health/circuits", endpoint=self.handle_circuits, methods=["GET"]
+                ),
+                # Readiness route, for routing traffic away from an overloaded replica
+                Route("/ready", endpoint=self.handle_ready, methods=["GET"]),
+                # Metrics route, in the Prometheus text format
+                Route("/metrics", endpoint=self.handle_metrics, methods=["GET"]),
+            ],
+        )
+
+    # Method to run the server
+    def run(self):
+        """Run the server."""
+
         # Initialize the parser
         parser = argparse.ArgumentParser(description="Run the News API MCP Server")
 
@@ -182,25 +546,81 @@ class NewsAPIMCPServer:
         )
         parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
         parser.add_argument("--debug", type=bool, default=False, help="Debug mode")
+        parser.add_argument(
+            "--transport",
+            type=str,
+            choices=["sse", "streamable-http", "both"],
+            default="sse",
+            help="Serve SSE at /sse, stateless streamable HTTP at /mcp, or both",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes, SSE sessions stay on the worker that opened them",
+        )
 
         # Parse the arguments
         args = parser.parse_args()
 
-        # Initialize the Starlette app
-        starlette_app = Starlette(
-            debug=args.debug,
-            routes=[
-                # SSE route
-                Route("/sse", endpoint=handle_sse),
-                Mount("/messages/", app=sse.handle_post_message),
-                # Add health routes
-                *health_routes,
-            ],
-        )
+        # If several workers are requested
+        if args.workers > 1:
+            # Run the workers behind a session-affine front process
+            run_workers(
+                f"{__name__}:get_server",
+                args.workers,
+                args.host,
+                args.port,
+                args.transport,
+                args.debug,
+            )
+            return
+
+        # Route the uvicorn logs through the log thread
+        configure_uvicorn_logging()
 
         # Run the server
-        uvicorn.run(starlette_app, host=args.host, port=args.port)
+        uvicorn.run(
+            self.create_app(args.transport, args.debug),
+            host=args.host,
+            port=args.port,
+            log_config=None,
+        )
+
+
+# Get the server
+@functools.cache
+def get_server() -> NewsAPIMCPServer:
+    """Get the News API MCP Server, built on the first call and shared afterwards.
+
+    Building it creates its HTTP client, caches and metrics, so importing this module
+    stays cheap and a process that never serves builds none of them.
+
+    Returns:
+        NewsAPIMCPServer: The server.
+    """
+
+    # Build the server
+    return NewsAPIMCPServer()
+
+
+# Get the server as a module attribute
+def __getattr__(name: str) -> Any:
+    """Build the server when the server attribute is first read.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The server.
+
+    Raises:
+        AttributeError: For any other name.
+    """
 
+    # The server is built on first use
+    if name == "server":
+        return get_server()
 
-# Initialize the News API MCP Server
-server = NewsAPIMCPServer()
+    # Raise an error for any other name
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
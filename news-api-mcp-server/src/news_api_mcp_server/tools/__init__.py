@@ -1,6 +1,46 @@
-# Import tools
-from news_api_mcp_server.tools.news_tool import get_news
-from news_api_mcp_server.tools.headlines_tool import get_headlines
+# Standard library imports
+import importlib
+from typing import Any
+
+# Module of each tool, imported when the tool is first used
+TOOL_MODULES = {
+    "get_news": "news_tool",
+    "get_headlines": "headlines_tool",
+}
+
+
+# Import a tool on first use
+def __getattr__(name: str) -> Any:
+    """
+    Import a tool from its module on first use and keep it on the package.
+
+    Args:
+        name (str): The tool function name
+
+    Returns:
+        Any: The tool function
+
+    Raises:
+        AttributeError: If the name is not a tool
+    """
+
+    # If the name is not a tool
+    if name not in TOOL_MODULES:
+        # Raise an error
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import the module of the tool
+    tool = getattr(importlib.import_module(f"{__name__}.{TOOL_MODULES[name]}"), name)
+
+    # Keep the tool on the package, later lookups skip this function
+    globals()[name] = tool
+
+    # Return the tool
+    return tool
+
 
 # Export tools
-__all__ = ["get_news", "get_headlines"]
+__all__ = [
+    "get_news",
+    "get_headlines",
+]
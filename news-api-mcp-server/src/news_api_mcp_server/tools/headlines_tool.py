@@ -1,23 +1,24 @@
 # Imports
-import os
 from typing import Any, Dict, List
 
 # Third party imports
 import httpx
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Local imports
+from news_api_mcp_server.utils.settings import settings
 
 # Get API key from environment variables
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+NEWS_API_KEY = settings.get("NEWS_API_KEY")
 
 
 # Function to get the headlines
-async def get_headlines(country: str, page_size: int = 5) -> List[Dict[str, Any]]:
+async def get_headlines(
+    client: httpx.AsyncClient, country: str, page_size: int = 5
+) -> List[Dict[str, Any]]:
     """Get the latest headlines for a given country.
 
     Args:
+        client (httpx.AsyncClient): The shared HTTP client
         country (str): The country code (2 letters) to get headlines for.
         page_size (int, optional): Number of results to return. Defaults to 5.
 
@@ -47,30 +48,36 @@ async def get_headlines(country: str, page_size: int = 5) -> List[Dict[str, Any]
         raise ValueError("Page size must be between 1 and 25")
 
     try:
-        # Initialize the HTTP client
-        async with httpx.AsyncClient() as client:
-            # Make the request to the News API
-            response = await client.get(
-                "https://newsapi.org/v2/top-headlines",
-                headers={"X-Api-Key": NEWS_API_KEY},
-                params={"country": country.lower(), "pageSize": page_size, "language": "en"},
-            )
-
-            # Raise an exception if the response status code is not successful
-            response.raise_for_status()
-
-            # Return the list of headlines
-            return response.json()["articles"]
+        # Make the request to the News API
+        response = await client.get(
+            "/v2/top-headlines",
+            headers={"X-Api-Key": NEWS_API_KEY},
+            params={
+                "country": country.lower(),
+                "pageSize": page_size,
+                "language": "en",
+            },
+            # Hedge the request past the p95 latency, headlines are polled often
+            extensions={"hedge": True},
+        )
+
+        # Raise an exception if the response status code is not successful
+        response.raise_for_status()
+
+        # Return the list of headlines
+        return response.json()["articles"]
 
     # Handle the HTTPStatusError exception
     except httpx.HTTPStatusError as e:
         # Raise an error
-        raise Exception(f"Failed to get headlines: {e.response.json()['message']}")
+        raise Exception(
+            f"Failed to get headlines: {e.response.json()['message']}"
+        ) from e
 
     # Handle any other exception
     except Exception as e:
         # Raise an error
-        raise Exception(f"Failed to get headlines: {e}")
+        raise Exception(f"Failed to get headlines: {e}") from e
 
 
 # Exports
@@ -1,23 +1,24 @@
 # Imports
-import os
 from typing import Any, Dict, List
 
 # Third party imports
 import httpx
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Local imports
+from news_api_mcp_server.utils.settings import settings
 
 # Get API key from environment variables
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+NEWS_API_KEY = settings.get("NEWS_API_KEY")
 
 
 # Function to get the news
-async def get_news(topic: str, page_size: int = 5) -> List[Dict[str, Any]]:
+async def get_news(
+    client: httpx.AsyncClient, topic: str, page_size: int = 5
+) -> List[Dict[str, Any]]:
     """Get the latest news for a given topic.
 
     Args:
+        client (httpx.AsyncClient): The shared HTTP client
         topic (str): The topic to search for.
         page_size (int, optional): Number of results to return. Defaults to 5.
 
@@ -34,37 +35,35 @@ async def get_news(topic: str, page_size: int = 5) -> List[Dict[str, Any]]:
     if not topic:
         # Raise an error
         raise ValueError("Missing required argument 'topic'")
-    
+
     # If the page size is not between 1 and 25
     if page_size < 1 or page_size > 25:
         # Raise an error
         raise ValueError("Page size must be between 1 and 25")
 
     try:
-        # Initialize the HTTP client
-        async with httpx.AsyncClient() as client:
-            # Make the request to the News API
-            response = await client.get(
-                "https://newsapi.org/v2/everything",
-                headers={"X-Api-Key": NEWS_API_KEY},
-                params={"q": topic, "pageSize": page_size, "language": "en"},
-            )
+        # Make the request to the News API
+        response = await client.get(
+            "/v2/everything",
+            headers={"X-Api-Key": NEWS_API_KEY},
+            params={"q": topic, "pageSize": page_size, "language": "en"},
+        )
 
-            # Raise an exception if the response status code is not successful
-            response.raise_for_status()
+        # Raise an exception if the response status code is not successful
+        response.raise_for_status()
 
-            # Return the list of news articles
-            return response.json()["articles"]
+        # Return the list of news articles
+        return response.json()["articles"]
 
     # Handle the HTTPStatusError exception
     except httpx.HTTPStatusError as e:
         # Raise an error
-        raise Exception(f"Failed to get news: {e.response.json()['message']}")
+        raise Exception(f"Failed to get news: {e.response.json()['message']}") from e
 
     # Handle any other exception
     except Exception as e:
         # Raise an error
-        raise Exception(f"Failed to get news: {e}")
+        raise Exception(f"Failed to get news: {e}") from e
 
 
 # Exports
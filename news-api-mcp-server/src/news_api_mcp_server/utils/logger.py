@@ -1,18 +1,33 @@
 """
 Custom logger module for news-api-mcp-server.
-Provides colored logging functionality using colorama.
+Hands log records to a background thread through a bounded queue, so logging never
+blocks the event loop, and formats them as colored text or structured JSON.
 """
 
 # Standard library imports
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 # Third party imports
-from colorama import Back, Fore, Style, init
+from colorama import Back, Fore, Style, just_fix_windows_console
 
-# Initialize colorama
-init(autoreset=True)
+# Local imports
+from news_api_mcp_server.utils.settings import settings
+
+# Set constants
+NEWS_API_LOG_FORMAT = settings.get("NEWS_API_LOG_FORMAT", "text").lower()
+NEWS_API_LOG_COLOR = settings.get("NEWS_API_LOG_COLOR", "auto").lower()
+NEWS_API_LOG_QUEUE_SIZE = settings.get_int("NEWS_API_LOG_QUEUE_SIZE", 10000)
+
+# Format of text log lines
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
 # Custom formatter that adds colors to log messages based on their level
@@ -20,6 +35,9 @@ class ColoredFormatter(logging.Formatter):
     """
     Custom formatter that adds colors to log messages based on their level.
 
+    The colors are part of one format string per level, built once, so records are
+    formatted as they are rather than rewritten with color codes.
+
     Inherits:
         logging.Formatter
 
@@ -39,6 +57,28 @@ class ColoredFormatter(logging.Formatter):
         "CRITICAL": Fore.RED + Back.WHITE + Style.BRIGHT,
     }
 
+    # Constructor
+    def __init__(self, fmt: str = TEXT_FORMAT):
+        """
+        Initialize the formatter with one colored formatter per level.
+
+        Args:
+            fmt (str): The log line format
+        """
+
+        # Initialize the formatter of levels without a color
+        super().__init__(fmt)
+
+        # Build the formatter of each level, coloring the level name and message
+        self._formatters = {
+            levelname: logging.Formatter(
+                fmt.replace(
+                    "%(levelname)s", f"{color}%(levelname)s{Style.RESET_ALL}"
+                ).replace("%(message)s", f"{color}%(message)s{Style.RESET_ALL}")
+            )
+            for levelname, color in self.COLORS.items()
+        }
+
     # Format the log record with appropriate colors
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -51,25 +91,210 @@ class ColoredFormatter(logging.Formatter):
             str: The formatted log message with color codes
         """
 
-        # Get the log level name
-        levelname = record.levelname
-
-        # If the log level name is in the COLORS dictionary
-        if levelname in self.COLORS:
-            # Colorize the log level name
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
+        # Get the formatter of the level
+        formatter = self._formatters.get(record.levelname)
 
-            # Colorize the log message
-            record.msg = f"{self.COLORS[levelname]}{record.msg}{Style.RESET_ALL}"
+        # If the level has no color, format the record without one
+        if formatter is None:
+            return super().format(record)
 
         # Return the formatted log message
-        return super().format(record)
+        return formatter.format(record)
+
+
+# Formatter that writes log records as JSON lines
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter that writes each log record as one JSON object per line.
 
+    Inherits:
+        logging.Formatter
+
+    Methods:
+        format(record: logging.LogRecord) -> str: Format the log record as JSON
+    """
+
+    # Format the log record as JSON
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format the log record as JSON, without setting attributes on it.
+
+        Args:
+            record (logging.LogRecord): The log record to format
+
+        Returns:
+            str: The JSON object
+        """
 
-# Get a configured logger with colored output
+        # Build the entry
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+        }
+
+        # If the record carries an exception, add its traceback
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        # If the record carries a stack, add it
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        # Return the JSON object
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# Queue handler that never blocks
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that hands records to the log thread as they are and drops them
+    when the queue is full, so logging never blocks the caller.
+
+    Records are formatted on the log thread, so arguments of a log call must not be
+    changed after the call.
+
+    Inherits:
+        logging.handlers.QueueHandler
+
+    Attributes:
+        dropped (int): Number of records dropped because the queue was full
+
+    Methods:
+        prepare(record: logging.LogRecord) -> logging.LogRecord: Return the record unchanged
+        enqueue(record: logging.LogRecord) -> None: Queue the record or drop it
+    """
+
+    # Constructor
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue (queue.Queue): The queue read by the log thread
+        """
+
+        # Initialize the handler
+        super().__init__(log_queue)
+
+        # Initialize the counter
+        self.dropped = 0
+
+    # Return the record unchanged
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Return the record unchanged, it is formatted on the log thread.
+
+        Args:
+            record (logging.LogRecord): The log record
+
+        Returns:
+            logging.LogRecord: The same log record
+        """
+
+        # Return the record
+        return record
+
+    # Queue the record or drop it
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Queue the record, or drop it if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The log record
+        """
+
+        try:
+            # Queue the record
+            self.queue.put_nowait(record)
+
+        # Handle a full queue
+        except queue.Full:
+            # Count the dropped record
+            self.dropped += 1
+
+
+# Queue listener that stops even when the queue is full
+class _LogListener(QueueListener):
+    """Queue listener that waits for room to queue its stop signal."""
+
+    # Queue the stop signal
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop signal, waiting while the log thread drains the queue."""
+
+        # Queue the stop signal
+        self.queue.put(self._sentinel)
+
+
+# Handler shared by every logger, created on first use
+_handler: Optional[NonBlockingQueueHandler] = None
+
+
+# Build the formatter of the log lines
+def _create_formatter() -> logging.Formatter:
+    """
+    Build the formatter selected by the log format and color settings.
+
+    Returns:
+        logging.Formatter: JSON, colored or plain text formatter
+    """
+
+    # If JSON logs are requested
+    if NEWS_API_LOG_FORMAT == "json":
+        return JSONFormatter()
+
+    # Color the logs when forced, or in auto mode when stdout is a terminal
+    if NEWS_API_LOG_COLOR in ("true", "1", "yes") or (
+        NEWS_API_LOG_COLOR == "auto"
+        and "NO_COLOR" not in os.environ
+        and sys.stdout.isatty()
+    ):
+        # Enable ANSI codes on Windows consoles
+        just_fix_windows_console()
+        return ColoredFormatter()
+
+    # Return a plain text formatter
+    return logging.Formatter(TEXT_FORMAT)
+
+
+# Get the handler shared by every logger
+def _get_handler() -> NonBlockingQueueHandler:
+    """
+    Get the handler shared by every logger, starting the log thread on first use.
+
+    Returns:
+        NonBlockingQueueHandler: The queue handler
+    """
+
+    global _handler
+
+    # If the handler does not exist, create it
+    if _handler is None:
+        # Create the queue and the handler that writes to stdout on the log thread
+        log_queue = queue.Queue(NEWS_API_LOG_QUEUE_SIZE)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_create_formatter())
+
+        # Start the log thread, and stop it at exit once the queue is drained
+        listener = _LogListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Create the handler
+        _handler = NonBlockingQueueHandler(log_queue)
+
+    # Return the handler
+    return _handler
+
+
+# Get a configured logger
 def get_logger(name: str, level: Optional[int] = logging.INFO) -> logging.Logger:
     """
-    Get a configured logger with colored output.
+    Get a configured logger writing through the log thread.
 
     Args:
         name (str): The name of the logger
@@ -87,16 +312,46 @@ def get_logger(name: str, level: Optional[int] = logging.INFO) -> logging.Logger
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-
-    # Create formatter
-    formatter = ColoredFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
-
-    # Add handler to logger
-    logger.addHandler(console_handler)
+    # Add the shared queue handler to logger
+    logger.addHandler(_get_handler())
 
     # Return the logger
     return logger
+
+
+# Route the uvicorn logs through the log thread
+def configure_uvicorn_logging() -> None:
+    """
+    Route the uvicorn server and access logs through the log thread, run uvicorn with
+    log_config=None so it keeps them.
+    """
+
+    # The error and access loggers propagate to the uvicorn logger
+    get_logger("uvicorn")
+
+
+# Get the logging counters
+def log_stats() -> Dict[str, int]:
+    """
+    Get the logging counters.
+
+    Returns:
+        Dict[str, int]: The records waiting to be written and the records dropped
+    """
+
+    # Get the handler
+    handler = _get_handler()
+
+    # Return the counters
+    return {"queued": handler.queue.qsize(), "dropped": handler.dropped}
+
+
+# Exports
+__all__ = [
+    "ColoredFormatter",
+    "JSONFormatter",
+    "NonBlockingQueueHandler",
+    "configure_uvicorn_logging",
+    "get_logger",
+    "log_stats",
+]
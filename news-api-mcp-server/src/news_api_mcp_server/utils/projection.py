@@ -0,0 +1,278 @@
+"""
+Projection module for news-api-mcp-server.
+Trims tool results down to the requested fields and caches the slim results.
+"""
+
+# Standard library imports
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Local imports
+from news_api_mcp_server.utils.settings import settings
+
+# Set constants
+NEWS_API_PROJECTION_CACHE_MAX_ENTRIES = settings.get_int(
+    "NEWS_API_PROJECTION_CACHE_MAX_ENTRIES", 1024
+)
+NEWS_API_PROJECTION_CACHE_TTL = settings.get_float("NEWS_API_PROJECTION_CACHE_TTL", 0)
+
+# Input schema of the fields argument shared by every tool
+FIELDS_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": (
+        "Optional fields to return, as dotted paths such as "
+        '"title" or "source.name". Lists are projected item by item, '
+        'JSONPath prefixes like "$." and "[*]" are accepted'
+    ),
+}
+
+# A parsed projection, one tuple of keys per path
+Fields = Tuple[Tuple[str, ...], ...]
+
+
+# Parse the fields argument
+def parse_fields(fields: Union[None, str, List[str]]) -> Optional[Fields]:
+    """
+    Parse the fields argument into a normalized projection, dropping empty paths such
+    as those left by a trailing or doubled comma.
+
+    Args:
+        fields (Union[None, str, List[str]]): Dotted paths, or a comma separated string of them
+
+    Returns:
+        Optional[Fields]: The sorted, deduplicated paths, or None to return everything
+
+    Raises:
+        ValueError: If the fields are not strings
+    """
+
+    # If no projection is requested
+    if not fields:
+        return None
+
+    # Accept a comma separated string
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    # If the fields are not a list of strings
+    if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+        # Raise an error
+        raise ValueError("Fields must be a list of strings")
+
+    paths = set()
+    for field in fields:
+        # Strip the JSONPath root and wildcards, lists are always projected item by item
+        field = field.strip().removeprefix("$").replace("[*]", "").replace("[]", "")
+        keys = tuple(key for key in field.split(".") if key)
+
+        # Skip an empty path
+        if not keys:
+            continue
+
+        paths.add(keys)
+
+    # Return the paths in a stable order so equal projections share cache keys, or
+    # None if every path was empty
+    return tuple(sorted(paths)) or None
+
+
+# Build the projection tree
+def _tree(fields: Fields) -> Dict[str, Any]:
+    """
+    Build a nested dict of keys from the paths, an empty dict keeps the whole value.
+
+    Args:
+        fields (Fields): The parsed paths
+
+    Returns:
+        Dict[str, Any]: The projection tree
+    """
+
+    tree: Dict[str, Any] = {}
+
+    # Shorter paths first, so a path keeping a whole value wins over its sub-paths
+    for keys in sorted(fields, key=len):
+        node = tree
+        for key in keys[:-1]:
+            # If a shorter path already keeps the whole value
+            if key in node and not node[key]:
+                break
+
+            # Descend into the key
+            node = node.setdefault(key, {})
+
+        else:
+            # Keep the whole value at the end of the path
+            node[keys[-1]] = {}
+
+    # Return the tree
+    return tree
+
+
+# Apply the projection tree
+def _apply(data: Any, tree: Dict[str, Any]) -> Any:
+    """
+    Apply the projection tree to a value.
+
+    Args:
+        data (Any): The value to project
+        tree (Dict[str, Any]): The projection tree
+
+    Returns:
+        Any: The projected value
+    """
+
+    # Keep the whole value
+    if not tree:
+        return data
+
+    # Project lists item by item
+    if isinstance(data, list):
+        return [_apply(item, tree) for item in data]
+
+    # Keep only the requested keys of objects
+    if isinstance(data, dict):
+        return {key: _apply(data[key], sub) for key, sub in tree.items() if key in data}
+
+    # Scalars have no fields to select
+    return data
+
+
+# Project a result onto the requested fields
+def project(data: Any, fields: Optional[Fields]) -> Any:
+    """
+    Project a result onto the requested fields without modifying it.
+
+    Args:
+        data (Any): The tool result
+        fields (Optional[Fields]): The parsed paths, or None to return everything
+
+    Returns:
+        Any: The projected result
+    """
+
+    # If no projection is requested
+    if not fields:
+        return data
+
+    # Return the projected result
+    return _apply(data, _tree(fields))
+
+
+# LRU cache of serialized projections
+class ProjectionCache:
+    """
+    LRU cache of serialized projections, kept apart from the full results.
+
+    Attributes:
+        max_entries (int): Maximum number of cached projections
+        ttl (float): Time to live in seconds, 0 or less disables caching
+
+    Methods:
+        get(key: str) -> Optional[str]: Get a cached projection
+        set(key: str, text: str, ttl: Optional[float]) -> None: Cache a projection
+        stats() -> Dict[str, Any]: Get the cache counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        max_entries: int = NEWS_API_PROJECTION_CACHE_MAX_ENTRIES,
+        ttl: float = NEWS_API_PROJECTION_CACHE_TTL,
+    ):
+        """
+        Initialize the projection cache.
+
+        Args:
+            max_entries (int): Maximum number of cached projections
+            ttl (float): Time to live in seconds, 0 or less disables caching
+        """
+
+        # Set the configuration
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        # Initialize the entries, mapping keys to (expires_at, text)
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+        # Initialize the counters
+        self._hits = 0
+        self._misses = 0
+
+    # Get a cached projection
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached projection.
+
+        Args:
+            key (str): The call key, including the fields
+
+        Returns:
+            Optional[str]: The serialized projection, or None on a miss
+        """
+
+        # Get the entry
+        entry = self._entries.get(key)
+
+        # If the entry is missing or expired
+        if entry is None or entry[0] <= time.monotonic():
+            # Drop the expired entry and count the miss
+            self._entries.pop(key, None)
+            self._misses += 1
+            return None
+
+        # Mark the entry as recently used and count the hit
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        # Return the serialized projection
+        return entry[1]
+
+    # Cache a projection
+    def set(self, key: str, text: str, ttl: Optional[float] = None) -> None:
+        """
+        Cache a projection, for no longer than the result it was projected from.
+
+        Args:
+            key (str): The call key, including the fields
+            text (str): The serialized projection
+            ttl (Optional[float]): Seconds the result is cached, 0 or less if it is not. Defaults to no cap.
+        """
+
+        # Cap the time to live at the result's
+        ttl = self.ttl if ttl is None else min(self.ttl, ttl)
+
+        # If caching is disabled
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        # Store the entry as the most recently used
+        self._entries[key] = (time.monotonic() + ttl, text)
+        self._entries.move_to_end(key)
+
+        # Evict the least recently used entries
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # Get the cache counters
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: The cache counters
+        """
+
+        # Return the counters
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+# Exports
+__all__ = ["FIELDS_SCHEMA", "Fields", "ProjectionCache", "parse_fields", "project"]
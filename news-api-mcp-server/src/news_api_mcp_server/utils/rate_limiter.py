@@ -0,0 +1,544 @@
+"""
+Rate limiter module for news-api-mcp-server.
+Paces upstream requests with a token bucket per host, queueing bursts up to a bound and
+slowing down when the upstream signals that its rate limit is reached. Without a
+configured rate, requests are not paced but still wait out the pauses the upstream asks
+for.
+"""
+
+# Standard library imports
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+# Third party imports
+import httpx
+
+# Local imports
+from news_api_mcp_server.utils.metrics import mark_upstream_start
+from news_api_mcp_server.utils.settings import settings
+
+# Set constants
+NEWS_API_RATE_LIMIT = settings.get_float("NEWS_API_RATE_LIMIT", 0)
+NEWS_API_RATE_LIMIT_BURST = settings.get_int("NEWS_API_RATE_LIMIT_BURST", 10)
+NEWS_API_RATE_LIMIT_QUEUE = settings.get_int("NEWS_API_RATE_LIMIT_QUEUE", 50)
+NEWS_API_RATE_LIMIT_MAX_WAIT = settings.get_float("NEWS_API_RATE_LIMIT_MAX_WAIT", 10)
+NEWS_API_RATE_LIMIT_HOSTS = settings.get("NEWS_API_RATE_LIMIT_HOSTS", "")
+
+# Pause after a 429 without a Retry-After header, in seconds
+DEFAULT_RETRY_AFTER = 1.0
+
+# The rate is halved on every 429, down to this fraction of the configured rate
+MIN_RATE_FACTOR = 1 / 16
+
+# Fraction of the configured rate recovered on every successful response
+RECOVERY_STEP = 0.05
+
+# Headers announcing the requests left in the window and when it resets
+REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+
+
+# Raised when the limiter queue is full
+class RateLimitExceeded(Exception):
+    """Raised when a request would wait longer than the limiter allows."""
+
+
+# Parse the per-host overrides
+def parse_hosts(value: str) -> Dict[str, Tuple[float, int]]:
+    """
+    Parse per-host overrides formatted as "host=rate:burst,host=rate:burst".
+
+    Args:
+        value (str): The overrides
+
+    Returns:
+        Dict[str, Tuple[float, int]]: The rate and burst of each host
+
+    Raises:
+        ValueError: If an override is malformed
+    """
+
+    hosts = {}
+    for item in filter(None, (item.strip() for item in value.split(","))):
+        try:
+            # Split the host from its rate and burst
+            host, limits = item.split("=")
+            rate, burst = limits.split(":")
+            hosts[host.strip()] = (float(rate), int(burst))
+
+        # Handle a malformed override
+        except ValueError:
+            # Raise an error
+            raise ValueError(f"Invalid rate limit override {item!r}") from None
+
+    # Return the overrides
+    return hosts
+
+
+# Seconds until the upstream allows requests again
+def _retry_after(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[float]:
+    """
+    Read a delay from the first present header, as seconds, a Unix time or an HTTP date.
+
+    Args:
+        headers (Mapping[str, str]): The response headers
+        names (Tuple[str, ...]): The header names to try
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if no header is usable
+    """
+
+    for name in names:
+        # Skip missing headers
+        if (value := headers.get(name)) is None:
+            continue
+
+        try:
+            # Seconds, or a Unix time for large values
+            delay = float(value)
+            return max(0.0, delay - time.time() if delay > 1e9 else delay)
+
+        # Handle an HTTP date
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                continue
+
+    # No usable header
+    return None
+
+
+# Token bucket of one upstream host
+class TokenBucket:
+    """
+    Token bucket of one upstream host.
+
+    Requests take a token, or reserve the next one and wait for it in arrival order.
+    A 429 pauses the bucket and halves its rate, successful responses win the rate
+    back step by step, and rate-limit headers cap the tokens to what is left upstream.
+    At a rate of 0 or less the bucket only pauses: requests go out at once unless the
+    upstream asked to wait, with a 429 or a used-up window, and then wait out the pause.
+
+    Attributes:
+        rate (float): Configured tokens per second, 0 or less only pauses
+        burst (int): Maximum number of tokens
+        max_queue (int): Maximum number of waiting requests
+        max_wait (float): Maximum seconds a request may wait
+
+    Methods:
+        acquire() -> None: Take a token, waiting for it if needed
+        observe(status_code: int, headers: Mapping[str, str]) -> None: Adapt to a response
+        stats() -> Dict[str, float]: Get the bucket counters
+    """
+
+    # Constructor
+    def __init__(self, rate: float, burst: int, max_queue: int, max_wait: float):
+        """
+        Initialize the token bucket, full.
+
+        Args:
+            rate (float): Configured tokens per second, 0 or less only pauses
+            burst (int): Maximum number of tokens
+            max_queue (int): Maximum number of waiting requests
+            max_wait (float): Maximum seconds a request may wait
+        """
+
+        # Set the configuration
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        # Initialize the state, tokens go negative while requests are queued
+        self._rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+        # Initialize the counters
+        self._waiting = 0
+        self._rejected = 0
+        self._throttled = 0
+
+    # Add the tokens earned since the last update
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens earned since the last update, none are earned while paused.
+
+        Args:
+            now (float): The current monotonic time
+        """
+
+        # If time has moved past the last update
+        if now > self._updated:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+
+    # Pause the bucket
+    def _pause(self, now: float, delay: float) -> None:
+        """
+        Pause the bucket, dropping the tokens left.
+
+        Args:
+            now (float): The current monotonic time
+            delay (float): Seconds to pause
+        """
+
+        # Extend the pause, no tokens are earned until it ends
+        self._paused_until = max(self._paused_until, now + delay)
+        self._updated = max(self._updated, self._paused_until)
+        self._tokens = min(self._tokens, 0.0)
+
+    # Wait out a pause without pacing
+    async def _wait_pause(self) -> None:
+        """
+        Wait until the pause the upstream asked for is over, without taking a token.
+
+        Raises:
+            RateLimitExceeded: If the queue is full or the wait would be too long
+        """
+
+        # If the bucket is not paused, go at once
+        if (delay := self._paused_until - time.monotonic()) <= 0:
+            return
+
+        # If the queue is full or the wait too long
+        if self._waiting >= self.max_queue or delay > self.max_wait:
+            # Count the rejection
+            self._rejected += 1
+
+            # Raise an error
+            raise RateLimitExceeded(f"Rate limit queue is full, retry in {delay:.1f}s")
+
+        self._waiting += 1
+        try:
+            # Wait out the pause, and any pause that started while waiting
+            while (delay := self._paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+        finally:
+            self._waiting -= 1
+
+    # Take a token, waiting for it if needed
+    async def acquire(self) -> None:
+        """
+        Take a token, waiting for it if needed.
+
+        Raises:
+            RateLimitExceeded: If the queue is full or the wait would be too long
+        """
+
+        # If the bucket only pauses, wait out the pause, if any
+        if self.rate <= 0:
+            await self._wait_pause()
+            return
+
+        # Add the tokens earned since the last request
+        now = time.monotonic()
+        self._refill(now)
+
+        # If a token is free, take it
+        if self._tokens >= 1 and now >= self._paused_until:
+            self._tokens -= 1
+            return
+
+        # Reserve the next token, earned once any pause is over, later requests
+        # queue behind it
+        delay = (self._updated - now) + (1 - self._tokens) / self._rate
+
+        # If the queue is full or the wait too long
+        if self._waiting >= self.max_queue or delay > self.max_wait:
+            # Count the rejection
+            self._rejected += 1
+
+            # Raise an error
+            raise RateLimitExceeded(f"Rate limit queue is full, retry in {delay:.1f}s")
+
+        self._tokens -= 1
+        self._waiting += 1
+        try:
+            # Wait for the reserved token
+            await asyncio.sleep(delay)
+
+            # Wait out a pause that started while queued
+            while (delay := self._paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+        # Handle a cancelled wait
+        except asyncio.CancelledError:
+            # Give the reserved token back
+            self._tokens += 1
+            raise
+
+        finally:
+            self._waiting -= 1
+
+    # Adapt to a response
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the bucket to an upstream response.
+
+        Args:
+            status_code (int): The response status code
+            headers (Mapping[str, str]): The response headers
+        """
+
+        now = time.monotonic()
+
+        # If the upstream is throttling
+        if status_code == 429:
+            # Count the throttling
+            self._throttled += 1
+
+            # Pause as asked and halve the rate
+            self._refill(now)
+            self._pause(
+                now, _retry_after(headers, ("retry-after",)) or DEFAULT_RETRY_AFTER
+            )
+            self._rate = max(self.rate * MIN_RATE_FACTOR, self._rate / 2)
+            return
+
+        # Win the rate back after throttling
+        if self._rate < self.rate:
+            self._rate = min(self.rate, self._rate + self.rate * RECOVERY_STEP)
+
+        # If the upstream announces the requests left in its window
+        for name in REMAINING_HEADERS:
+            if (value := headers.get(name)) is not None:
+                try:
+                    remaining = float(value)
+                except ValueError:
+                    break
+
+                # Never hold more tokens than the upstream has left
+                self._refill(now)
+                self._tokens = min(self._tokens, remaining)
+
+                # If the window is used up, pause until it resets
+                if remaining < 1:
+                    self._pause(now, _retry_after(headers, RESET_HEADERS) or 0.0)
+                break
+
+    # Get the bucket counters
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the bucket counters.
+
+        Returns:
+            Dict[str, float]: The bucket counters
+        """
+
+        # Return the counters
+        return {
+            "rate": self._rate,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+            "throttled": self._throttled,
+        }
+
+
+# Token buckets per upstream host
+class RateLimiter:
+    """
+    Token buckets per upstream host, created on first use.
+
+    Attributes:
+        rate (float): Default tokens per second, 0 or less only honors the upstream's pauses
+        burst (int): Default maximum number of tokens
+        max_queue (int): Maximum number of waiting requests per host
+        max_wait (float): Maximum seconds a request may wait
+        hosts (Dict[str, Tuple[float, int]]): Rate and burst overrides per host
+
+    Methods:
+        acquire(host: str) -> None: Take a token for a host, waiting for it if needed
+        observe(host: str, status_code: int, headers: Mapping[str, str]) -> None: Adapt to a response
+        stats() -> Dict[str, float]: Get the counters summed over the hosts
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        rate: float = NEWS_API_RATE_LIMIT,
+        burst: int = NEWS_API_RATE_LIMIT_BURST,
+        max_queue: int = NEWS_API_RATE_LIMIT_QUEUE,
+        max_wait: float = NEWS_API_RATE_LIMIT_MAX_WAIT,
+        hosts: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate (float): Default tokens per second, 0 or less only honors the upstream's pauses
+            burst (int): Default maximum number of tokens
+            max_queue (int): Maximum number of waiting requests per host
+            max_wait (float): Maximum seconds a request may wait
+            hosts (Optional[Dict[str, Tuple[float, int]]]): Rate and burst overrides per host. Defaults to NEWS_API_RATE_LIMIT_HOSTS.
+        """
+
+        # Set the configuration
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.hosts = parse_hosts(NEWS_API_RATE_LIMIT_HOSTS) if hosts is None else hosts
+
+        # Initialize the buckets
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    # Get the bucket of a host
+    def _bucket(self, host: str) -> TokenBucket:
+        """
+        Get the bucket of a host, creating it on first use. A host without a rate gets
+        a bucket too, so it still honors 429s and rate-limit headers.
+
+        Args:
+            host (str): The upstream host
+
+        Returns:
+            TokenBucket: The bucket
+        """
+
+        # If the bucket exists
+        if host in self._buckets:
+            return self._buckets[host]
+
+        # Create the bucket with the host's limits
+        rate, burst = self.hosts.get(host, (self.rate, self.burst))
+        bucket = TokenBucket(rate, max(1, burst), self.max_queue, self.max_wait)
+        self._buckets[host] = bucket
+
+        # Return the bucket
+        return bucket
+
+    # Take a token for a host
+    async def acquire(self, host: str) -> None:
+        """
+        Take a token for a host, waiting for it if needed.
+
+        Args:
+            host (str): The upstream host
+
+        Raises:
+            RateLimitExceeded: If the host's queue is full or the wait would be too long
+        """
+
+        try:
+            # Take a token, or wait out a pause
+            await self._bucket(host).acquire()
+
+        # Name the host in the error
+        except RateLimitExceeded as e:
+            raise RateLimitExceeded(f"{host}: {e}") from None
+
+    # Adapt to a response
+    def observe(self, host: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the host's bucket to an upstream response.
+
+        Args:
+            host (str): The upstream host
+            status_code (int): The response status code
+            headers (Mapping[str, str]): The response headers
+        """
+
+        # Adapt the host's bucket, paced or not
+        self._bucket(host).observe(status_code, headers)
+
+    # Get the counters summed over the hosts
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the counters summed over the hosts.
+
+        Returns:
+            Dict[str, float]: The counters
+        """
+
+        buckets = list(self._buckets.values())
+
+        # Return the counters
+        return {
+            "hosts": len(buckets),
+            "waiting": sum(bucket._waiting for bucket in buckets),
+            "rejected": sum(bucket._rejected for bucket in buckets),
+            "throttled": sum(bucket._throttled for bucket in buckets),
+        }
+
+
+# HTTP transport that paces requests through the rate limiter
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that paces requests through the rate limiter.
+
+    Attributes:
+        transport (httpx.AsyncBaseTransport): The transport that sends the requests
+        limiter (RateLimiter): The rate limiter
+
+    Methods:
+        handle_async_request(request: httpx.Request) -> httpx.Response: Send a request once a token is free
+        aclose() -> None: Close the wrapped transport
+    """
+
+    # Constructor
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        """
+        Initialize the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that sends the requests
+            limiter (RateLimiter): The rate limiter
+        """
+
+        # Set the transport and limiter
+        self.transport = transport
+        self.limiter = limiter
+
+    # Send a request once a token is free
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request once a token is free and adapt the limiter to the response.
+
+        Args:
+            request (httpx.Request): The request
+
+        Returns:
+            httpx.Response: The response
+
+        Raises:
+            RateLimitExceeded: If the host's queue is full
+        """
+
+        # Wait for a token, the upstream timing starts once it is taken
+        host = request.url.host
+        await self.limiter.acquire(host)
+        mark_upstream_start(request)
+
+        # Send the request
+        response = await self.transport.handle_async_request(request)
+
+        # Adapt the limiter to the response
+        self.limiter.observe(host, response.status_code, response.headers)
+
+        # Return the response
+        return response
+
+    # Close the wrapped transport
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+
+        # Close the transport
+        await self.transport.aclose()
+
+
+# Exports
+__all__ = [
+    "RateLimitExceeded",
+    "RateLimitedTransport",
+    "RateLimiter",
+    "TokenBucket",
+    "parse_hosts",
+]
@@ -0,0 +1,377 @@
+"""
+Readiness module for news-api-mcp-server.
+Measures event loop lag with a background ticker and probes the upstream in the
+background, so a readiness check reads cached figures and never waits on the upstream.
+"""
+
+# Standard library imports
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Third party imports
+import httpx
+
+# Local imports
+from news_api_mcp_server.utils.http_client import NEWS_API_BASE_URL
+from news_api_mcp_server.utils.logger import get_logger
+from news_api_mcp_server.utils.settings import settings
+
+# Set constants
+NEWS_API_READY_TICK = settings.get_float("NEWS_API_READY_TICK", 0.25)
+NEWS_API_READY_WINDOW = settings.get_int("NEWS_API_READY_WINDOW", 20)
+NEWS_API_READY_MAX_LOOP_LAG = settings.get_float("NEWS_API_READY_MAX_LOOP_LAG", 0.5)
+NEWS_API_READY_MAX_POOL_UTILIZATION = settings.get_float(
+    "NEWS_API_READY_MAX_POOL_UTILIZATION", 0.9
+)
+NEWS_API_PROBE_URL = settings.get("NEWS_API_PROBE_URL", NEWS_API_BASE_URL)
+NEWS_API_PROBE_INTERVAL = settings.get_float("NEWS_API_PROBE_INTERVAL", 30)
+NEWS_API_PROBE_TIMEOUT = settings.get_float("NEWS_API_PROBE_TIMEOUT", 5)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+# Cache hit ratio of a cache
+def hit_ratio(stats: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the hit ratio from the counters of a cache.
+
+    Args:
+        stats (Dict[str, Any]): The cache counters, with "hits" and "misses"
+
+    Returns:
+        Optional[float]: The fraction of lookups that hit, or None before the first lookup
+    """
+
+    lookups = stats["hits"] + stats["misses"]
+
+    # Return the ratio
+    return round(stats["hits"] / lookups, 4) if lookups else None
+
+
+# Event loop lag measured by a background ticker
+class LoopLagMonitor:
+    """
+    Event loop lag measured by a background ticker. The ticker sleeps for a tick and
+    records how late it woke up, which is how long ready callbacks waited for the loop.
+
+    Attributes:
+        tick (float): Seconds between ticks
+        window (int): Number of recent ticks the maximum lag is taken over
+
+    Methods:
+        start() -> None: Start the ticker
+        stop() -> None: Stop the ticker
+        stats() -> Dict[str, float]: Get the last and maximum recent lag
+    """
+
+    # Constructor
+    def __init__(
+        self, tick: float = NEWS_API_READY_TICK, window: int = NEWS_API_READY_WINDOW
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            tick (float): Seconds between ticks
+            window (int): Number of recent ticks the maximum lag is taken over
+        """
+
+        # Set the configuration
+        self.tick = tick
+        self.window = max(1, window)
+
+        # Initialize the recent lags and the ticker
+        self._lags: Deque[float] = deque(maxlen=self.window)
+        self._task: Optional[asyncio.Task] = None
+
+    # Start the ticker
+    def start(self) -> None:
+        """Start the ticker on the running event loop."""
+
+        # If the ticker is not running, start it
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    # Stop the ticker
+    async def stop(self) -> None:
+        """Stop the ticker."""
+
+        # If the ticker is running, cancel it and wait for it to end
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # Run the ticker
+    async def _run(self) -> None:
+        """Sleep for a tick at a time and record how late each wake-up was."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            # Sleep for a tick
+            expected = loop.time() + self.tick
+            await asyncio.sleep(self.tick)
+
+            # Record the lag
+            self._lags.append(max(0.0, loop.time() - expected))
+
+    # Get the last and maximum recent lag
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the lag of the last tick and the maximum over the recent ticks.
+
+        Returns:
+            Dict[str, float]: The lags in seconds
+        """
+
+        # Return the lags
+        return {
+            "lag": round(self._lags[-1], 4) if self._lags else 0.0,
+            "max_lag": round(max(self._lags), 4) if self._lags else 0.0,
+        }
+
+
+# Upstream reachability probed in the background
+class UpstreamProbe:
+    """
+    Upstream reachability probed in the background with a request of its own, so the
+    probe takes no rate limiter tokens, trips no circuit and spends no API quota.
+
+    Attributes:
+        url (str): The URL probed with a HEAD request
+        interval (float): Seconds between probes, 0 disables probing
+        timeout (float): Probe timeout in seconds
+
+    Methods:
+        start() -> None: Start probing
+        stop() -> None: Stop probing
+        probe() -> Dict[str, Any]: Probe the upstream once
+        result() -> Optional[Dict[str, Any]]: Get the last probe result
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        url: str = NEWS_API_PROBE_URL,
+        interval: float = NEWS_API_PROBE_INTERVAL,
+        timeout: float = NEWS_API_PROBE_TIMEOUT,
+    ):
+        """
+        Initialize the probe.
+
+        Args:
+            url (str): The URL probed with a HEAD request
+            interval (float): Seconds between probes, 0 disables probing
+            timeout (float): Probe timeout in seconds
+        """
+
+        # Set the configuration
+        self.url = url
+        self.interval = interval
+        self.timeout = timeout
+
+        # Initialize the last result and the prober
+        self._result: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # Start probing
+    def start(self) -> None:
+        """Start probing on the running event loop, unless probing is disabled."""
+
+        # If probing is enabled and not running, start it
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    # Stop probing
+    async def stop(self) -> None:
+        """Stop probing."""
+
+        # If probing is running, cancel it and wait for it to end
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # Probe the upstream on an interval
+    async def _run(self) -> None:
+        """Probe the upstream, then wait for the interval."""
+
+        while True:
+            # Probe the upstream
+            await self.probe()
+
+            # Wait for the next probe
+            await asyncio.sleep(self.interval)
+
+    # Probe the upstream once
+    async def probe(self) -> Dict[str, Any]:
+        """
+        Probe the upstream once. Any answer below 500 counts as reachable, the probe
+        carries no API key, so 401 and 404 are expected.
+
+        Returns:
+            Dict[str, Any]: The probe result
+        """
+
+        start = time.perf_counter()
+        try:
+            # Send the probe on a fresh connection, so it also covers DNS and TLS
+            async with httpx.AsyncClient(timeout=httpx.Timeout(self.timeout)) as client:
+                response = await client.head(self.url)
+            result = {
+                "ok": response.status_code < 500,
+                "status_code": response.status_code,
+                "error": None,
+            }
+
+        # Handle an unreachable upstream
+        except httpx.HTTPError as error:
+            result = {
+                "ok": False,
+                "status_code": None,
+                "error": str(error) or type(error).__name__,
+            }
+
+        # If the upstream became unreachable, log it
+        if not result["ok"] and (self._result is None or self._result["ok"]):
+            logger.warning(f"Upstream probe of {self.url} failed: {result}")
+
+        # Keep the result
+        result["latency"] = round(time.perf_counter() - start, 4)
+        result["checked_at"] = time.time()
+        self._result = result
+
+        # Return the result
+        return result
+
+    # Get the last probe result
+    def result(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the last probe result with its age.
+
+        Returns:
+            Optional[Dict[str, Any]]: The result, or None before the first probe
+        """
+
+        # If no probe finished yet, return None
+        if self._result is None:
+            return None
+
+        # Return the result with its age
+        return {
+            **self._result,
+            "age": round(time.time() - self._result["checked_at"], 1),
+        }
+
+
+# Readiness of the replica
+class Readiness:
+    """
+    Readiness of the replica, judged on what this replica can change: a replica whose
+    event loop lags or whose connection pool is saturated is not ready. The upstream
+    probe is reported but does not decide readiness, an upstream outage affects every
+    replica alike.
+
+    Attributes:
+        loop_lag (LoopLagMonitor): The event loop lag monitor
+        probe (UpstreamProbe): The upstream probe
+        max_loop_lag (float): Maximum recent loop lag in seconds of a ready replica
+        max_pool_utilization (float): Maximum pool utilization of a ready replica
+
+    Methods:
+        start() -> None: Start the ticker and the probe
+        stop() -> None: Stop the ticker and the probe
+        report(in_flight: int, pool: Dict[str, Any], caches: Dict[str, Dict[str, Any]]) -> Tuple[bool, Dict[str, Any]]: Judge readiness
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        loop_lag: Optional[LoopLagMonitor] = None,
+        probe: Optional[UpstreamProbe] = None,
+        max_loop_lag: float = NEWS_API_READY_MAX_LOOP_LAG,
+        max_pool_utilization: float = NEWS_API_READY_MAX_POOL_UTILIZATION,
+    ):
+        """
+        Initialize the readiness.
+
+        Args:
+            loop_lag (Optional[LoopLagMonitor]): The event loop lag monitor. Defaults to None.
+            probe (Optional[UpstreamProbe]): The upstream probe. Defaults to None.
+            max_loop_lag (float): Maximum recent loop lag in seconds of a ready replica
+            max_pool_utilization (float): Maximum pool utilization of a ready replica
+        """
+
+        # Set the monitors
+        self.loop_lag = loop_lag or LoopLagMonitor()
+        self.probe = probe or UpstreamProbe()
+
+        # Set the thresholds
+        self.max_loop_lag = max_loop_lag
+        self.max_pool_utilization = max_pool_utilization
+
+    # Start the ticker and the probe
+    def start(self) -> None:
+        """Start the ticker and the probe on the running event loop."""
+
+        # Start the monitors
+        self.loop_lag.start()
+        self.probe.start()
+
+    # Stop the ticker and the probe
+    async def stop(self) -> None:
+        """Stop the ticker and the probe."""
+
+        # Stop the monitors
+        await self.loop_lag.stop()
+        await self.probe.stop()
+
+    # Judge readiness
+    def report(
+        self,
+        in_flight: int,
+        pool: Dict[str, Any],
+        caches: Dict[str, Dict[str, Any]],
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Judge readiness and build the report.
+
+        Args:
+            in_flight (int): Tool calls in progress
+            pool (Dict[str, Any]): The upstream pool figures, with "utilization" and "queued"
+            caches (Dict[str, Dict[str, Any]]): The counters of each cache, with "hits" and "misses"
+
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Whether the replica is ready, and the report
+        """
+
+        loop = self.loop_lag.stats()
+        reasons: List[str] = []
+
+        # If the event loop lags, callbacks wait too long to run
+        if loop["max_lag"] > self.max_loop_lag:
+            reasons.append("event loop lag")
+
+        # If the pool is nearly full or requests wait for it, new calls would queue
+        if pool["utilization"] >= self.max_pool_utilization or pool["queued"]:
+            reasons.append("upstream pool saturated")
+
+        # Return the verdict and the report
+        return not reasons, {
+            "status": "not_ready" if reasons else "ready",
+            "reasons": reasons,
+            "event_loop": loop,
+            "in_flight": in_flight,
+            "pool": pool,
+            "cache_hit_ratio": {
+                name: hit_ratio(stats) for name, stats in caches.items()
+            },
+            "upstream": self.probe.result(),
+        }
+
+
+# Exports
+__all__ = ["LoopLagMonitor", "Readiness", "UpstreamProbe", "hit_ratio"]
@@ -0,0 +1,217 @@
+"""
+Streamable HTTP module for news-api-mcp-server.
+Serves the MCP streamable HTTP transport in stateless mode: every POST carries complete
+JSON-RPC messages and gets a plain JSON reply, so no session is pinned to a process.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Dict, Optional, get_args
+
+# Third party imports
+import mcp.types as types
+from mcp.server import Server
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+# Local imports
+from news_api_mcp_server.utils.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Protocol versions spoken over this transport, only the one the installed mcp implements
+PROTOCOL_VERSIONS = (types.LATEST_PROTOCOL_VERSION,)
+
+
+# Build a JSON-RPC error message
+def _error(message_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """
+    Build a JSON-RPC error message.
+
+    Args:
+        message_id (Any): The id of the failed request
+        code (int): The JSON-RPC error code
+        message (str): The error message
+
+    Returns:
+        Dict[str, Any]: The error message
+    """
+
+    # Return the error
+    return {
+        "jsonrpc": "2.0",
+        "id": message_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+# Stateless streamable HTTP transport
+class StreamableHTTPTransport:
+    """
+    Stateless streamable HTTP transport for an MCP server.
+
+    Attributes:
+        server (Server): The MCP server whose request handlers are served
+
+    Methods:
+        handle(request: Request) -> Response: Handle a request to the MCP endpoint
+    """
+
+    # Constructor
+    def __init__(self, server: Server):
+        """
+        Initialize the transport.
+
+        Args:
+            server (Server): The MCP server whose request handlers are served
+        """
+
+        # Set the server
+        self.server = server
+
+        # Build the initialization options once, after the handlers are registered
+        self._init_options = server.create_initialization_options()
+
+        # Map the served method names to their request types
+        self._request_types = {
+            get_args(request_type.model_fields["method"].annotation)[0]: request_type
+            for request_type in server.request_handlers
+        }
+
+    # Handle a request to the MCP endpoint
+    async def handle(self, request: Request) -> Response:
+        """
+        Handle a request to the MCP endpoint.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The JSON-RPC replies, 202 for notifications only, or an HTTP error
+        """
+
+        # Stateless mode has no server-initiated stream and no session to delete
+        if request.method != "POST":
+            return Response(status_code=405, headers={"Allow": "POST"})
+
+        # If the body is not JSON
+        if "application/json" not in request.headers.get("content-type", ""):
+            return Response("Content-Type must be application/json", status_code=415)
+
+        try:
+            # Parse the body
+            body = json.loads(await request.body())
+
+        # Handle invalid JSON
+        except ValueError:
+            return JSONResponse(_error(None, types.PARSE_ERROR, "Parse error"), 400)
+
+        # Handle every message, a batch is a list of messages
+        messages = body if isinstance(body, list) else [body]
+        replies = [
+            reply
+            for message in messages
+            if (reply := await self._handle_message(message)) is not None
+        ]
+
+        # If there were only notifications and responses
+        if not replies:
+            return Response(status_code=202)
+
+        # Return the replies in the shape they were sent
+        return JSONResponse(replies if isinstance(body, list) else replies[0])
+
+    # Handle one JSON-RPC message
+    async def _handle_message(self, message: Any) -> Optional[Dict[str, Any]]:
+        """
+        Handle one JSON-RPC message.
+
+        Args:
+            message (Any): The decoded message
+
+        Returns:
+            Optional[Dict[str, Any]]: The reply, or None for notifications and responses
+        """
+
+        # If the message is not a JSON-RPC object
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+            return _error(None, types.INVALID_REQUEST, "Invalid request")
+
+        # Notifications and client responses need no reply without a session
+        if "method" not in message or "id" not in message:
+            return None
+
+        message_id = message["id"]
+
+        try:
+            # If the client is initializing
+            if message["method"] == "initialize":
+                result = self._initialize(message.get("params") or {})
+
+            else:
+                # Get the request type
+                request_type = self._request_types.get(message["method"])
+
+                # If the method is not served
+                if request_type is None:
+                    return _error(
+                        message_id, types.METHOD_NOT_FOUND, "Method not found"
+                    )
+
+                # Validate the request
+                request = request_type.model_validate(
+                    {k: v for k, v in message.items() if k in ("method", "params")}
+                )
+
+                # Run the handler
+                result = (
+                    await self.server.request_handlers[request_type](request)
+                ).model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        # Handle invalid parameters
+        except ValidationError as e:
+            return _error(message_id, types.INVALID_PARAMS, str(e))
+
+        # Handle any other exception
+        except Exception as e:
+            # Log the error
+            logger.exception(f"Error handling {message['method']}")
+
+            return _error(message_id, types.INTERNAL_ERROR, str(e))
+
+        # Return the result
+        return {"jsonrpc": "2.0", "id": message_id, "result": result}
+
+    # Answer the initialize request
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer the initialize request.
+
+        Args:
+            params (Dict[str, Any]): The initialize parameters
+
+        Returns:
+            Dict[str, Any]: The initialize result
+        """
+
+        # Agree on the client's protocol version if it is spoken, else offer ours
+        version = params.get("protocolVersion")
+        if version not in PROTOCOL_VERSIONS:
+            version = PROTOCOL_VERSIONS[0]
+
+        # Return the result
+        return types.InitializeResult(
+            protocolVersion=version,
+            capabilities=self._init_options.capabilities,
+            serverInfo=types.Implementation(
+                name=self._init_options.server_name,
+                version=self._init_options.server_version,
+            ),
+            instructions=self._init_options.instructions,
+        ).model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+# Exports
+__all__ = ["StreamableHTTPTransport"]
@@ -0,0 +1,162 @@
+"""
+Tests for the streamable HTTP endpoint of news-api-mcp-server.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Dict
+
+# Third party imports
+import httpx
+import pytest
+
+# Local imports
+from news_api_mcp_server.server import NewsAPIMCPServer
+from news_api_mcp_server.tools import headlines_tool, news_tool
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# Article the fake News API answers with
+ARTICLE = {"title": "Rates hold", "url": "https://news.test/rates"}
+
+
+# Client of the server's streamable HTTP endpoint
+@pytest.fixture
+async def client(monkeypatch):
+    """
+    Serve the server over streamable HTTP in front of a fake News API.
+
+    Args:
+        monkeypatch: Sets the API key the tools send
+
+    Yields:
+        httpx.AsyncClient: A client of the app, with the upstream requests in its "upstream" attribute
+    """
+
+    # Set the API key the tools send
+    monkeypatch.setattr(news_tool, "NEWS_API_KEY", "key")
+    monkeypatch.setattr(headlines_tool, "NEWS_API_KEY", "key")
+
+    # Function to answer as the News API, unreachable for the topic "down"
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.params.get("q") == "down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"status": "ok", "articles": [ARTICLE]})
+
+    # Point the server at the fake News API
+    requests = []
+    server = NewsAPIMCPServer()
+    server.http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(upstream), base_url="https://newsapi.test"
+    )
+
+    # Yield the client
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(server.create_app("streamable-http")),
+        base_url="http://test",
+    ) as client:
+        client.upstream = requests
+        yield client
+
+
+# Call a tool over the endpoint
+async def call(
+    client: httpx.AsyncClient, name: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Call a tool with a tools/call POST.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app
+        name (str): The tool name
+        arguments (Dict[str, Any]): The tool arguments
+
+    Returns:
+        Dict[str, Any]: The tool result
+    """
+
+    # Send the request
+    response = await client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        },
+    )
+
+    # Return the result
+    return response.json()["result"]
+
+
+async def test_tools_are_listed(client):
+    """The News API tools are listed over the endpoint."""
+
+    response = await client.post(
+        "/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    )
+
+    tools = [tool["name"] for tool in response.json()["result"]["tools"]]
+    assert tools == ["get-news", "get-headlines"]
+
+
+async def test_get_news(client):
+    """The news are searched for the topic and returned as JSON text."""
+
+    result = await call(client, "get-news", {"topic": "rates", "page_size": 3})
+
+    assert result["isError"] is False
+    assert json.loads(result["content"][0]["text"]) == [ARTICLE]
+    request = client.upstream[0]
+    assert request.url.path == "/v2/everything"
+    assert request.url.params["q"] == "rates"
+    assert request.url.params["pageSize"] == "3"
+    assert request.headers["x-api-key"] == "key"
+
+
+async def test_get_headlines(client):
+    """The headlines are fetched for the country."""
+
+    result = await call(client, "get-headlines", {"country": "us", "page_size": 1})
+
+    assert json.loads(result["content"][0]["text"]) == [ARTICLE]
+    assert client.upstream[0].url.path == "/v2/top-headlines"
+    assert client.upstream[0].url.params["country"] == "us"
+
+
+async def test_tool_errors_are_results(client):
+    """An invalid call is answered with an error result, not a JSON-RPC error."""
+
+    result = await call(client, "get-news", {"topic": ""})
+
+    assert result["isError"] is True
+    assert "Topic is required" in result["content"][0]["text"]
+    assert client.upstream == []
+
+
+async def test_projections_are_not_cached_by_default(client):
+    """A projection is fetched fresh every time, as the full result is."""
+
+    arguments = {"topic": "rates", "fields": ["title"]}
+
+    # Call the tool twice with the same projection
+    first = await call(client, "get-news", arguments)
+    second = await call(client, "get-news", arguments)
+
+    assert json.loads(first["content"][0]["text"]) == [{"title": "Rates hold"}]
+    assert second["content"] == first["content"]
+    assert len(client.upstream) == 2
+
+
+async def test_failures_are_counted_by_upstream_error(client):
+    """A failed call is counted under the upstream error, not the wrapping Exception."""
+
+    result = await call(client, "get-news", {"topic": "down"})
+    assert result["isError"] is True
+
+    lines = (await client.get("/metrics")).text.splitlines()
+    assert 'mcp_tool_errors_total{tool="get-news",type="ConnectError"} 1' in lines
+    assert 'mcp_tool_duration_seconds_count{tool="get-news"} 1' in lines
@@ -0,0 +1,105 @@
+"""
+Passthrough benchmark for open-weather-mcp-server.
+Compares the CPU time and memory allocated per call when a forecast-sized upstream
+body is parsed and re-encoded against passing the decoded body straight through.
+
+Usage:
+    python benchmarks/passthrough_benchmark.py --hours 96 --number 500
+"""
+
+# Standard library imports
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+# Third party imports
+import httpx
+
+# Local imports
+from open_weather_mcp_server.utils.serializer import RawJSON, Serializer
+from serializer_benchmark import make_air_pollution
+
+
+# Measure the peak memory allocated by one call
+def peak_allocated(call: Callable[[], Any]) -> int:
+    """
+    Measure the peak memory allocated by one call.
+
+    Args:
+        call (Callable[[], Any]): The call to measure
+
+    Returns:
+        int: Peak allocated bytes
+    """
+
+    # Warm up the call so one-off allocations are not counted
+    call()
+
+    # Trace the call
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Return the peak
+    return peak
+
+
+# Main benchmark
+def main(hours: int, number: int) -> None:
+    """
+    Benchmark the parse and re-encode path against the passthrough path.
+
+    Args:
+        hours (int): Number of hourly entries in the payload
+        number (int): Number of calls per run
+    """
+
+    # Encode the upstream body once, as OpenWeather sends it
+    body = json.dumps(make_air_pollution(hours), separators=(",", ":")).encode()
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    # Build the serializer
+    fast = Serializer()
+
+    # Each path starts from a fresh response, like a tool call does
+    paths = {
+        "response.json + json.dumps (before)": lambda: json.dumps(
+            httpx.Response(200, content=body, headers=headers).json()
+        ),
+        f"loads + dumps ({fast.backend})": lambda: fast.dumps(
+            fast.loads(httpx.Response(200, content=body, headers=headers).content)
+        ),
+        "passthrough (after)": lambda: fast.dumps(
+            RawJSON(httpx.Response(200, content=body, headers=headers).content.decode())
+        ),
+    }
+
+    # Report the results
+    print(f"payload={len(body)} bytes hours={hours} number={number}")
+    baseline = None
+    for name, call in paths.items():
+        # Time the path, taking the best of a few runs
+        best = min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+        baseline = baseline or best
+
+        # Measure the allocations
+        peak = peak_allocated(call)
+        print(
+            f"  {name:<38} {best:9.1f} us {baseline / best:6.2f}x"
+            f" {peak / 1024:9.1f} KiB peak"
+        )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the passthrough path")
+    parser.add_argument("--hours", type=int, default=96, help="Hourly entries")
+    parser.add_argument("--number", type=int, default=500, help="Calls per run")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(args.hours, args.number)
@@ -0,0 +1,205 @@
+"""
+Serializer benchmark for open-weather-mcp-server.
+Compares the encode time and output size of each installed JSON backend against
+the previous json.dumps call, over payloads shaped like OpenWeather responses.
+
+Usage:
+    python benchmarks/serializer_benchmark.py --number 2000
+    python benchmarks/serializer_benchmark.py --payload recorded_forecast.json
+    python benchmarks/serializer_benchmark.py --corpus fixtures/open-weather-mcp-server.jsonl.gz
+"""
+
+# Standard library imports
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+# Local imports
+from open_weather_mcp_server.utils.fixtures import FixtureCorpus
+from open_weather_mcp_server.utils.serializer import BACKENDS, Serializer
+
+
+# Build a forecast air pollution response
+def make_air_pollution(hours: int) -> Dict[str, Any]:
+    """
+    Build a response shaped like the OpenWeather air pollution forecast.
+
+    Args:
+        hours (int): Number of hourly entries
+
+    Returns:
+        Dict[str, Any]: The response
+    """
+
+    # Return the response
+    return {
+        "coord": {"lon": 72.8777, "lat": 19.076},
+        "list": [
+            {
+                "main": {"aqi": 1 + i % 5},
+                "components": {
+                    "co": 201.94 + i,
+                    "no": 0.01,
+                    "no2": 0.77 + i / 100,
+                    "o3": 68.66,
+                    "so2": 0.64,
+                    "pm2_5": 0.5 + i / 10,
+                    "pm10": 0.54 + i / 10,
+                    "nh3": 0.12,
+                },
+                "dt": 1735689600 + i * 3600,
+            }
+            for i in range(hours)
+        ],
+    }
+
+
+# Build an hourly forecast response
+def make_hourly_forecast(count: int) -> Dict[str, Any]:
+    """
+    Build a response shaped like the OpenWeather 3-hourly forecast.
+
+    Args:
+        count (int): Number of forecast entries
+
+    Returns:
+        Dict[str, Any]: The response
+    """
+
+    # Return the response
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": count,
+        "list": [
+            {
+                "dt": 1735689600 + i * 10800,
+                "main": {
+                    "temp": 296.76 + i / 10,
+                    "feels_like": 296.98,
+                    "temp_min": 296.76,
+                    "temp_max": 297.87,
+                    "pressure": 1015,
+                    "sea_level": 1015,
+                    "grnd_level": 933,
+                    "humidity": 69,
+                    "temp_kf": -1.11,
+                },
+                "weather": [
+                    {
+                        "id": 500,
+                        "main": "Rain",
+                        "description": "light rain",
+                        "icon": "10d",
+                    }
+                ],
+                "clouds": {"all": 100},
+                "wind": {"speed": 0.62, "deg": 349, "gust": 1.18},
+                "visibility": 10000,
+                "pop": 0.32,
+                "rain": {"3h": 0.26},
+                "sys": {"pod": "d"},
+                "dt_txt": "2025-01-01 00:00:00",
+            }
+            for i in range(count)
+        ],
+        "city": {
+            "id": 1275339,
+            "name": "Mumbai",
+            "coord": {"lat": 19.076, "lon": 72.8777},
+            "country": "IN",
+            "population": 12691836,
+            "timezone": 19800,
+            "sunrise": 1735694400,
+            "sunset": 1735734000,
+        },
+    }
+
+
+# Time one encode function
+def time_encode(encode: Callable[[Any], str], payload: Any, number: int) -> float:
+    """
+    Time one encode function.
+
+    Args:
+        encode (Callable[[Any], str]): The encode function
+        payload (Any): The payload to encode
+        number (int): Number of encodes per run
+
+    Returns:
+        float: Best time per encode in microseconds
+    """
+
+    # Take the best of a few runs to reduce noise
+    best = min(timeit.repeat(lambda: encode(payload), number=number, repeat=5))
+
+    # Return microseconds per encode
+    return best / number * 1e6
+
+
+# Main benchmark
+def main(payloads: Dict[str, Any], number: int) -> None:
+    """
+    Benchmark every installed backend over every payload.
+
+    Args:
+        payloads (Dict[str, Any]): The payloads by name
+        number (int): Number of encodes per run
+    """
+
+    for name, payload in payloads.items():
+        # Time the previous encode path as the baseline
+        baseline = time_encode(json.dumps, payload, number)
+        size = len(json.dumps(payload).encode())
+        print(f"\n{name}")
+        print(
+            f"  {'json.dumps (before)':<20} {baseline:9.1f} us {1:6.2f}x {size:9d} bytes"
+        )
+
+        for backend in BACKENDS:
+            try:
+                # Build the serializer
+                serializer = Serializer(backend=backend, compact=True)
+
+            except ImportError:
+                # Skip the backends that are not installed
+                print(f"  {backend:<20} not installed")
+                continue
+
+            # Time the serializer
+            elapsed = time_encode(serializer.dumps, payload, number)
+            size = len(serializer.dumps(payload).encode())
+            print(
+                f"  {backend:<20} {elapsed:9.1f} us {baseline / elapsed:6.2f}x"
+                f" {size:9d} bytes"
+            )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends")
+    parser.add_argument("--number", type=int, default=2000, help="Encodes per run")
+    parser.add_argument("--payload", type=str, help="Recorded JSON payload to use")
+    parser.add_argument("--corpus", type=str, help="Recorded fixtures to use")
+    args = parser.parse_args()
+
+    # Use the recorded payload, the recorded fixtures, or the representative ones
+    if args.payload:
+        with open(args.payload, "rb") as file:
+            payloads = {args.payload: json.load(file)}
+    elif args.corpus:
+        payloads = {
+            fixture["key"]: json.loads(fixture["body"])
+            for fixture in FixtureCorpus(args.corpus).fixtures()
+            if fixture["status_code"] == 200
+        }
+    else:
+        payloads = {
+            "get-forecast-air-pollution": make_air_pollution(96),
+            "get-hourly-forecast (cnt=40)": make_hourly_forecast(40),
+        }
+
+    # Run the benchmark
+    main(payloads, args.number)
@@ -1,11 +1,30 @@
 # Imports
-from open_weather_mcp_server.server import server
+from typing import Any
+
+
+# Get the server on first use
+def __getattr__(name: str) -> Any:
+    # The server is built on first use, so importing the package stays cheap
+    if name == "server":
+        from open_weather_mcp_server.server import get_server
+
+        server = get_server()
+
+        # Bind it over the server submodule, which the import just bound
+        globals()["server"] = server
+        return server
+
+    # Raise an error for any other name
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Main function
 def main():
-    # Run the server
-    server.run()
+    # Import the server factory
+    from open_weather_mcp_server.server import get_server
+
+    # Build and run the server
+    get_server().run()
 
 
 # Export main function and server
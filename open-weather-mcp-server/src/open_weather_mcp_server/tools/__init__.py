@@ -1,13 +1,46 @@
-# Import tools
-from open_weather_mcp_server.tools.current_air_pollution_tool import (
-    get_current_air_pollution,
-)
-from open_weather_mcp_server.tools.current_weather_tool import get_current_weather
-from open_weather_mcp_server.tools.daily_forecast_tool import get_daily_forecast
-from open_weather_mcp_server.tools.forecast_air_pollution_tool import (
-    get_forecast_air_pollution,
-)
-from open_weather_mcp_server.tools.hourly_forecast_tool import get_hourly_forecast
+# Standard library imports
+import importlib
+from typing import Any
+
+# Module of each tool, imported when the tool is first used
+TOOL_MODULES = {
+    "get_current_weather": "current_weather_tool",
+    "get_hourly_forecast": "hourly_forecast_tool",
+    "get_daily_forecast": "daily_forecast_tool",
+    "get_current_air_pollution": "current_air_pollution_tool",
+    "get_forecast_air_pollution": "forecast_air_pollution_tool",
+}
+
+
+# Import a tool on first use
+def __getattr__(name: str) -> Any:
+    """
+    Import a tool from its module on first use and keep it on the package.
+
+    Args:
+        name (str): The tool function name
+
+    Returns:
+        Any: The tool function
+
+    Raises:
+        AttributeError: If the name is not a tool
+    """
+
+    # If the name is not a tool
+    if name not in TOOL_MODULES:
+        # Raise an error
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import the module of the tool
+    tool = getattr(importlib.import_module(f"{__name__}.{TOOL_MODULES[name]}"), name)
+
+    # Keep the tool on the package, later lookups skip this function
+    globals()[name] = tool
+
+    # Return the tool
+    return tool
+
 
 # Export tools
 __all__ = [
@@ -1,25 +1,39 @@
 # Imports
-import os
-from typing import Any, Dict
+from typing import Optional
 
 # Third party imports
 import httpx
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Local imports
+from open_weather_mcp_server.utils.cache import ResponseCache
+from open_weather_mcp_server.utils.circuit_breaker import CircuitOpenError
+from open_weather_mcp_server.utils.http_client import OPEN_WEATHER_BASE_URL
+from open_weather_mcp_server.utils.serializer import RawJSON
+from open_weather_mcp_server.utils.settings import settings
 
 # Get API key from environment variables
-OPEN_WEATHER_API_KEY = os.getenv("OPEN_WEATHER_API_KEY")
+OPEN_WEATHER_API_KEY = settings.get("OPEN_WEATHER_API_KEY")
+
+# Get the cache TTL in seconds from environment variables
+FORECAST_AIR_POLLUTION_CACHE_TTL = settings.get_float(
+    "OPEN_WEATHER_FORECAST_AIR_POLLUTION_TTL", 1800
+)
 
 
 # Function to get the forecast air pollution data
-async def get_forecast_air_pollution(lat: float, lon: float) -> Dict[str, Any]:
+async def get_forecast_air_pollution(
+    client: httpx.AsyncClient,
+    lat: float,
+    lon: float,
+    cache: Optional[ResponseCache] = None,
+) -> RawJSON:
     """Get the forecast air pollution data for a given location.
 
     Args:
+        client (httpx.AsyncClient): The shared HTTP client
         lat (float): Latitude, decimal (-90; 90)
         lon (float): Longitude, decimal (-180; 180)
+        cache (Optional[ResponseCache]): The shared response cache. Defaults to None.
 
     Raises:
         ValueError: Missing required argument 'lat'
@@ -29,7 +43,7 @@ async def get_forecast_air_pollution(lat: float, lon: float) -> Dict[str, Any]:
         Exception: Failed to get forecast air pollution data
 
     Returns:
-        Dict[str, Any]: The forecast air pollution data.
+        RawJSON: The forecast air pollution data, as the unparsed upstream JSON body.
     """
 
     # If the latitude is not provided
@@ -52,37 +66,58 @@ async def get_forecast_air_pollution(lat: float, lon: float) -> Dict[str, Any]:
         # Raise an error
         raise ValueError("Longitude must be between -180 and 180")
 
+    # If a response cache is configured
+    if cache is not None:
+        # Build the cache key from the quantized coordinates
+        key = cache.make_key("get-forecast-air-pollution", lat, lon)
+
+        # If the forecast air pollution data is cached
+        if (cached := cache.get(key)) is not None:
+            # Return the cached data
+            return cached
+
     try:
-        # Initialize the HTTP client
-        async with httpx.AsyncClient() as client:
-            # Make the request to the OpenWeather API
-            response = await client.get(
-                "http://api.openweathermap.org/data/2.5/air_pollution/forecast",
-                params={
-                    "lat": lat,
-                    "lon": lon,
-                    "appid": OPEN_WEATHER_API_KEY,
-                },
-            )
-
-            # Raise an exception if the response status code is not successful
-            response.raise_for_status()
-
-            # Get the response data
-            data = response.json()
-
-            # Return the forecast air pollution data
-            return data
+        # Make the request to the OpenWeather API
+        response = await client.get(
+            f"{OPEN_WEATHER_BASE_URL}/data/2.5/air_pollution/forecast",
+            params={
+                "lat": lat,
+                "lon": lon,
+                "appid": OPEN_WEATHER_API_KEY,
+            },
+        )
+
+        # Raise an exception if the response status code is not successful
+        response.raise_for_status()
+
+        # Pass the response body through, it is returned unchanged
+        data = RawJSON(response.content.decode(response.charset_encoding or "utf-8"))
+
+        # Cache the forecast air pollution data
+        if cache is not None:
+            cache.set(key, data, FORECAST_AIR_POLLUTION_CACHE_TTL)
+
+        # Return the forecast air pollution data
+        return data
+
+    # Handle an open circuit
+    except CircuitOpenError as e:
+        # If the data was cached before, serve it stale while the upstream recovers
+        if cache is not None and (stale := cache.get_stale(key)) is not None:
+            return stale
+
+        # Raise an error
+        raise Exception(f"Failed to get forecast air pollution data: {e}") from e
 
     # Handle the HTTPStatusError exception
     except httpx.HTTPStatusError as e:
         # Raise an error
-        raise Exception(f"Failed to get forecast air pollution data: {e}")
+        raise Exception(f"Failed to get forecast air pollution data: {e}") from e
 
     # Handle any other exception
     except Exception as e:
         # Raise an error
-        raise Exception(f"Failed to get forecast air pollution data: {e}")
+        raise Exception(f"Failed to get forecast air pollution data: {e}") from e
 
 
 # Exports
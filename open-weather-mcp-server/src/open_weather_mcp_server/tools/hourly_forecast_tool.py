@@ -1,29 +1,44 @@
 # Imports
-import os
 from typing import Any, Dict, Optional
 
 # Third party imports
 import httpx
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Local imports
+from open_weather_mcp_server.utils.cache import ResponseCache
+from open_weather_mcp_server.utils.circuit_breaker import CircuitOpenError
+from open_weather_mcp_server.utils.forecast import slice_forecast
+from open_weather_mcp_server.utils.http_client import OPEN_WEATHER_PRO_BASE_URL
+from open_weather_mcp_server.utils.settings import settings
 
 # Get API key from environment variables
-OPEN_WEATHER_API_KEY = os.getenv("OPEN_WEATHER_API_KEY")
+OPEN_WEATHER_API_KEY = settings.get("OPEN_WEATHER_API_KEY")
+
+# Get the cache TTL in seconds from environment variables
+HOURLY_FORECAST_CACHE_TTL = settings.get_float("OPEN_WEATHER_HOURLY_FORECAST_TTL", 900)
+
+# Maximum number of hours the OpenWeather API returns
+HOURLY_FORECAST_MAX_CNT = 40
 
 
 # Function to get the hourly forecast
 async def get_hourly_forecast(
-    lat: float, lon: float, units: Optional[str] = "standard", cnt: int = 12    
+    client: httpx.AsyncClient,
+    lat: float,
+    lon: float,
+    units: Optional[str] = "standard",
+    cnt: int = 12,
+    cache: Optional[ResponseCache] = None,
 ) -> Dict[str, Any]:
     """Get the hourly weather forecast for a given location.
 
     Args:
+        client (httpx.AsyncClient): The shared HTTP client
         lat (float): Latitude, decimal (-90; 90)
         lon (float): Longitude, decimal (-180; 180)
         units (Optional[str]): Units of measurement (standard, metric, imperial). Defaults to standard.
         cnt (int): Number of hours to return. Defaults to 12.
+        cache (Optional[ResponseCache]): The shared response cache. Defaults to None.
 
     Raises:
         ValueError: Missing required argument 'lat'
@@ -61,36 +76,60 @@ async def get_hourly_forecast(
         # Raise an error
         raise ValueError("Count must be between 1 and 40")
 
+    # If a response cache is configured
+    if cache is not None:
+        # Build the cache key from the quantized coordinates
+        key = cache.make_key("get-hourly-forecast", lat, lon, units)
+
+        # If the hourly forecast data is cached
+        if (cached := cache.get(key)) is not None:
+            # Return the requested number of hours from the cached forecast
+            return slice_forecast(cached, cnt)
+
     try:
-        # Initialize the HTTP client
-        async with httpx.AsyncClient() as client:
-            # Make the request to the OpenWeather API
-            response = await client.get(
-                "https://pro.openweathermap.org/data/2.5/forecast/hourly",
-                params={
-                    "lat": lat,
-                    "lon": lon,
-                    "units": units,
-                    "cnt": cnt,
-                    "appid": OPEN_WEATHER_API_KEY,
-                },
-            )
-
-            # Raise an exception if the response status code is not successful
-            response.raise_for_status()
-
-            # Return the hourly forecast data
-            return response.json()
+        # Make the request for the full horizon, smaller counts are sliced from it
+        response = await client.get(
+            f"{OPEN_WEATHER_PRO_BASE_URL}/data/2.5/forecast/hourly",
+            params={
+                "lat": lat,
+                "lon": lon,
+                "units": units,
+                "cnt": HOURLY_FORECAST_MAX_CNT,
+                "appid": OPEN_WEATHER_API_KEY,
+            },
+        )
+
+        # Raise an exception if the response status code is not successful
+        response.raise_for_status()
+
+        # Get the response data
+        data = response.json()
+
+        # Cache the hourly forecast data
+        if cache is not None:
+            cache.set(key, data, HOURLY_FORECAST_CACHE_TTL)
+
+        # Return the requested number of hours
+        return slice_forecast(data, cnt)
+
+    # Handle an open circuit
+    except CircuitOpenError as e:
+        # If the data was cached before, serve it stale while the upstream recovers
+        if cache is not None and (stale := cache.get_stale(key)) is not None:
+            return slice_forecast(stale, cnt)
+
+        # Raise an error
+        raise Exception(f"Failed to get hourly forecast: {e}") from e
 
     # Handle the HTTPStatusError exception
     except httpx.HTTPStatusError as e:
         # Raise an error
-        raise Exception(f"Failed to get hourly forecast: {e}")
+        raise Exception(f"Failed to get hourly forecast: {e}") from e
 
     # Handle any other exception
     except Exception as e:
         # Raise an error
-        raise Exception(f"Failed to get hourly forecast: {e}")
+        raise Exception(f"Failed to get hourly forecast: {e}") from e
 
 
 # Exports
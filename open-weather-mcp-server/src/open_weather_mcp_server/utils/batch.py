@@ -0,0 +1,240 @@
+"""
+Batch module for open-weather-mcp-server.
+Derives batch tools from the single-location tools and fans a batch out over its
+locations with bounded concurrency, sharing one call between locations with the same
+cache key.
+"""
+
+# Standard library imports
+import asyncio
+import copy
+import math
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Third party imports
+import mcp.types as types
+
+# Local imports
+from open_weather_mcp_server.utils.rate_limiter import RateLimitExceeded
+from open_weather_mcp_server.utils.retry import hedging
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_BATCH_CONCURRENCY = settings.get_int("OPEN_WEATHER_BATCH_CONCURRENCY", 10)
+OPEN_WEATHER_BATCH_MAX_LOCATIONS = settings.get_int(
+    "OPEN_WEATHER_BATCH_MAX_LOCATIONS", 200
+)
+OPEN_WEATHER_BATCH_RETRY_HEADROOM = settings.get_float(
+    "OPEN_WEATHER_BATCH_RETRY_HEADROOM", 0.1
+)
+
+# Suffix of batch tool names
+BATCH_SUFFIX = "-batch"
+
+
+# Derive a batch tool from a single-location tool
+def make_batch_tool(
+    tool: types.Tool, max_locations: int = OPEN_WEATHER_BATCH_MAX_LOCATIONS
+) -> types.Tool:
+    """
+    Derive a batch tool from a single-location tool, replacing lat and lon with a list
+    of locations and keeping every other argument.
+
+    Args:
+        tool (types.Tool): The single-location tool
+        max_locations (int): Maximum number of locations per call
+
+    Returns:
+        types.Tool: The batch tool
+    """
+
+    schema = copy.deepcopy(tool.inputSchema)
+    properties = schema["properties"]
+
+    # Move the coordinates into the items of the locations list
+    location = {
+        "type": "object",
+        "properties": {"lat": properties.pop("lat"), "lon": properties.pop("lon")},
+        "required": ["lat", "lon"],
+    }
+    schema["properties"] = {
+        "locations": {
+            "type": "array",
+            "description": f"Locations to query, up to {max_locations}",
+            "items": location,
+            "minItems": 1,
+            "maxItems": max_locations,
+        },
+        **properties,
+    }
+    schema["required"] = [
+        "locations",
+        *(name for name in schema.get("required", []) if name not in ("lat", "lon")),
+    ]
+
+    # Return the batch tool
+    return types.Tool(
+        name=f"{tool.name}{BATCH_SUFFIX}",
+        description=(
+            f"{tool.description.replace('a given location', 'many locations')}"
+            ", results come back in input order with per-location errors"
+        ),
+        inputSchema=schema,
+    )
+
+
+# Fan a batch out over its locations
+async def run_batch(
+    call: Callable[[float, float], Awaitable[Any]],
+    locations: Any,
+    key: Callable[[float, float], Hashable],
+    max_concurrency: int = OPEN_WEATHER_BATCH_CONCURRENCY,
+    max_locations: int = OPEN_WEATHER_BATCH_MAX_LOCATIONS,
+    budget: Optional[int] = None,
+    cached: Optional[Callable[[Hashable], bool]] = None,
+    headroom: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """
+    Call a single-location tool for every location, at most max_concurrency at a time.
+
+    Locations with the same key, the quantized cache key, share one call. A failed
+    location does not fail the batch, its error is returned in its place. A batch that
+    needs more upstream requests than the rate limit admits is refused whole, before
+    any call, rather than failing its last locations one by one. Its requests are not
+    hedged, and a share of the budget is kept for their retries.
+
+    Args:
+        call (Callable[[float, float], Awaitable[Any]]): Call the tool for a latitude and longitude
+        locations (Any): The locations, a list of {"lat", "lon"} objects
+        key (Callable[[float, float], Hashable]): Build the deduplication key of a location
+        max_concurrency (int): Maximum number of calls in progress
+        max_locations (int): Maximum number of locations
+        budget (Optional[int]): Upstream requests the rate limit admits now, None if unlimited
+        cached (Optional[Callable[[Hashable], bool]]): Check whether a key is served from the cache
+        headroom (float): Fraction of the needed upstream requests reserved in the budget for retries
+
+    Returns:
+        List[Dict[str, Any]]: One {"lat", "lon", "result"} or {"lat", "lon", "error"} per location, in input order
+
+    Raises:
+        ValueError: If the locations are not a non-empty list or there are too many
+        RateLimitExceeded: If the batch needs more upstream requests than the budget
+    """
+
+    # If the locations are not a non-empty list
+    if not isinstance(locations, list) or not locations:
+        # Raise an error
+        raise ValueError("Locations must be a non-empty list of {lat, lon} objects")
+
+    # If there are too many locations
+    if len(locations) > max_locations:
+        # Raise an error
+        raise ValueError(f"At most {max_locations} locations are allowed per call")
+
+    # Key the locations, in input order
+    keyed: List[Tuple[Dict[str, Any], Optional[Hashable]]] = []
+    coordinates: Dict[Hashable, Tuple[float, float]] = {}
+    for location in locations:
+        try:
+            # Build the key of the location
+            lat, lon = location["lat"], location["lon"]
+            location_key = key(lat, lon)
+
+        # Handle a location without numeric coordinates
+        except (TypeError, KeyError, ValueError):
+            # Keep its error in its place
+            keyed.append((location, None))
+            continue
+
+        # Keep the coordinates of the first location with this key
+        coordinates.setdefault(location_key, (lat, lon))
+        keyed.append((location, location_key))
+
+    # If the rate limit is set, count the keys that need an upstream request
+    if budget is not None:
+        needed = sum(
+            1
+            for location_key in coordinates
+            if cached is None or not cached(location_key)
+        )
+
+        # Reserve tokens for the retries of those requests, rounded up
+        reserved = math.ceil(needed * headroom)
+
+        # If the rate limit would refuse some of them
+        if needed + reserved > budget:
+            # Find the most locations the budget admits with their reserve
+            admitted = budget
+            while admitted > 0 and admitted + math.ceil(admitted * headroom) > budget:
+                admitted -= 1
+
+            # Raise an error
+            raise RateLimitExceeded(
+                f"Batch too large for the configured rate: {needed} locations need an "
+                f"upstream request and {reserved} more are reserved for retries, but "
+                f"the rate limit admits {budget} now, send at most {admitted} or "
+                "raise OPEN_WEATHER_RATE_LIMIT"
+            )
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    # Function to call the tool once a slot is free
+    async def bounded(lat: float, lon: float) -> Any:
+        async with semaphore:
+            return await call(lat, lon)
+
+    # Start one call per distinct key, in input order, without hedging, the calls
+    # copy the context they are started in
+    token = hedging.set(False)
+    try:
+        tasks: Dict[Hashable, asyncio.Task] = {
+            location_key: asyncio.ensure_future(bounded(lat, lon))
+            for location_key, (lat, lon) in coordinates.items()
+        }
+    finally:
+        hedging.reset(token)
+    entries: List[Tuple[Dict[str, Any], Optional[asyncio.Task]]] = [
+        (location, None if location_key is None else tasks[location_key])
+        for location, location_key in keyed
+    ]
+
+    try:
+        # Wait for every call, a failed call does not stop the others
+        if tasks:
+            await asyncio.wait(tasks.values())
+
+    finally:
+        # If the batch was cancelled, cancel the calls still running
+        for task in tasks.values():
+            task.cancel()
+
+    # Collect the results in input order
+    results = []
+    for location, task in entries:
+        # Echo the coordinates of the location
+        item = (
+            {"lat": location.get("lat"), "lon": location.get("lon")}
+            if isinstance(location, dict)
+            else {}
+        )
+
+        # If the location is invalid
+        if task is None:
+            item["error"] = "Location must be an object with numeric lat and lon"
+
+        # If the call failed
+        elif (error := task.exception()) is not None:
+            item["error"] = str(error) or type(error).__name__
+
+        # If the call succeeded
+        else:
+            item["result"] = task.result()
+
+        results.append(item)
+
+    # Return the results
+    return results
+
+
+# Exports
+__all__ = ["BATCH_SUFFIX", "make_batch_tool", "run_batch"]
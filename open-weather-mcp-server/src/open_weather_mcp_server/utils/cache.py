@@ -0,0 +1,242 @@
+"""
+Response cache module for open-weather-mcp-server.
+Provides an in-process LRU cache with per-entry TTLs, keyed on quantized coordinates.
+"""
+
+# Standard library imports
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Local imports
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_CACHE_MAX_ENTRIES = settings.get_int(
+    "OPEN_WEATHER_CACHE_MAX_ENTRIES", 1024
+)
+OPEN_WEATHER_CACHE_PRECISION = settings.get_int("OPEN_WEATHER_CACHE_PRECISION", 2)
+OPEN_WEATHER_CACHE_MAX_STALE = settings.get_float("OPEN_WEATHER_CACHE_MAX_STALE", 3600)
+
+
+# LRU response cache with per-entry TTLs
+class ResponseCache:
+    """
+    LRU response cache with per-entry TTLs.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses
+        precision (int): Number of decimal places lat/lon are rounded to in cache keys
+        max_stale (float): Seconds an expired response is kept to be served stale
+
+    Methods:
+        make_key(tool: str, lat: float, lon: float, *parts: Hashable) -> Tuple: Build a cache key
+        get(key: Tuple) -> Optional[Any]: Get a cached response
+        fresh(key: Tuple) -> bool: Check whether a response is cached and not expired
+        ttl_left(key: Tuple) -> float: Get the seconds a cached response stays fresh
+        get_stale(key: Tuple) -> Optional[Any]: Get a cached response, even if it has expired
+        set(key: Tuple, value: Any, ttl: float) -> None: Cache a response
+        stats() -> Dict[str, Any]: Get the cache counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        max_entries: int = OPEN_WEATHER_CACHE_MAX_ENTRIES,
+        precision: int = OPEN_WEATHER_CACHE_PRECISION,
+        max_stale: float = OPEN_WEATHER_CACHE_MAX_STALE,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries (int): Maximum number of cached responses
+            precision (int): Number of decimal places lat/lon are rounded to in cache keys
+            max_stale (float): Seconds an expired response is kept to be served stale
+        """
+
+        # Set the configuration
+        self.max_entries = max_entries
+        self.precision = precision
+        self.max_stale = max_stale
+
+        # Initialize the entries, mapping keys to (expires_at, value)
+        self._entries: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+
+        # Initialize the counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_hits = 0
+
+    # Build a cache key
+    def make_key(self, tool: str, lat: float, lon: float, *parts: Hashable) -> Tuple:
+        """
+        Build a cache key from the tool name, the quantized coordinates and any extra parts.
+
+        Args:
+            tool (str): The tool name
+            lat (float): Latitude, decimal (-90; 90)
+            lon (float): Longitude, decimal (-180; 180)
+            *parts (Hashable): Extra key parts, such as the units
+
+        Returns:
+            Tuple: The cache key
+        """
+
+        # Return the key
+        return (
+            tool,
+            round(float(lat), self.precision),
+            round(float(lon), self.precision),
+            *parts,
+        )
+
+    # Get a cached response
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            key (Tuple): The cache key
+
+        Returns:
+            Optional[Any]: The cached response, or None on a miss
+        """
+
+        # Get the entry
+        entry = self._entries.get(key)
+
+        # If the entry is missing
+        if entry is None:
+            # Count the miss
+            self._misses += 1
+            return None
+
+        # If the entry has expired
+        now = time.monotonic()
+        if entry[0] <= now:
+            # Drop the entry once it is too old to serve stale, and count the miss
+            if entry[0] + self.max_stale <= now:
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
+
+        # Mark the entry as recently used and count the hit
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        # Return the cached response
+        return entry[1]
+
+    # Check whether a response is cached and not expired
+    def fresh(self, key: Tuple) -> bool:
+        """
+        Check whether a response is cached and not expired, without counting a hit or
+        a miss.
+
+        Args:
+            key (Tuple): The cache key
+
+        Returns:
+            bool: True if get would return the cached response
+        """
+
+        # Get the entry
+        entry = self._entries.get(key)
+
+        # Return whether it is there and not expired
+        return entry is not None and entry[0] > time.monotonic()
+
+    # Get the seconds a cached response stays fresh
+    def ttl_left(self, key: Tuple) -> float:
+        """
+        Get the seconds a cached response stays fresh, without counting a hit or a miss.
+
+        Args:
+            key (Tuple): The cache key
+
+        Returns:
+            float: The seconds left, 0 if the response is missing or expired
+        """
+
+        # Get the entry
+        entry = self._entries.get(key)
+
+        # Return the seconds left
+        return 0.0 if entry is None else max(0.0, entry[0] - time.monotonic())
+
+    # Get a cached response, even if it has expired
+    def get_stale(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a cached response, even if it has expired, as long as it is not too old.
+
+        Args:
+            key (Tuple): The cache key
+
+        Returns:
+            Optional[Any]: The cached response, or None if there is none to serve
+        """
+
+        # Get the entry
+        entry = self._entries.get(key)
+
+        # If the entry is missing or too old to serve stale
+        if entry is None or entry[0] + self.max_stale <= time.monotonic():
+            return None
+
+        # Count the stale hit
+        self._stale_hits += 1
+
+        # Return the cached response
+        return entry[1]
+
+    # Cache a response
+    def set(self, key: Tuple, value: Any, ttl: float) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key (Tuple): The cache key
+            value (Any): The response to cache
+            ttl (float): Time to live in seconds, 0 or less disables caching
+        """
+
+        # If caching is disabled for this response
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        # Store the entry as the most recently used
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        # Evict the least recently used entries
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # Get the cache counters
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: The cache counters
+        """
+
+        # Return the counters
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "stale_hits": self._stale_hits,
+        }
+
+
+# Exports
+__all__ = ["ResponseCache"]
@@ -0,0 +1,447 @@
+"""
+Circuit breaker module for open-weather-mcp-server.
+Tracks the outcome of upstream requests per upstream host and tool, failing fast while an
+upstream is failing or slow and probing it again after a cool-down.
+"""
+
+# Standard library imports
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+# Third party imports
+import httpx
+
+# Local imports
+from open_weather_mcp_server.utils.metrics import current_tool, upstream_start
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_CIRCUIT_WINDOW = settings.get_int("OPEN_WEATHER_CIRCUIT_WINDOW", 20)
+OPEN_WEATHER_CIRCUIT_MIN_CALLS = settings.get_int("OPEN_WEATHER_CIRCUIT_MIN_CALLS", 10)
+OPEN_WEATHER_CIRCUIT_ERROR_RATE = settings.get_float(
+    "OPEN_WEATHER_CIRCUIT_ERROR_RATE", 0.5
+)
+OPEN_WEATHER_CIRCUIT_SLOW_CALL = settings.get_float("OPEN_WEATHER_CIRCUIT_SLOW_CALL", 5)
+OPEN_WEATHER_CIRCUIT_SLOW_RATE = settings.get_float(
+    "OPEN_WEATHER_CIRCUIT_SLOW_RATE", 0.8
+)
+OPEN_WEATHER_CIRCUIT_OPEN_SECONDS = settings.get_float(
+    "OPEN_WEATHER_CIRCUIT_OPEN_SECONDS", 30
+)
+OPEN_WEATHER_CIRCUIT_PROBES = settings.get_int("OPEN_WEATHER_CIRCUIT_PROBES", 2)
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Status codes counted as upstream failures
+FAILURE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Breaker name of requests made outside a tool call
+NO_TOOL = "-"
+
+
+# Raised when a circuit is open
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its circuit is open."""
+
+
+# Circuit breaker of one upstream and tool
+class CircuitBreaker:
+    """
+    Circuit breaker of one upstream and tool.
+
+    The breaker is closed while the upstream is healthy. It opens once the error rate or
+    the slow-call rate over the recent calls crosses its threshold, and refuses calls
+    until the cool-down ends. It then lets a few probes through, half-open, and closes
+    once they all succeed or opens again as soon as one fails. Each call is tagged with
+    the state it was admitted under, so only probes count toward closing, and a call
+    that ends after the state changed does not count.
+
+    Attributes:
+        name (str): The breaker name, "host/tool"
+        window (int): Number of recent calls the rates are computed over
+        min_calls (int): Number of calls needed before the breaker may open
+        error_rate (float): Fraction of failed calls that opens the breaker
+        slow_call (float): Seconds after which a call counts as slow
+        slow_rate (float): Fraction of slow calls that opens the breaker
+        open_seconds (float): Seconds the breaker stays open before probing
+        probes (int): Number of probes let through while half-open
+
+    Methods:
+        state() -> str: Get the current state
+        acquire() -> Tuple[float, int]: Let a call through or refuse it
+        record(start: float, admission: int, failed: bool) -> None: Record the outcome of a call
+        abandon(admission: int) -> None: Forget a call that ended without an outcome
+        stats() -> Dict[str, int]: Get the breaker counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        name: str,
+        window: int = OPEN_WEATHER_CIRCUIT_WINDOW,
+        min_calls: int = OPEN_WEATHER_CIRCUIT_MIN_CALLS,
+        error_rate: float = OPEN_WEATHER_CIRCUIT_ERROR_RATE,
+        slow_call: float = OPEN_WEATHER_CIRCUIT_SLOW_CALL,
+        slow_rate: float = OPEN_WEATHER_CIRCUIT_SLOW_RATE,
+        open_seconds: float = OPEN_WEATHER_CIRCUIT_OPEN_SECONDS,
+        probes: int = OPEN_WEATHER_CIRCUIT_PROBES,
+    ):
+        """
+        Initialize the circuit breaker, closed.
+
+        Args:
+            name (str): The breaker name, "host/tool"
+            window (int): Number of recent calls the rates are computed over
+            min_calls (int): Number of calls needed before the breaker may open
+            error_rate (float): Fraction of failed calls that opens the breaker
+            slow_call (float): Seconds after which a call counts as slow
+            slow_rate (float): Fraction of slow calls that opens the breaker
+            open_seconds (float): Seconds the breaker stays open before probing
+            probes (int): Number of probes let through while half-open
+        """
+
+        # Set the configuration
+        self.name = name
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self.probes = max(1, probes)
+
+        # Initialize the state and the recent outcomes, as (failed, slow) pairs
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._probing = 0
+        self._probed = 0
+
+        # Initialize the admission tag, changed with every state
+        self._admission = 0
+
+        # Initialize the counters
+        self._opened = 0
+        self._rejected = 0
+
+    # Get the current state
+    def state(self) -> str:
+        """
+        Get the current state, moving to half-open once the cool-down is over.
+
+        Returns:
+            str: "closed", "open" or "half_open"
+        """
+
+        # If the cool-down is over, start probing
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = HALF_OPEN
+            self._admission += 1
+            self._probing = 0
+            self._probed = 0
+
+        # Return the state
+        return self._state
+
+    # Let a call through or refuse it
+    def acquire(self) -> Tuple[float, int]:
+        """
+        Let a call through, or refuse it while the breaker is open or probing.
+
+        Returns:
+            Tuple[float, int]: The start time from time.perf_counter and the admission tag of the state the call was let through in, both passed back to record
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with every probe taken
+        """
+
+        # Get the state
+        state = self.state()
+
+        # If the breaker is half-open and a probe is free, take it
+        if state == HALF_OPEN and self._probing + self._probed < self.probes:
+            self._probing += 1
+
+        # If the breaker is not closed, refuse the call
+        elif state != CLOSED:
+            # Count the rejection
+            self._rejected += 1
+
+            # Raise an error
+            retry_in = max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+            raise CircuitOpenError(
+                f"Circuit {self.name} is open, retry in {retry_in:.1f}s"
+            )
+
+        # Return the start time and the admission tag
+        return time.perf_counter(), self._admission
+
+    # Record the outcome of a call
+    def record(self, start: float, admission: int, failed: bool) -> None:
+        """
+        Record the outcome of a call. A call is slow when it took longer than slow_call
+        since start, so callers pass the time the call reached the upstream, after any
+        local queueing, for the slow-call rate to reflect the upstream alone.
+
+        Args:
+            start (float): The start time from time.perf_counter, as returned by acquire or later
+            admission (int): The admission tag returned by acquire
+            failed (bool): Whether the call failed
+        """
+
+        # Calls that finish after the state changed do not count, such as a call let
+        # through closed that ends while the breaker probes
+        if admission != self._admission:
+            return
+
+        slow = time.perf_counter() - start >= self.slow_call
+
+        # If the call was a probe
+        if self._state == HALF_OPEN:
+            self._probing = max(0, self._probing - 1)
+
+            # A failed or slow probe opens the breaker again
+            if failed or slow:
+                self._open()
+
+            # Close the breaker once every probe succeeded
+            else:
+                self._probed += 1
+                if self._probed >= self.probes:
+                    self._state = CLOSED
+                    self._admission += 1
+                    self._outcomes.clear()
+            return
+
+        # Add the outcome
+        self._outcomes.append((failed, slow))
+
+        # If enough calls were made, open the breaker past either threshold
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and (
+            sum(failed for failed, _ in self._outcomes) >= self.error_rate * calls
+            or sum(slow for _, slow in self._outcomes) >= self.slow_rate * calls
+        ):
+            self._open()
+
+    # Forget a call that ended without an outcome
+    def abandon(self, admission: int) -> None:
+        """
+        Forget a call that was cancelled, freeing its probe.
+
+        Args:
+            admission (int): The admission tag returned by acquire
+        """
+
+        # If the call was a probe of the current half-open state, free it
+        if admission == self._admission and self._state == HALF_OPEN:
+            self._probing = max(0, self._probing - 1)
+
+    # Open the breaker
+    def _open(self) -> None:
+        """Open the breaker and start the cool-down."""
+
+        # Open the breaker
+        self._state = OPEN
+        self._admission += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+        # Count the opening
+        self._opened += 1
+
+    # Get the breaker counters
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the breaker counters.
+
+        Returns:
+            Dict[str, int]: The breaker counters
+        """
+
+        # Return the counters
+        return {"opened": self._opened, "rejected": self._rejected}
+
+
+# Circuit breakers per upstream and tool
+class CircuitBreakers:
+    """
+    Circuit breakers per upstream host and tool, created on first use.
+
+    Methods:
+        get(host: str, tool: str) -> CircuitBreaker: Get the breaker of a host and tool
+        states() -> Dict[str, str]: Get the state of every breaker
+        stats() -> Dict[str, int]: Get the breaker counts and counters
+    """
+
+    # Constructor
+    def __init__(self, **options):
+        """
+        Initialize the circuit breakers.
+
+        Args:
+            **options: Options of every breaker, see CircuitBreaker
+        """
+
+        # Set the breaker options
+        self._options = options
+
+        # Initialize the breakers
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    # Get the breaker of a host and tool
+    def get(self, host: str, tool: str) -> CircuitBreaker:
+        """
+        Get the breaker of a host and tool, creating it on first use.
+
+        Args:
+            host (str): The upstream host
+            tool (str): The tool name
+
+        Returns:
+            CircuitBreaker: The breaker
+        """
+
+        name = f"{host}/{tool}"
+
+        # If the breaker does not exist, create it
+        if (breaker := self._breakers.get(name)) is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, **self._options)
+
+        # Return the breaker
+        return breaker
+
+    # Get the state of every breaker
+    def states(self) -> Dict[str, str]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Dict[str, str]: The state of each breaker by name
+        """
+
+        # Return the states
+        return {name: breaker.state() for name, breaker in self._breakers.items()}
+
+    # Get the breaker counts and counters
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the number of breakers in each state and the counters summed over them.
+
+        Returns:
+            Dict[str, int]: The counts and counters
+        """
+
+        states = list(self.states().values())
+        breakers = [breaker.stats() for breaker in self._breakers.values()]
+
+        # Return the counts and counters
+        return {
+            "closed": states.count(CLOSED),
+            "open": states.count(OPEN),
+            "half_open": states.count(HALF_OPEN),
+            "opened": sum(stats["opened"] for stats in breakers),
+            "rejected": sum(stats["rejected"] for stats in breakers),
+        }
+
+
+# HTTP transport that fails fast while a circuit is open
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that fails fast while the circuit of a request is open.
+
+    Attributes:
+        transport (httpx.AsyncBaseTransport): The transport that sends the requests
+        breakers (CircuitBreakers): The circuit breakers
+
+    Methods:
+        handle_async_request(request: httpx.Request) -> httpx.Response: Send a request through its breaker
+        aclose() -> None: Close the wrapped transport
+    """
+
+    # Constructor
+    def __init__(self, transport: httpx.AsyncBaseTransport, breakers: CircuitBreakers):
+        """
+        Initialize the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that sends the requests
+            breakers (CircuitBreakers): The circuit breakers
+        """
+
+        # Set the transport and breakers
+        self.transport = transport
+        self.breakers = breakers
+
+    # Send a request through its breaker
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request through the breaker of its host and tool.
+
+        Args:
+            request (httpx.Request): The request
+
+        Returns:
+            httpx.Response: The response
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+
+        # Get the breaker of the host and the tool being called
+        tool = current_tool.get()
+        breaker = self.breakers.get(
+            request.url.host, tool.name if tool is not None else NO_TOOL
+        )
+
+        # Let the request through or refuse it
+        start, admission = breaker.acquire()
+
+        try:
+            # Send the request
+            response = await self.transport.handle_async_request(request)
+
+        # Handle a request that failed upstream
+        except httpx.TransportError:
+            # Record the failure
+            breaker.record(upstream_start(request, start), admission, failed=True)
+            raise
+
+        # Handle a request that was cancelled or refused locally, such as by the rate limiter
+        except BaseException:
+            # Forget the request
+            breaker.abandon(admission)
+            raise
+
+        # Record the outcome, timed from when the last attempt reached the upstream
+        breaker.record(
+            upstream_start(request, start),
+            admission,
+            failed=response.status_code in FAILURE_STATUS_CODES,
+        )
+
+        # Return the response
+        return response
+
+    # Close the wrapped transport
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+
+        # Close the transport
+        await self.transport.aclose()
+
+
+# Exports
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerTransport",
+    "CircuitBreakers",
+    "CircuitOpenError",
+]
@@ -0,0 +1,33 @@
+"""
+Forecast helpers module for open-weather-mcp-server.
+Serves shorter forecast horizons from a single full-horizon upstream response.
+"""
+
+# Standard library imports
+from typing import Any, Dict
+
+
+# Slice a forecast response to the requested number of entries
+def slice_forecast(data: Dict[str, Any], cnt: int) -> Dict[str, Any]:
+    """
+    Slice a forecast response to the requested number of entries.
+
+    The full-horizon response is left untouched so it can stay cached.
+
+    Args:
+        data (Dict[str, Any]): The full-horizon forecast response
+        cnt (int): Number of entries to return
+
+    Returns:
+        Dict[str, Any]: The forecast response with the first cnt entries
+    """
+
+    # Take the first cnt entries
+    entries = data.get("list", [])[:cnt]
+
+    # Return a shallow copy with the list and count fixed up
+    return {**data, "cnt": len(entries), "list": entries}
+
+
+# Exports
+__all__ = ["slice_forecast"]
@@ -0,0 +1,164 @@
+"""
+HTTP client module for open-weather-mcp-server.
+Provides the pooled, process-wide HTTP client shared by all OpenWeather tools.
+"""
+
+# Standard library imports
+from typing import Any, Dict, Optional
+
+# Third party imports
+import httpx
+
+# Local imports
+from open_weather_mcp_server.utils.circuit_breaker import (
+    CircuitBreakers,
+    CircuitBreakerTransport,
+)
+from open_weather_mcp_server.utils.fixtures import (
+    OPEN_WEATHER_FIXTURES_MODE,
+    OPEN_WEATHER_FIXTURES_PATH,
+    FixtureCorpus,
+    RecordingTransport,
+    ReplayTransport,
+)
+from open_weather_mcp_server.utils.metrics import UPSTREAM_EVENT_HOOKS
+from open_weather_mcp_server.utils.rate_limiter import RateLimitedTransport, RateLimiter
+from open_weather_mcp_server.utils.retry import RetryPolicy, RetryTransport
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_BASE_URL = settings.get(
+    "OPEN_WEATHER_BASE_URL", "https://api.openweathermap.org"
+)
+OPEN_WEATHER_PRO_BASE_URL = settings.get(
+    "OPEN_WEATHER_PRO_BASE_URL", "https://pro.openweathermap.org"
+)
+OPEN_WEATHER_HTTP2 = settings.get_bool("OPEN_WEATHER_HTTP2", True)
+OPEN_WEATHER_MAX_CONNECTIONS = settings.get_int("OPEN_WEATHER_MAX_CONNECTIONS", 100)
+OPEN_WEATHER_MAX_KEEPALIVE_CONNECTIONS = settings.get_int(
+    "OPEN_WEATHER_MAX_KEEPALIVE_CONNECTIONS", 20
+)
+OPEN_WEATHER_KEEPALIVE_EXPIRY = settings.get_float("OPEN_WEATHER_KEEPALIVE_EXPIRY", 30)
+OPEN_WEATHER_TIMEOUT = settings.get_float("OPEN_WEATHER_TIMEOUT", 10)
+
+
+# Create the shared HTTP client
+def create_http_client(
+    http2: bool = OPEN_WEATHER_HTTP2,
+    max_connections: int = OPEN_WEATHER_MAX_CONNECTIONS,
+    max_keepalive_connections: int = OPEN_WEATHER_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = OPEN_WEATHER_KEEPALIVE_EXPIRY,
+    timeout: float = OPEN_WEATHER_TIMEOUT,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breakers: Optional[CircuitBreakers] = None,
+    fixtures_mode: str = OPEN_WEATHER_FIXTURES_MODE,
+    fixtures_path: str = OPEN_WEATHER_FIXTURES_PATH,
+) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client shared by all OpenWeather tools.
+
+    Args:
+        http2 (bool): Whether to negotiate HTTP/2 with the upstream
+        max_connections (int): Maximum number of open connections
+        max_keepalive_connections (int): Maximum number of idle connections kept alive
+        keepalive_expiry (float): Seconds an idle connection is kept alive
+        timeout (float): Request timeout in seconds
+        rate_limiter (Optional[RateLimiter]): Paces requests per upstream host. Defaults to None.
+        retry_policy (Optional[RetryPolicy]): Retries and hedges idempotent requests. Defaults to None.
+        circuit_breakers (Optional[CircuitBreakers]): Fail fast while an upstream is failing. Defaults to None.
+        fixtures_mode (str): "record" to record upstream responses, "replay" to answer from the recordings, anything else for neither
+        fixtures_path (str): The file the responses are recorded to and replayed from
+
+    Returns:
+        httpx.AsyncClient: The pooled HTTP client
+    """
+
+    # If fixtures are replayed, answer from the recordings instead of the network
+    if fixtures_mode == "replay":
+        transport = ReplayTransport(FixtureCorpus(fixtures_path))
+
+    # Otherwise, build the pooled transport
+    else:
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+        # If fixtures are recorded, record the responses as they come back
+        if fixtures_mode == "record":
+            transport = RecordingTransport(transport, FixtureCorpus(fixtures_path))
+
+    # If a rate limiter is given, pace the requests through it
+    if rate_limiter is not None:
+        transport = RateLimitedTransport(transport, rate_limiter)
+
+    # If a retry policy is given, retry on top, so every attempt takes a token
+    if retry_policy is not None:
+        transport = RetryTransport(transport, retry_policy)
+
+    # If circuit breakers are given, break on top, so an open circuit skips the retries
+    if circuit_breakers is not None:
+        transport = CircuitBreakerTransport(transport, circuit_breakers)
+
+    # Return the client
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(timeout),
+        # Time upstream requests against the tool that made them
+        event_hooks=UPSTREAM_EVENT_HOOKS,
+    )
+
+
+# Get the connection pool figures of the shared HTTP client
+def pool_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """
+    Get the connection pool figures of a client built by create_http_client.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client
+
+    Returns:
+        Dict[str, Any]: The open, active and idle connections, the requests sent and queued, and the pool utilization
+    """
+
+    # Unwrap the transports down to the pooled one
+    transport = client._transport
+    while not isinstance(transport, httpx.AsyncHTTPTransport):
+        # If fixtures are replayed, there is no pool
+        if not hasattr(transport, "transport"):
+            return {
+                "max_connections": 0,
+                "connections": 0,
+                "active": 0,
+                "idle": 0,
+                "requests": 0,
+                "queued": 0,
+                "utilization": 0.0,
+            }
+        transport = transport.transport
+    pool = transport._pool
+
+    # Count the connections and requests, as the pool itself does in its repr
+    connections = pool.connections
+    active = sum(not connection.is_idle() for connection in connections)
+    queued = sum(request.is_queued() for request in pool._requests)
+
+    # Return the figures
+    return {
+        "max_connections": pool._max_connections,
+        "connections": len(connections),
+        "active": active,
+        "idle": len(connections) - active,
+        "requests": len(pool._requests) - queued,
+        "queued": queued,
+        "utilization": round(active / pool._max_connections, 4),
+    }
+
+
+# Exports
+__all__ = ["create_http_client", "pool_stats"]
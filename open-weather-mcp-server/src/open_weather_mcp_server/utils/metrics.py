@@ -0,0 +1,460 @@
+"""
+Metrics module for open-weather-mcp-server.
+Records per-tool call metrics with pre-allocated counters and exports them in the
+Prometheus text format.
+"""
+
+# Standard library imports
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Third party imports
+import httpx
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Response size buckets in characters
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Label of calls to tools that do not exist
+UNKNOWN_TOOL = "unknown"
+
+
+# Fixed-bucket histogram
+class Histogram:
+    """
+    Fixed-bucket histogram, observing a value costs one bisect and two additions.
+
+    Attributes:
+        bounds (Tuple[float, ...]): Upper bounds of the buckets, the last bucket is +Inf
+
+    Methods:
+        observe(value: float) -> None: Record a value
+        render(name: str, labels: str) -> List[str]: Export the histogram samples
+    """
+
+    # Constructor
+    def __init__(self, bounds: Tuple[float, ...]):
+        """
+        Initialize the histogram.
+
+        Args:
+            bounds (Tuple[float, ...]): Upper bounds of the buckets, sorted
+        """
+
+        # Set the bounds
+        self.bounds = bounds
+
+        # Initialize the counts, one per bucket plus +Inf, and the sum
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    # Record a value
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            value (float): The observed value
+        """
+
+        # Count the value in the first bucket whose bound is not below it
+        self._counts[bisect_left(self.bounds, value)] += 1
+        self._sum += value
+
+    # Export the histogram samples
+    def render(self, name: str, labels: str) -> List[str]:
+        """
+        Export the histogram samples with cumulative buckets.
+
+        Args:
+            name (str): The metric name
+            labels (str): The rendered labels, without braces
+
+        Returns:
+            List[str]: The sample lines
+        """
+
+        lines = []
+        total = 0
+
+        # Buckets are cumulative in the Prometheus format
+        for bound, count in zip((*self.bounds, "+Inf"), self._counts):
+            total += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {total}')
+
+        # Add the sum and count
+        lines.append(f"{name}_sum{{{labels}}} {self._sum}")
+        lines.append(f"{name}_count{{{labels}}} {total}")
+
+        # Return the lines
+        return lines
+
+
+# Metrics of one tool
+class ToolMetrics:
+    """
+    Metrics of one tool, allocated once at startup.
+
+    Attributes:
+        name (str): The tool name
+        calls (int): Finished calls
+        in_flight (int): Calls in progress
+        errors (Dict[type, int]): Failed calls by exception type
+        duration (Histogram): End-to-end latency in seconds
+        upstream (Histogram): Upstream request latency in seconds
+        size (Histogram): Response size in characters
+
+    Methods:
+        start() -> float: Record the start of a call
+        finish(start: float, size: int) -> None: Record a successful call
+        fail(start: float, error: BaseException) -> None: Record a failed call
+    """
+
+    # Constructor
+    def __init__(self, name: str):
+        """
+        Initialize the tool metrics.
+
+        Args:
+            name (str): The tool name
+        """
+
+        # Set the name and render its label once
+        self.name = name
+        self.labels = f'tool="{name}"'
+
+        # Initialize the counters
+        self.calls = 0
+        self.in_flight = 0
+        self.errors: Dict[type, int] = defaultdict(int)
+
+        # Initialize the histograms
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.upstream = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+
+    # Record the start of a call
+    def start(self) -> float:
+        """
+        Record the start of a call.
+
+        Returns:
+            float: The start time, passed back to finish or fail
+        """
+
+        # Count the call in flight
+        self.in_flight += 1
+
+        # Return the start time
+        return time.perf_counter()
+
+    # Record a successful call
+    def finish(self, start: float, size: int) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            start (float): The start time returned by start
+            size (int): The response size in characters
+        """
+
+        # Update the counters and histograms
+        self.in_flight -= 1
+        self.calls += 1
+        self.duration.observe(time.perf_counter() - start)
+        self.size.observe(size)
+
+    # Record a failed call
+    def fail(self, start: float, error: BaseException) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            start (float): The start time returned by start
+            error (BaseException): The raised exception, counted under the type of the exception it was raised from, if any
+        """
+
+        # Update the counters and histograms, the type is named only on export, and
+        # tools wrap upstream failures in a plain Exception raised from the real one
+        self.in_flight -= 1
+        self.calls += 1
+        self.errors[type(error.__cause__ or error)] += 1
+        self.duration.observe(time.perf_counter() - start)
+
+
+# Metrics of the tool being called, read when timing upstream requests
+current_tool: ContextVar[Optional[ToolMetrics]] = ContextVar(
+    "current_tool", default=None
+)
+
+
+# Record the latency of an upstream request
+def observe_upstream(start: float) -> None:
+    """
+    Record the latency of an upstream request against the tool being called.
+
+    Args:
+        start (float): The time the request started, from time.perf_counter
+    """
+
+    # If the request was made by a tool call
+    if (tool := current_tool.get()) is not None:
+        # Record the latency
+        tool.upstream.observe(time.perf_counter() - start)
+
+
+# Start timing an upstream request
+def mark_upstream_start(request: httpx.Request) -> None:
+    """
+    Start timing an upstream request, restarting the timer if it was already started.
+
+    Args:
+        request (httpx.Request): The outgoing request
+    """
+
+    # Store the start time on the request
+    request.extensions["metrics_start"] = time.perf_counter()
+
+
+# Get the time an upstream request was last started
+def upstream_start(request: httpx.Request, default: float) -> float:
+    """
+    Get the time the last attempt of an upstream request started, once it left any
+    local queue, or default if the request was last timed before it.
+
+    Args:
+        request (httpx.Request): The outgoing request
+        default (float): The fallback start time, from time.perf_counter
+
+    Returns:
+        float: The start time, from time.perf_counter
+    """
+
+    # Return the later of the two times
+    return max(default, request.extensions.get("metrics_start", default))
+
+
+# Start timing an upstream request when it is sent
+async def _start_upstream(request: httpx.Request) -> None:
+    """
+    Start timing an upstream request when the client sends it.
+
+    Args:
+        request (httpx.Request): The outgoing request
+    """
+
+    # Start the timer
+    mark_upstream_start(request)
+
+
+# Stop timing an upstream request
+async def _stop_upstream(response: httpx.Response) -> None:
+    """
+    Stop timing an upstream request once its body has been received.
+
+    Args:
+        response (httpx.Response): The incoming response
+    """
+
+    # If the request was made by a tool call
+    if current_tool.get() is not None:
+        # Read the body, so the latency covers the whole response
+        await response.aread()
+
+        # Record the latency
+        observe_upstream(response.request.extensions["metrics_start"])
+
+
+# Event hooks that time upstream requests made by the HTTP client
+UPSTREAM_EVENT_HOOKS = {"request": [_start_upstream], "response": [_stop_upstream]}
+
+
+# Metrics of every tool
+class Metrics:
+    """
+    Metrics of every tool, exported in the Prometheus text format.
+
+    Attributes:
+        prefix (str): Prefix of the metric names
+
+    Methods:
+        tool(name: str) -> ToolMetrics: Get the metrics of a tool
+        in_flight() -> int: Get the number of tool calls in progress
+        render(stats: Dict[str, Dict[str, Any]]) -> str: Export every metric
+    """
+
+    # Constructor
+    def __init__(self, names: Iterable[str], prefix: str = "mcp"):
+        """
+        Initialize the metrics.
+
+        Args:
+            names (Iterable[str]): The tool names
+            prefix (str): Prefix of the metric names
+        """
+
+        # Set the prefix
+        self.prefix = prefix
+
+        # Allocate the metrics of every tool up front, unknown names share one entry
+        self._tools = {name: ToolMetrics(name) for name in names}
+        self._unknown = ToolMetrics(UNKNOWN_TOOL)
+
+    # Get the metrics of a tool
+    def tool(self, name: str) -> ToolMetrics:
+        """
+        Get the metrics of a tool.
+
+        Args:
+            name (str): The tool name
+
+        Returns:
+            ToolMetrics: The metrics of the tool, or the shared unknown entry
+        """
+
+        # Return the metrics
+        return self._tools.get(name, self._unknown)
+
+    # Get the number of tool calls in progress
+    def in_flight(self) -> int:
+        """
+        Get the number of tool calls in progress over every tool.
+
+        Returns:
+            int: The calls in progress
+        """
+
+        # Return the sum over every tool
+        return sum(tool.in_flight for tool in (*self._tools.values(), self._unknown))
+
+    # Export every metric
+    def render(self, stats: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+        """
+        Export every metric in the Prometheus text format.
+
+        Args:
+            stats (Optional[Dict[str, Dict[str, Any]]]): Component counters, such as cache stats, exported as gauges
+
+        Returns:
+            str: The exposition text
+        """
+
+        tools = [*self._tools.values(), self._unknown]
+        prefix = self.prefix
+        lines = []
+
+        # Call counters and in-flight gauges
+        lines += [
+            f"# HELP {prefix}_tool_calls_total Finished tool calls.",
+            f"# TYPE {prefix}_tool_calls_total counter",
+            *(f"{prefix}_tool_calls_total{{{t.labels}}} {t.calls}" for t in tools),
+            f"# HELP {prefix}_tool_in_flight Tool calls in progress.",
+            f"# TYPE {prefix}_tool_in_flight gauge",
+            *(f"{prefix}_tool_in_flight{{{t.labels}}} {t.in_flight}" for t in tools),
+            f"# HELP {prefix}_tool_errors_total Failed tool calls by exception type.",
+            f"# TYPE {prefix}_tool_errors_total counter",
+        ]
+
+        # Error counters, copied since a call may add a type while rendering
+        for t in tools:
+            for error, count in list(t.errors.items()):
+                lines.append(
+                    f'{prefix}_tool_errors_total{{{t.labels},type="{error.__name__}"}}'
+                    f" {count}"
+                )
+
+        # Histograms
+        for attribute, name, help_text in (
+            ("duration", "tool_duration_seconds", "End-to-end tool call latency."),
+            ("upstream", "upstream_duration_seconds", "Upstream request latency."),
+            ("size", "tool_response_size_chars", "Tool response size in characters."),
+        ):
+            lines += [
+                f"# HELP {prefix}_{name} {help_text}",
+                f"# TYPE {prefix}_{name} histogram",
+            ]
+            for t in tools:
+                lines += getattr(t, attribute).render(f"{prefix}_{name}", t.labels)
+
+        # Component counters, only numbers are exported
+        for component, values in (stats or {}).items():
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    name = f"{prefix}_{component}_{key}"
+                    lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+
+        # Return the text
+        return "\n".join(lines) + "\n"
+
+
+# Merge the expositions of several processes
+def merge_expositions(expositions: Dict[str, str], label: str = "worker") -> str:
+    """
+    Merge expositions in the Prometheus text format, labeling every sample with the
+    process it came from. The HELP and TYPE lines of a metric are kept once, ahead of
+    its samples from every process.
+
+    Args:
+        expositions (Dict[str, str]): The exposition text of each process, by label value
+        label (str): The name of the label telling the processes apart
+
+    Returns:
+        str: The merged exposition text
+    """
+
+    # Metadata and sample lines per metric, in order of first appearance
+    families: Dict[str, Tuple[List[str], List[str]]] = {}
+
+    for value, text in expositions.items():
+        family = None
+        for line in text.splitlines():
+            # Skip blank lines
+            if not line:
+                continue
+
+            # A HELP or TYPE line starts a metric, kept once
+            if line.startswith("#"):
+                family = line.split(" ", 3)[2]
+                metadata = families.setdefault(family, ([], []))[0]
+                if line not in metadata:
+                    metadata.append(line)
+                continue
+
+            # Label the sample, before any labels it has
+            name, brace, rest = line.partition("{")
+            if brace and " " not in name:
+                line = f'{name}{{{label}="{value}",{rest}'
+            else:
+                name, _, rest = line.partition(" ")
+                line = f'{name}{{{label}="{value}"}} {rest}'
+
+            # Add it to its metric, or to one of its own if it has no metadata
+            families.setdefault(family or name, ([], []))[1].append(line)
+
+    # Return the text
+    lines = [
+        line for metadata, samples in families.values() for line in metadata + samples
+    ]
+    return "\n".join(lines) + "\n"
+
+
+# Exports
+__all__ = [
+    "CONTENT_TYPE",
+    "UPSTREAM_EVENT_HOOKS",
+    "Metrics",
+    "ToolMetrics",
+    "current_tool",
+    "merge_expositions",
+    "mark_upstream_start",
+    "observe_upstream",
+    "upstream_start",
+]
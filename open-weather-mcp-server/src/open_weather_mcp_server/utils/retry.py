@@ -0,0 +1,501 @@
+"""
+Retry module for open-weather-mcp-server.
+Retries idempotent upstream requests with exponential backoff and full jitter within an
+overall deadline, and hedges slow requests with a second one past the observed p95 latency.
+"""
+
+# Standard library imports
+import asyncio
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Dict, Optional
+
+# Third party imports
+import httpx
+
+# Local imports
+from open_weather_mcp_server.utils.metrics import mark_upstream_start
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_RETRY_ATTEMPTS = settings.get_int("OPEN_WEATHER_RETRY_ATTEMPTS", 3)
+OPEN_WEATHER_RETRY_BASE_DELAY = settings.get_float("OPEN_WEATHER_RETRY_BASE_DELAY", 0.1)
+OPEN_WEATHER_RETRY_MAX_DELAY = settings.get_float("OPEN_WEATHER_RETRY_MAX_DELAY", 2)
+OPEN_WEATHER_RETRY_DEADLINE = settings.get_float("OPEN_WEATHER_RETRY_DEADLINE", 20)
+OPEN_WEATHER_HEDGE = settings.get_bool("OPEN_WEATHER_HEDGE", True)
+OPEN_WEATHER_HEDGE_MIN_SAMPLES = settings.get_int("OPEN_WEATHER_HEDGE_MIN_SAMPLES", 20)
+
+# Methods that are safe to send more than once
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Status codes worth retrying, the request did not take effect or may succeed later
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Transport errors worth retrying, the connection failed or timed out
+RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+# Latency quantile past which a request is hedged
+HEDGE_QUANTILE = 0.95
+
+# Number of recent latencies kept per path
+HEDGE_WINDOW = 256
+
+# Whether the requests of the current task may be hedged, batches turn it off since a
+# hedge takes a rate limiter token their budget does not count
+hedging: ContextVar[bool] = ContextVar("hedging", default=True)
+
+
+# Recent latencies of one request path
+class LatencyTracker:
+    """
+    Recent latencies of one request path.
+
+    Attributes:
+        min_samples (int): Number of latencies needed before a quantile is known
+
+    Methods:
+        observe(latency: float) -> None: Record a latency
+        quantile(q: float) -> Optional[float]: Get a latency quantile
+    """
+
+    # Constructor
+    def __init__(self, min_samples: int = OPEN_WEATHER_HEDGE_MIN_SAMPLES):
+        """
+        Initialize the latency tracker.
+
+        Args:
+            min_samples (int): Number of latencies needed before a quantile is known
+        """
+
+        # Set the configuration
+        self.min_samples = min_samples
+
+        # Initialize the window of recent latencies
+        self._latencies: Deque[float] = deque(maxlen=HEDGE_WINDOW)
+
+    # Record a latency
+    def observe(self, latency: float) -> None:
+        """
+        Record a latency.
+
+        Args:
+            latency (float): The latency in seconds
+        """
+
+        # Add the latency, the oldest one drops out of the window
+        self._latencies.append(latency)
+
+    # Get a latency quantile
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get a latency quantile over the window.
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            Optional[float]: The latency, or None if too few were recorded
+        """
+
+        # If too few latencies were recorded
+        if len(self._latencies) < self.min_samples:
+            return None
+
+        # Return the quantile
+        latencies = sorted(self._latencies)
+        return latencies[int(q * (len(latencies) - 1))]
+
+
+# Retry policy for idempotent requests
+class RetryPolicy:
+    """
+    Retry policy for idempotent requests.
+
+    Attributes:
+        attempts (int): Maximum number of attempts, including the first
+        base_delay (float): Backoff before the first retry, doubled on every retry
+        max_delay (float): Maximum backoff in seconds
+        deadline (float): Maximum seconds spent on a request over every attempt
+        hedge (bool): Whether requests that ask for it are hedged
+
+    Methods:
+        retryable(method: str) -> bool: Whether requests with a method may be retried
+        should_retry(response: Optional[httpx.Response], error: Optional[Exception]) -> bool: Classify an attempt
+        backoff(attempt: int) -> float: Get the jittered delay before a retry
+        tracker(path: str) -> LatencyTracker: Get the latency tracker of a path
+        stats() -> Dict[str, int]: Get the retry and hedging counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        attempts: int = OPEN_WEATHER_RETRY_ATTEMPTS,
+        base_delay: float = OPEN_WEATHER_RETRY_BASE_DELAY,
+        max_delay: float = OPEN_WEATHER_RETRY_MAX_DELAY,
+        deadline: float = OPEN_WEATHER_RETRY_DEADLINE,
+        hedge: bool = OPEN_WEATHER_HEDGE,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            attempts (int): Maximum number of attempts, including the first
+            base_delay (float): Backoff before the first retry, doubled on every retry
+            max_delay (float): Maximum backoff in seconds
+            deadline (float): Maximum seconds spent on a request over every attempt
+            hedge (bool): Whether requests that ask for it are hedged
+        """
+
+        # Set the configuration
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.hedge = hedge
+
+        # Initialize the latency trackers, one per path
+        self._trackers: Dict[str, LatencyTracker] = {}
+
+        # Initialize the counters
+        self._retries = 0
+        self._exhausted = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    # Whether requests with a method may be retried
+    @staticmethod
+    def retryable(method: str) -> bool:
+        """
+        Check whether requests with a method may be sent more than once.
+
+        Args:
+            method (str): The request method
+
+        Returns:
+            bool: True if the method is idempotent
+        """
+
+        # Return whether the method is idempotent
+        return method in IDEMPOTENT_METHODS
+
+    # Classify an attempt
+    @staticmethod
+    def should_retry(
+        response: Optional[httpx.Response], error: Optional[Exception]
+    ) -> bool:
+        """
+        Classify an attempt by its response or the error it raised.
+
+        Args:
+            response (Optional[httpx.Response]): The response, or None if the attempt raised
+            error (Optional[Exception]): The raised error, or None if there is a response
+
+        Returns:
+            bool: True if another attempt may succeed
+        """
+
+        # If the attempt raised, only connection failures and timeouts are retried
+        if response is None:
+            return isinstance(error, RETRYABLE_ERRORS)
+
+        # Retry throttling and server errors
+        return response.status_code in RETRYABLE_STATUS_CODES
+
+    # Get the delay before a retry
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry, with full jitter.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1
+
+        Returns:
+            float: Seconds to wait
+        """
+
+        # Pick a delay up to the exponential backoff, so retries spread out
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    # Get the latency tracker of a path
+    def tracker(self, path: str) -> LatencyTracker:
+        """
+        Get the latency tracker of a path, creating it on first use.
+
+        Args:
+            path (str): The request path
+
+        Returns:
+            LatencyTracker: The tracker
+        """
+
+        # Return the tracker
+        return self._trackers.setdefault(path, LatencyTracker())
+
+    # Get the retry and hedging counters
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the retry and hedging counters.
+
+        Returns:
+            Dict[str, int]: The counters
+        """
+
+        # Return the counters
+        return {
+            "retries": self._retries,
+            "exhausted": self._exhausted,
+            "hedged": self._hedged,
+            "hedge_wins": self._hedge_wins,
+        }
+
+
+# HTTP transport that retries and hedges idempotent requests
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that retries and hedges idempotent requests.
+
+    Requests that set the "hedge" extension are sent a second time once they run
+    longer than the p95 latency of their path, and the first response wins.
+
+    Attributes:
+        transport (httpx.AsyncBaseTransport): The transport that sends the requests
+        policy (RetryPolicy): The retry policy, which also keeps the latencies and counters
+
+    Methods:
+        handle_async_request(request: httpx.Request) -> httpx.Response: Send a request, retrying and hedging it
+        aclose() -> None: Close the wrapped transport
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that sends the requests
+            policy (RetryPolicy): The retry policy, which also keeps the latencies and counters
+        """
+
+        # Set the transport and policy
+        self.transport = transport
+        self.policy = policy
+
+    # Send a request, retrying and hedging it
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, retrying it within the deadline if it is idempotent.
+
+        Args:
+            request (httpx.Request): The request
+
+        Returns:
+            httpx.Response: The first successful response, or the last one
+
+        Raises:
+            httpx.TimeoutException: If the deadline passes during an attempt
+        """
+
+        # If the request may not be sent twice, send it once
+        if not self.policy.retryable(request.method):
+            return await self.transport.handle_async_request(request)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.policy.deadline
+
+        try:
+            # Bound every attempt and backoff by the deadline
+            async with asyncio.timeout_at(deadline):
+                attempt = 1
+                while True:
+                    response, error = None, None
+                    try:
+                        # Send the attempt, timed from its own start, not the backoffs
+                        mark_upstream_start(request)
+                        response = await self._send(request)
+
+                    # Handle a failed attempt, it is classified below
+                    except Exception as e:
+                        error = e
+
+                    # If the attempt succeeded or may not be retried, return it
+                    if not self.policy.should_retry(response, error):
+                        if error is not None:
+                            raise error
+                        return response
+
+                    # Wait a jittered backoff, unless it would pass the deadline
+                    delay = self.policy.backoff(attempt)
+                    if (
+                        attempt >= self.policy.attempts
+                        or loop.time() + delay >= deadline
+                    ):
+                        # Count the exhausted retries
+                        self.policy._exhausted += 1
+
+                        # Return the last response or raise the last error
+                        if error is not None:
+                            raise error
+                        return response
+
+                    # If the attempt got a response, release its connection
+                    if response is not None:
+                        await response.aclose()
+
+                    # Count the retry
+                    self.policy._retries += 1
+                    attempt += 1
+                    await asyncio.sleep(delay)
+
+        # Handle the deadline
+        except TimeoutError:
+            # Count the exhausted retries
+            self.policy._exhausted += 1
+
+            # Raise an error
+            raise httpx.TimeoutException(
+                f"Request deadline of {self.policy.deadline}s exceeded",
+                request=request,
+            ) from None
+
+    # Send one attempt, hedged if the request asks for it
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send one attempt, hedging it past the p95 latency of its path.
+
+        Args:
+            request (httpx.Request): The request
+
+        Returns:
+            httpx.Response: The first successful response
+        """
+
+        # If the request is not hedged, send it
+        if not (
+            self.policy.hedge and request.extensions.get("hedge") and hedging.get()
+        ):
+            return await self.transport.handle_async_request(request)
+
+        # Get the tracker of the path
+        tracker = self.policy.tracker(request.url.path)
+
+        # Send the primary request
+        primary = asyncio.ensure_future(self._timed(request, tracker, hedge=False))
+        tasks = [primary]
+        winner = None
+
+        try:
+            # If the p95 is unknown or the primary finishes in time, return it
+            delay = tracker.quantile(HEDGE_QUANTILE)
+            if delay is None or (await asyncio.wait(tasks, timeout=delay))[0]:
+                winner = primary
+                return await primary
+
+            # Send the hedge request
+            self.policy._hedged += 1
+            tasks.append(
+                asyncio.ensure_future(self._timed(request, tracker, hedge=True))
+            )
+
+            # Return the first response that needs no retry
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in tasks:
+                    if (
+                        task in done
+                        and task.exception() is None
+                        and not self.policy.should_retry(task.result(), None)
+                    ):
+                        # Count the hedge if it won
+                        if task is not primary:
+                            self.policy._hedge_wins += 1
+
+                        winner = task
+                        return task.result()
+
+            # Neither succeeded, prefer a response over an error
+            winner = next((task for task in tasks if task.exception() is None), primary)
+            return winner.result()
+
+        finally:
+            # Stop the other requests, releasing their connections
+            for task in tasks:
+                if task is not winner:
+                    task.cancel()
+            for task in tasks:
+                if task is not winner:
+                    try:
+                        response = await task
+                    except BaseException:
+                        continue
+                    await response.aclose()
+
+    # Send a request and record its latency
+    async def _timed(
+        self, request: httpx.Request, tracker: LatencyTracker, hedge: bool
+    ) -> httpx.Response:
+        """
+        Send a request and record its latency to the response headers.
+
+        Failed requests and primaries cancelled because their hedge won record the time
+        spent so far, a lower bound of their latency. Dropping them would leave only the
+        fast winners in the window, pulling the p95 down and hedging ever more often in
+        a slowdown. Cancelled hedges record nothing, their primary took longer.
+
+        Args:
+            request (httpx.Request): The request
+            tracker (LatencyTracker): The tracker of the request path
+            hedge (bool): Whether the request is the hedge of a slow primary
+
+        Returns:
+            httpx.Response: The response
+        """
+
+        start = time.perf_counter()
+        try:
+            # Send the request
+            response = await self.transport.handle_async_request(request)
+
+        # Handle a request cancelled because the other one won
+        except asyncio.CancelledError:
+            # If it was the primary, record the time it ran for
+            if not hedge:
+                tracker.observe(time.perf_counter() - start)
+            raise
+
+        # Handle a failed request
+        except Exception:
+            # Record the time it took to fail
+            tracker.observe(time.perf_counter() - start)
+            raise
+
+        # Record the latency
+        tracker.observe(time.perf_counter() - start)
+
+        # Return the response
+        return response
+
+    # Close the wrapped transport
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+
+        # Close the transport
+        await self.transport.aclose()
+
+
+# Exports
+__all__ = ["LatencyTracker", "RetryPolicy", "RetryTransport", "hedging"]
@@ -0,0 +1,216 @@
+"""
+Serializer module for open-weather-mcp-server.
+Encodes tool results with orjson or msgspec when installed, falling back to the stdlib json module.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Callable, Dict, Tuple, Union
+
+# Local imports
+from open_weather_mcp_server.utils.settings import settings
+
+# Set constants
+OPEN_WEATHER_JSON_BACKEND = settings.get("OPEN_WEATHER_JSON_BACKEND", "auto").lower()
+OPEN_WEATHER_JSON_COMPACT = settings.get_bool("OPEN_WEATHER_JSON_COMPACT", True)
+
+# Backends in order of preference
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+# Build the stdlib json encode and decode functions
+def _json_backend(compact: bool) -> Tuple[Callable, Callable]:
+    """
+    Build the stdlib json encode and decode functions.
+
+    Args:
+        compact (bool): Whether to drop the whitespace between tokens
+
+    Returns:
+        Tuple[Callable, Callable]: The encode and decode functions
+    """
+
+    # Drop the whitespace and keep non-ASCII characters as-is when compact
+    if compact:
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder()
+
+    # Return the functions
+    return encoder.encode, json.loads
+
+
+# Build the orjson encode and decode functions
+def _orjson_backend(compact: bool) -> Tuple[Callable, Callable]:
+    """
+    Build the orjson encode and decode functions, orjson output is always compact.
+
+    Args:
+        compact (bool): Unused, orjson has no whitespace option
+
+    Returns:
+        Tuple[Callable, Callable]: The encode and decode functions
+    """
+
+    # Third party imports
+    import orjson
+
+    # Return the functions, orjson encodes to UTF-8 bytes
+    return (lambda obj: orjson.dumps(obj).decode()), orjson.loads
+
+
+# Build the msgspec encode and decode functions
+def _msgspec_backend(compact: bool) -> Tuple[Callable, Callable]:
+    """
+    Build the msgspec encode and decode functions, msgspec output is always compact.
+
+    Args:
+        compact (bool): Unused, msgspec has no whitespace option
+
+    Returns:
+        Tuple[Callable, Callable]: The encode and decode functions
+    """
+
+    # Third party imports
+    import msgspec
+
+    # Reuse one encoder and decoder
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    # Return the functions, msgspec encodes to UTF-8 bytes
+    return (lambda obj: encoder.encode(obj).decode()), decoder.decode
+
+
+# Backend builders by name
+_BUILDERS = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _json_backend,
+}
+
+
+# Already encoded JSON document
+class RawJSON(str):
+    """An already encoded JSON document, passed through by the serializer as-is."""
+
+
+# Pluggable JSON serializer
+class Serializer:
+    """
+    Pluggable JSON serializer.
+
+    Attributes:
+        backend (str): The name of the backend in use
+        compact (bool): Whether the output has no whitespace between tokens
+
+    Methods:
+        dumps(obj: Any) -> str: Serialize an object to a JSON string
+        loads(data: Union[str, bytes]) -> Any: Deserialize a JSON string or bytes
+        info() -> Dict[str, Any]: Describe the serializer
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        backend: str = OPEN_WEATHER_JSON_BACKEND,
+        compact: bool = OPEN_WEATHER_JSON_COMPACT,
+    ):
+        """
+        Initialize the serializer.
+
+        Args:
+            backend (str): "auto", "orjson", "msgspec" or "json", "auto" picks the first installed
+            compact (bool): Whether to drop the whitespace between tokens
+
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If the requested backend is not installed
+        """
+
+        # If the backend is unknown
+        if backend != "auto" and backend not in _BUILDERS:
+            # Raise an error
+            raise ValueError(f"Unknown JSON backend {backend}")
+
+        # Set the configuration
+        self.compact = compact
+
+        # Indented output is only available from the stdlib backend
+        candidates = BACKENDS if backend == "auto" else (backend,)
+        if not compact:
+            candidates = ("json",)
+
+        # Use the first backend that imports
+        for name in candidates:
+            try:
+                self._encode, self._decode = _BUILDERS[name](compact)
+                self.backend = name
+                break
+
+            except ImportError:
+                # If the backend was requested explicitly
+                if backend != "auto":
+                    raise
+
+        # Fall back to the stdlib encoder for the types the fast backends reject
+        self._fallback_encode, _ = _json_backend(compact)
+
+    # Serialize an object to a JSON string
+    def dumps(self, obj: Any) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Args:
+            obj (Any): The object to serialize
+
+        Returns:
+            str: The JSON string
+        """
+
+        # Pass already encoded documents through without parsing them
+        if isinstance(obj, RawJSON):
+            return obj
+
+        try:
+            # Encode with the backend
+            return self._encode(obj)
+
+        except TypeError:
+            # Encode with the stdlib, it handles non-string keys and big integers
+            return self._fallback_encode(obj)
+
+    # Deserialize a JSON string or bytes
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Deserialize a JSON string or bytes.
+
+        Args:
+            data (Union[str, bytes]): The JSON document
+
+        Returns:
+            Any: The deserialized object
+        """
+
+        # Unwrap passthrough documents, orjson only accepts exact strings
+        if isinstance(data, RawJSON):
+            data = str(data)
+
+        # Decode with the backend
+        return self._decode(data)
+
+    # Describe the serializer
+    def info(self) -> Dict[str, Any]:
+        """
+        Describe the serializer.
+
+        Returns:
+            Dict[str, Any]: The backend name and compact flag
+        """
+
+        # Return the description
+        return {"backend": self.backend, "compact": self.compact}
+
+
+# Exports
+__all__ = ["BACKENDS", "RawJSON", "Serializer"]
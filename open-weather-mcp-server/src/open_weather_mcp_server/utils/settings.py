@@ -0,0 +1,119 @@
+"""
+Settings module for open-weather-mcp-server.
+Loads the .env file once per process and reads typed settings from the environment.
+"""
+
+# Standard library imports
+import os
+from typing import Optional
+
+# Third party imports
+from dotenv import load_dotenv
+
+# Values read as true by get_bool
+TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+# Settings read from the environment
+class Settings:
+    """
+    Settings read from the environment, with the .env file loaded once when the
+    settings are created. Variables already set in the environment take precedence.
+
+    Methods:
+        get(name: str, default: Optional[str]) -> Optional[str]: Get a string setting
+        get_int(name: str, default: int) -> int: Get an integer setting
+        get_float(name: str, default: float) -> float: Get a float setting
+        get_bool(name: str, default: bool) -> bool: Get a boolean setting
+    """
+
+    # Constructor
+    def __init__(self):
+        """Load the .env file into the environment."""
+
+        # Load environment variables
+        load_dotenv()
+
+    # Get a string setting
+    @staticmethod
+    def get(name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get a string setting.
+
+        Args:
+            name (str): The environment variable
+            default (Optional[str]): The value if the variable is not set
+
+        Returns:
+            Optional[str]: The value
+        """
+
+        # Return the value
+        return os.environ.get(name, default)
+
+    # Get an integer setting
+    def get_int(self, name: str, default: int) -> int:
+        """
+        Get an integer setting.
+
+        Args:
+            name (str): The environment variable
+            default (int): The value if the variable is not set
+
+        Returns:
+            int: The value
+
+        Raises:
+            ValueError: If the variable is not an integer
+        """
+
+        # Return the value
+        return int(self.get(name, default))
+
+    # Get a float setting
+    def get_float(self, name: str, default: float) -> float:
+        """
+        Get a float setting.
+
+        Args:
+            name (str): The environment variable
+            default (float): The value if the variable is not set
+
+        Returns:
+            float: The value
+
+        Raises:
+            ValueError: If the variable is not a number
+        """
+
+        # Return the value
+        return float(self.get(name, default))
+
+    # Get a boolean setting
+    def get_bool(self, name: str, default: bool) -> bool:
+        """
+        Get a boolean setting, "1", "true", "yes" and "on" are true in any case.
+
+        Args:
+            name (str): The environment variable
+            default (bool): The value if the variable is not set
+
+        Returns:
+            bool: The value
+        """
+
+        value = self.get(name)
+
+        # If the variable is not set, return the default
+        if value is None:
+            return default
+
+        # Return the value
+        return value.strip().lower() in TRUE_VALUES
+
+
+# Settings of the process, the .env file is loaded on first import
+settings = Settings()
+
+# Exports
+__all__ = ["Settings", "settings"]
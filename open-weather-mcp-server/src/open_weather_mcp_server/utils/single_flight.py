@@ -0,0 +1,123 @@
+"""
+Single-flight module for open-weather-mcp-server.
+Coalesces identical concurrent tool calls so they share one upstream call.
+"""
+
+# Standard library imports
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+# Result type of the coalesced call
+T = TypeVar("T")
+
+
+# Coalesce identical concurrent calls into one
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls into one.
+
+    Methods:
+        make_key(name: str, arguments: Optional[Dict]) -> str: Build a normalized call key
+        run(key: str, call: Callable[[], Awaitable[T]]) -> T: Run a call, sharing it with identical in-flight calls
+        stats() -> Dict[str, int]: Get the coalescing counters
+    """
+
+    # Constructor
+    def __init__(self):
+        """Initialize the single-flight group."""
+
+        # Initialize the in-flight calls, mapping keys to tasks
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+        # Initialize the counters
+        self._calls = 0
+        self._coalesced = 0
+
+    # Build a normalized call key
+    @staticmethod
+    def make_key(name: str, arguments: Optional[Dict]) -> str:
+        """
+        Build a normalized call key from the tool name and arguments.
+
+        Args:
+            name (str): The name of the tool
+            arguments (Optional[Dict]): The arguments for the tool
+
+        Returns:
+            str: The call key
+        """
+
+        # Return the key, argument order does not matter
+        return f"{name}:{json.dumps(arguments or {}, sort_keys=True, default=str)}"
+
+    # Forget a finished call
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """
+        Forget a finished call and mark its outcome as retrieved.
+
+        Args:
+            key (str): The call key
+            task (asyncio.Task): The finished task
+        """
+
+        # Remove the call if it is still the registered one
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # Mark the exception as retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    # Run a call, sharing it with identical in-flight calls
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call, sharing it with identical in-flight calls.
+
+        Args:
+            key (str): The call key
+            call (Callable[[], Awaitable[T]]): The call to run if none is in flight
+
+        Returns:
+            T: The result of the shared call
+        """
+
+        # Count the call
+        self._calls += 1
+
+        # Get the in-flight call
+        task = self._in_flight.get(key)
+
+        # If an identical call is in flight
+        if task is not None:
+            # Count the coalesced call
+            self._coalesced += 1
+
+        else:
+            # Start the call
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Wait for the shared call, a cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    # Get the coalescing counters
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the coalescing counters.
+
+        Returns:
+            Dict[str, Any]: The coalescing counters
+        """
+
+        # Return the counters
+        return {
+            "calls": self._calls,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Exports
+__all__ = ["SingleFlight"]
@@ -0,0 +1,285 @@
+"""
+Tests for the batch module of open-weather-mcp-server.
+"""
+
+# Standard library imports
+import asyncio
+
+# Third party imports
+import httpx
+import pytest
+
+# Local imports
+from open_weather_mcp_server.utils.batch import run_batch
+from open_weather_mcp_server.utils.circuit_breaker import (
+    CircuitBreakers,
+    CircuitBreakerTransport,
+)
+from open_weather_mcp_server.utils.metrics import UPSTREAM_EVENT_HOOKS
+from open_weather_mcp_server.utils.rate_limiter import (
+    RateLimitExceeded,
+    RateLimitedTransport,
+    RateLimiter,
+    TokenBucket,
+)
+from open_weather_mcp_server.utils.retry import RetryPolicy, RetryTransport
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# Host of the test upstream
+HOST = "upstream.test"
+
+
+# Build a client on the transport chain of create_http_client
+def chain_client(limiter: RateLimiter, requests: list) -> httpx.AsyncClient:
+    """
+    Build a client whose requests go through the breaker, retries and rate limiter to an
+    upstream echoing the coordinates.
+
+    Args:
+        limiter (RateLimiter): The rate limiter
+        requests (list): Collects the requests that reached the upstream
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+
+    # Upstream echoing the coordinates
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=dict(request.url.params))
+
+    # Stack the transports as create_http_client does
+    transport = RateLimitedTransport(httpx.MockTransport(upstream), limiter)
+    transport = RetryTransport(transport, RetryPolicy(hedge=False))
+    transport = CircuitBreakerTransport(transport, CircuitBreakers())
+
+    # Return the client
+    return httpx.AsyncClient(
+        transport=transport,
+        base_url=f"https://{HOST}",
+        event_hooks=UPSTREAM_EVENT_HOOKS,
+    )
+
+
+# Build distinct locations
+def locations(count: int) -> list:
+    """
+    Build distinct locations.
+
+    Args:
+        count (int): Number of locations
+
+    Returns:
+        list: The locations
+    """
+
+    # Return one location per latitude
+    return [{"lat": index, "lon": 0} for index in range(count)]
+
+
+async def test_results_in_input_order():
+    """Results keep the input order, shared keys share a call and errors stay local."""
+
+    calls = []
+
+    # Tool failing at the equator
+    async def call(lat: float, lon: float) -> dict:
+        calls.append((lat, lon))
+        await asyncio.sleep(0.01 * (3 - lat))
+        if lat == 0:
+            raise ValueError("no data")
+        return {"lat": lat}
+
+    results = await run_batch(
+        call,
+        [{"lat": 2, "lon": 0}, {"lat": 0, "lon": 0}, {"lat": 2, "lon": 0}, {"x": 1}],
+        lambda lat, lon: (lat, lon),
+    )
+
+    assert results == [
+        {"lat": 2, "lon": 0, "result": {"lat": 2}},
+        {"lat": 0, "lon": 0, "error": "no data"},
+        {"lat": 2, "lon": 0, "result": {"lat": 2}},
+        {
+            "lat": None,
+            "lon": None,
+            "error": "Location must be an object with numeric lat and lon",
+        },
+    ]
+    assert sorted(calls) == [(0, 0), (2, 0)]
+
+
+async def test_invalid_batches_are_refused():
+    """An empty or oversized list is refused."""
+
+    with pytest.raises(ValueError, match="non-empty list"):
+        await run_batch(None, [], None)
+    with pytest.raises(ValueError, match="At most 2"):
+        await run_batch(None, locations(3), None, max_locations=2)
+
+
+async def test_cached_locations_take_no_budget():
+    """Only locations missing from the cache count against the budget."""
+
+    # Tool answering at once
+    async def call(lat: float, lon: float) -> int:
+        return lat
+
+    # Every location but the first is cached
+    results = await run_batch(
+        call,
+        locations(5),
+        lambda lat, lon: lat,
+        budget=1,
+        cached=lambda key: key > 0,
+    )
+
+    assert [item["result"] for item in results] == [0, 1, 2, 3, 4]
+
+
+async def test_batch_within_the_rate_limit_succeeds():
+    """A batch the rate limit admits completes through the real transport chain."""
+
+    # Five tokens, then a 50 ms token for each of ten queue slots within a second
+    limiter = RateLimiter(rate=20, burst=5, max_queue=10, max_wait=1, hosts={})
+    requests = []
+
+    async with chain_client(limiter, requests) as client:
+        # Function to call the upstream for one location
+        async def call(lat: float, lon: float) -> dict:
+            response = await client.get("/data", params={"lat": lat, "lon": lon})
+            response.raise_for_status()
+            return response.json()
+
+        # Fan out as many locations as the rate limit admits
+        budget = limiter.admissible(HOST)
+        results = await run_batch(
+            call, locations(budget), lambda lat, lon: (lat, lon), budget=budget
+        )
+
+    assert budget == 15
+    assert [item.get("error") for item in results] == [None] * 15
+    assert len(requests) == 15
+
+
+async def test_batch_over_the_rate_limit_is_refused_whole():
+    """A batch the rate limit would partly refuse fails before any request is sent."""
+
+    limiter = RateLimiter(rate=20, burst=5, max_queue=10, max_wait=1, hosts={})
+    requests = []
+
+    async with chain_client(limiter, requests) as client:
+        # Function to call the upstream for one location
+        async def call(lat: float, lon: float) -> dict:
+            response = await client.get("/data", params={"lat": lat, "lon": lon})
+            response.raise_for_status()
+            return response.json()
+
+        # Fan out one location more than the rate limit admits
+        budget = limiter.admissible(HOST)
+        with pytest.raises(RateLimitExceeded, match="16 locations .* admits 15"):
+            await run_batch(
+                call, locations(16), lambda lat, lon: (lat, lon), budget=budget
+            )
+
+    assert requests == []
+
+
+async def test_retry_headroom_is_reserved():
+    """A share of the budget is kept for retries, the batch is refused without it."""
+
+    # Tool answering at once
+    async def call(lat: float, lon: float) -> int:
+        return lat
+
+    # Ten locations and one retry reserved fit eleven tokens
+    results = await run_batch(
+        call, locations(10), lambda lat, lon: lat, budget=11, headroom=0.1
+    )
+    assert len(results) == 10
+
+    # Eleven locations need two more for their retries
+    with pytest.raises(
+        RateLimitExceeded,
+        match="11 locations .* 2 more .* admits 11 now, send at most 10",
+    ):
+        await run_batch(
+            call, locations(11), lambda lat, lon: lat, budget=11, headroom=0.1
+        )
+
+
+async def test_batch_requests_are_not_hedged():
+    """A slow request of a batch is not hedged, a lone one is."""
+
+    requests = []
+
+    # Upstream slower than the observed p95
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200)
+
+    # Warm up the tracker with fast requests
+    policy = RetryPolicy(hedge=True)
+    for _ in range(20):
+        policy.tracker("/data").observe(0.001)
+
+    async with httpx.AsyncClient(
+        transport=RetryTransport(httpx.MockTransport(upstream), policy),
+        base_url=f"https://{HOST}",
+    ) as client:
+        # Function to call the upstream for one location
+        async def call(lat: float, lon: float) -> int:
+            response = await client.get("/data", extensions={"hedge": True})
+            return response.status_code
+
+        # Fan out two locations, then call once alone
+        await run_batch(call, locations(2), lambda lat, lon: lat)
+        assert (len(requests), policy.stats()["hedged"]) == (2, 0)
+        await call(0, 0)
+
+    assert policy.stats()["hedged"] == 1
+    assert len(requests) == 4
+
+
+async def test_admissible_matches_acquire():
+    """The admissible count is exactly what acquire admits when the requests arrive."""
+
+    # Three tokens, then a 100 ms token for each of four queue slots
+    bucket = TokenBucket(rate=10, burst=3, max_queue=4, max_wait=5)
+    assert bucket.admissible() == 7
+
+    # Send one request more than admissible
+    results = await asyncio.gather(
+        *(bucket.acquire() for _ in range(8)), return_exceptions=True
+    )
+
+    assert results[:7] == [None] * 7
+    assert isinstance(results[7], RateLimitExceeded)
+
+
+def test_admissible_is_bounded_by_max_wait():
+    """Requests that would wait past max_wait are not admissible."""
+
+    # One token, then tokens at 100 ms, 200 ms and 300 ms fit in 0.35 s
+    bucket = TokenBucket(rate=10, burst=1, max_queue=100, max_wait=0.35)
+
+    assert bucket.admissible() == 4
+    assert RateLimiter(rate=0, hosts={}).admissible("a.test") is None
+
+
+def test_admissible_without_a_rate():
+    """Without a rate, any number is admissible unless the upstream asked to wait."""
+
+    limiter = RateLimiter(rate=0, max_queue=5, max_wait=1, hosts={})
+    assert limiter.admissible("a.test") is None
+
+    # A pause within max_wait admits a full queue
+    limiter.observe("a.test", 429, {"retry-after": "0.5"})
+    assert limiter.admissible("a.test") == 5
+
+    # A pause past max_wait admits nothing
+    limiter.observe("a.test", 429, {"retry-after": "30"})
+    assert limiter.admissible("a.test") == 0
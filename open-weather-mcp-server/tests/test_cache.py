@@ -0,0 +1,98 @@
+"""
+Tests for the response cache module of open-weather-mcp-server.
+"""
+
+# Standard library imports
+import time
+
+# Local imports
+from open_weather_mcp_server.utils.cache import ResponseCache
+
+
+# Move an entry's expiry into the past
+def expire(cache: ResponseCache, key: tuple, seconds_ago: float) -> None:
+    """
+    Make an entry expire some seconds ago.
+
+    Args:
+        cache (ResponseCache): The cache
+        key (tuple): The cache key
+        seconds_ago (float): Seconds since the entry expired
+    """
+
+    # Rewrite the expiry of the entry
+    cache._entries[key] = (time.monotonic() - seconds_ago, cache._entries[key][1])
+
+
+def test_keys_are_quantized():
+    """Nearby coordinates share a key at the configured precision."""
+
+    cache = ResponseCache(precision=2)
+
+    assert cache.make_key("tool", 51.5074, -0.1278, "metric") == cache.make_key(
+        "tool", 51.5061, -0.1301, "metric"
+    )
+    assert cache.make_key("tool", 51.5074, -0.1278) != cache.make_key(
+        "tool", 51.52, -0.1278
+    )
+
+
+def test_hits_misses_and_eviction():
+    """Responses are served until the least recently used one is evicted."""
+
+    cache = ResponseCache(max_entries=2)
+    cache.set(("a",), 1, ttl=60)
+    cache.set(("b",), 2, ttl=60)
+
+    # Reading a makes b the least recently used
+    assert cache.get(("a",)) == 1
+    cache.set(("c",), 3, ttl=60)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) == 3
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_responses_are_served_stale():
+    """An expired response is a miss but can be served stale until max_stale."""
+
+    cache = ResponseCache(max_stale=60)
+    cache.set(("a",), 1, ttl=60)
+    expire(cache, ("a",), 30)
+
+    assert cache.get(("a",)) is None
+    assert cache.get_stale(("a",)) == 1
+    assert not cache.fresh(("a",))
+    assert cache.ttl_left(("a",)) == 0
+
+    # Past max_stale the entry is dropped
+    expire(cache, ("a",), 90)
+    assert cache.get(("a",)) is None
+    assert cache.get_stale(("a",)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_peeking_counts_nothing():
+    """fresh and ttl_left do not count hits or misses."""
+
+    cache = ResponseCache()
+    cache.set(("a",), 1, ttl=60)
+
+    assert cache.fresh(("a",))
+    assert not cache.fresh(("b",))
+    assert 59 < cache.ttl_left(("a",)) <= 60
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_caching_can_be_disabled():
+    """A TTL of 0 or no entries caches nothing."""
+
+    cache = ResponseCache()
+    cache.set(("a",), 1, ttl=0)
+    empty = ResponseCache(max_entries=0)
+    empty.set(("a",), 1, ttl=60)
+
+    assert cache.get(("a",)) is None
+    assert empty.get(("a",)) is None
@@ -0,0 +1,153 @@
+"""
+Tests for the streamable HTTP endpoint of open-weather-mcp-server.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Dict
+
+# Third party imports
+import httpx
+import pytest
+
+# Local imports
+from open_weather_mcp_server.server import OpenWeatherMCPServer
+from open_weather_mcp_server.tools import current_weather_tool
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Client of the server's streamable HTTP endpoint
+@pytest.fixture
+async def client(monkeypatch):
+    """
+    Serve the server over streamable HTTP in front of a fake OpenWeather API.
+
+    Args:
+        monkeypatch: Sets the API key the tools send
+
+    Yields:
+        httpx.AsyncClient: A client of the app, with the upstream requests in its "upstream" attribute
+    """
+
+    # Set the API key the tools send
+    monkeypatch.setattr(current_weather_tool, "OPEN_WEATHER_API_KEY", "key")
+
+    # Function to answer as the OpenWeather API, with the coordinates it was asked for,
+    # or with an error at the north pole
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        params = request.url.params
+        if params["lat"] == "90":
+            return httpx.Response(401, json={"cod": 401, "message": "Invalid API key"})
+        return httpx.Response(
+            200, json={"coord": {"lat": params["lat"], "lon": params["lon"]}}
+        )
+
+    # Point the server at the fake OpenWeather API
+    requests = []
+    server = OpenWeatherMCPServer()
+    server.http_client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+
+    # Yield the client
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(server.create_app("streamable-http")),
+        base_url="http://test",
+    ) as client:
+        client.upstream = requests
+        yield client
+
+
+# Call a tool over the endpoint
+async def call(
+    client: httpx.AsyncClient, name: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Call a tool with a tools/call POST.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app
+        name (str): The tool name
+        arguments (Dict[str, Any]): The tool arguments
+
+    Returns:
+        Dict[str, Any]: The tool result
+    """
+
+    # Send the request
+    response = await client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        },
+    )
+
+    # Return the result
+    return response.json()["result"]
+
+
+async def test_get_current_weather(client):
+    """The current weather is fetched once, then answered from the response cache."""
+
+    arguments = {"lat": 51.5, "lon": -0.1, "units": "metric"}
+
+    # Call the tool twice
+    first = await call(client, "get-current-weather", arguments)
+    second = await call(client, "get-current-weather", arguments)
+
+    assert first["isError"] is False
+    assert json.loads(first["content"][0]["text"]) == {
+        "coord": {"lat": "51.5", "lon": "-0.1"}
+    }
+    assert second["content"] == first["content"]
+
+    # Only the first call reached the upstream
+    assert len(client.upstream) == 1
+    request = client.upstream[0]
+    assert request.url.path == "/data/2.5/weather"
+    assert request.url.params["units"] == "metric"
+    assert request.url.params["appid"] == "key"
+
+
+async def test_get_current_weather_batch(client):
+    """A batch answers every location, in the order asked."""
+
+    result = await call(
+        client,
+        "get-current-weather-batch",
+        {"locations": [{"lat": 1, "lon": 2}, {"lat": 3, "lon": 4}], "units": "metric"},
+    )
+
+    assert result["isError"] is False
+    assert json.loads(result["content"][0]["text"]) == [
+        {"lat": 1, "lon": 2, "result": {"coord": {"lat": "1", "lon": "2"}}},
+        {"lat": 3, "lon": 4, "result": {"coord": {"lat": "3", "lon": "4"}}},
+    ]
+    assert len(client.upstream) == 2
+
+
+async def test_tool_errors_are_results(client):
+    """An invalid call is answered with an error result, not a JSON-RPC error."""
+
+    result = await call(client, "get-current-weather", {"lat": 91, "lon": 0})
+
+    assert result["isError"] is True
+    assert "Latitude must be between -90 and 90" in result["content"][0]["text"]
+    assert client.upstream == []
+
+
+async def test_failures_are_counted_by_upstream_error(client):
+    """A failed call is counted under the upstream error, not the wrapping Exception."""
+
+    result = await call(client, "get-current-weather", {"lat": 90, "lon": 0})
+    assert result["isError"] is True
+
+    lines = (await client.get("/metrics")).text.splitlines()
+    assert (
+        'mcp_tool_errors_total{tool="get-current-weather",type="HTTPStatusError"} 1'
+        in lines
+    )
@@ -0,0 +1,25 @@
+"""
+Tests for the projection TTLs of open-weather-mcp-server.
+"""
+
+# Local imports
+from open_weather_mcp_server.server import OpenWeatherMCPServer
+
+
+def test_server_caps_projections_at_the_response_cache():
+    """Projections live as long as the cached responses they were made from."""
+
+    server = OpenWeatherMCPServer()
+    key = server.cache.make_key("get-current-weather", 51.5, -0.1, "metric")
+    arguments = {"lat": 51.5, "lon": -0.1, "units": "metric"}
+
+    # Nothing is cached yet, or the response cache is disabled
+    assert server._result_ttl("get-current-weather", arguments) == 0
+
+    # A cached response bounds the projection
+    server.cache.set(key, {}, 30)
+    assert 29 < server._result_ttl("get-current-weather", arguments) <= 30
+
+    # A batch is bounded by the first of its responses to expire
+    batch = {"locations": [arguments, {"lat": 0, "lon": 0}], "units": "metric"}
+    assert server._result_ttl("get-current-weather-batch", batch) == 0
@@ -0,0 +1,138 @@
+"""
+Extraction benchmark for serpapi-google-mcp-server.
+Compares the parse time and peak memory of building a whole SerpApi response, as
+get_dict does, against stream-parsing only the key a tool returns.
+
+Usage:
+    python benchmarks/extract_benchmark.py --number 50
+"""
+
+# Standard library imports
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+# Local imports
+from serializer_benchmark import make_flights, make_properties
+from serpapi_google_mcp_server.utils.extract import extract_key, ijson
+
+
+# Build a full Google Hotels response
+def make_hotels_response() -> Dict[str, Any]:
+    """
+    Build a full response shaped like SerpApi Google Hotels, properties come last.
+
+    Returns:
+        Dict[str, Any]: The response
+    """
+
+    # Return the response
+    return {
+        "search_metadata": {"id": "0" * 24, "status": "Success"},
+        "search_parameters": {"engine": "google_hotels", "q": "Paris"},
+        "search_information": {"total_results": 1000},
+        "brands": [{"id": i, "name": f"Brand {i}"} for i in range(40)],
+        "ads": make_properties(20),
+        "properties": make_properties(20),
+        "serpapi_pagination": {"next_page_token": "1" * 64},
+    }
+
+
+# Build a full Google Flights response
+def make_flights_response() -> Dict[str, Any]:
+    """
+    Build a full response shaped like SerpApi Google Flights, best_flights come first.
+
+    Returns:
+        Dict[str, Any]: The response
+    """
+
+    # Return the response
+    return {
+        "search_metadata": {"id": "0" * 24, "status": "Success"},
+        "search_parameters": {"engine": "google_flights"},
+        "best_flights": make_flights(4),
+        "other_flights": make_flights(80),
+        "price_insights": {"lowest_price": 420, "price_history": [[0, 400]] * 60},
+        "airports": [{"departure": [], "arrival": []}],
+    }
+
+
+# Measure the peak memory allocated by one call
+def peak_allocated(call: Callable[[], Any]) -> int:
+    """
+    Measure the peak memory allocated by one call.
+
+    Args:
+        call (Callable[[], Any]): The call to measure
+
+    Returns:
+        int: Peak allocated bytes
+    """
+
+    # Warm up the call so one-off allocations are not counted
+    call()
+
+    # Trace the call
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Return the peak
+    return peak
+
+
+# Main benchmark
+def main(number: int) -> None:
+    """
+    Benchmark full parsing against extracting the tool's key.
+
+    Args:
+        number (int): Number of parses per run
+    """
+
+    # If the streaming parser is missing, extraction falls back to a full parse
+    if ijson is None:
+        print("ijson is not installed, extraction falls back to a full parse")
+
+    cases = {
+        "get-hotels (properties)": (make_hotels_response(), "properties"),
+        "get-flights (best_flights)": (make_flights_response(), "best_flights"),
+    }
+
+    for name, (response, key) in cases.items():
+        # Encode the response body once, as SerpApi sends it
+        body = json.dumps(response).encode()
+        print(f"\n{name}, {len(body) / 1024:.0f} KiB body")
+
+        paths = {
+            "get_dict (before)": lambda: json.loads(body)[key],
+            "extract_key (after)": lambda: extract_key(body, key)[key],
+        }
+
+        baseline = None
+        for label, call in paths.items():
+            # Time the path, taking the best of a few runs
+            best = min(timeit.repeat(call, number=number, repeat=5)) / number * 1e3
+            baseline = baseline or best
+
+            # Measure the allocations
+            peak = peak_allocated(call)
+            print(
+                f"  {label:<22} {best:8.2f} ms {baseline / best:6.2f}x"
+                f" {peak / 1024:9.1f} KiB peak"
+            )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark SerpApi key extraction")
+    parser.add_argument("--number", type=int, default=50, help="Parses per run")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(args.number)
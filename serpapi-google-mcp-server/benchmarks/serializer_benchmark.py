@@ -0,0 +1,212 @@
+"""
+Serializer benchmark for serpapi-google-mcp-server.
+Compares the encode time and output size of each installed JSON backend against
+the previous json.dumps call, over payloads shaped like SerpApi results.
+
+Usage:
+    python benchmarks/serializer_benchmark.py --number 2000
+    python benchmarks/serializer_benchmark.py --payload recorded_properties.json
+    python benchmarks/serializer_benchmark.py --corpus fixtures/serpapi-google-mcp-server.jsonl.gz
+"""
+
+# Standard library imports
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+# Local imports
+from serpapi_google_mcp_server.utils.fixtures import FixtureCorpus
+from serpapi_google_mcp_server.utils.serializer import BACKENDS, Serializer
+
+
+# Build a list of hotel properties
+def make_properties(count: int) -> list:
+    """
+    Build a list of properties shaped like a SerpApi Google Hotels response.
+
+    Args:
+        count (int): Number of properties
+
+    Returns:
+        list: The properties
+    """
+
+    # Return the properties
+    return [
+        {
+            "type": "hotel",
+            "name": f"Example Hotel {i}",
+            "description": "A comfortable hotel close to the city centre. " * 2,
+            "link": f"https://example.com/hotels/{i}",
+            "gps_coordinates": {"latitude": 48.85 + i / 1000, "longitude": 2.35},
+            "check_in_time": "3:00 PM",
+            "check_out_time": "11:00 AM",
+            "rate_per_night": {"lowest": "€120", "extracted_lowest": 120},
+            "total_rate": {"lowest": "€480", "extracted_lowest": 480},
+            "prices": [
+                {"source": f"Site {j}", "rate_per_night": {"extracted_lowest": 120 + j}}
+                for j in range(3)
+            ],
+            "nearby_places": [
+                {
+                    "name": f"Place {j}",
+                    "transportations": [{"type": "Walking", "duration": "5 min"}],
+                }
+                for j in range(3)
+            ],
+            "hotel_class": "4-star hotel",
+            "extracted_hotel_class": 4,
+            "images": [
+                {
+                    "thumbnail": f"https://example.com/thumbs/{i}/{j}.jpg",
+                    "original_image": f"https://example.com/images/{i}/{j}.jpg",
+                }
+                for j in range(6)
+            ],
+            "overall_rating": 4.3,
+            "reviews": 1520 + i,
+            "amenities": ["Free Wi-Fi", "Air conditioning", "Pool", "Restaurant"],
+            "property_token": f"ChYIq{i:08d}",
+        }
+        for i in range(count)
+    ]
+
+
+# Build a list of flights
+def make_flights(count: int) -> list:
+    """
+    Build a list of flights shaped like SerpApi Google Flights best_flights.
+
+    Args:
+        count (int): Number of flights
+
+    Returns:
+        list: The flights
+    """
+
+    # Return the flights
+    return [
+        {
+            "flights": [
+                {
+                    "departure_airport": {
+                        "name": "Example Departure Airport",
+                        "id": "AAA",
+                        "time": "2025-01-01 08:00",
+                    },
+                    "arrival_airport": {
+                        "name": "Example Arrival Airport",
+                        "id": "BBB",
+                        "time": "2025-01-01 11:30",
+                    },
+                    "duration": 210,
+                    "airplane": "Airbus A321",
+                    "airline": "Example Air",
+                    "airline_logo": "https://example.com/airlines/xa.png",
+                    "travel_class": "Economy",
+                    "flight_number": f"XA {100 + i}",
+                    "extensions": ["Average legroom (30 in)", "Wi-Fi for a fee"],
+                }
+                for _ in range(2)
+            ],
+            "layovers": [{"duration": 75, "name": "Example Hub", "id": "CCC"}],
+            "total_duration": 495,
+            "carbon_emissions": {
+                "this_flight": 305000,
+                "typical_for_this_route": 290000,
+            },
+            "price": 420 + i,
+            "type": "Round trip",
+            "departure_token": "W1siQUFBIiwiMjAyNS0wMS0wMSJdXQ" * 4,
+        }
+        for i in range(count)
+    ]
+
+
+# Time one encode function
+def time_encode(encode: Callable[[Any], str], payload: Any, number: int) -> float:
+    """
+    Time one encode function.
+
+    Args:
+        encode (Callable[[Any], str]): The encode function
+        payload (Any): The payload to encode
+        number (int): Number of encodes per run
+
+    Returns:
+        float: Best time per encode in microseconds
+    """
+
+    # Take the best of a few runs to reduce noise
+    best = min(timeit.repeat(lambda: encode(payload), number=number, repeat=5))
+
+    # Return microseconds per encode
+    return best / number * 1e6
+
+
+# Main benchmark
+def main(payloads: Dict[str, Any], number: int) -> None:
+    """
+    Benchmark every installed backend over every payload.
+
+    Args:
+        payloads (Dict[str, Any]): The payloads by name
+        number (int): Number of encodes per run
+    """
+
+    for name, payload in payloads.items():
+        # Time the previous encode path as the baseline
+        baseline = time_encode(json.dumps, payload, number)
+        size = len(json.dumps(payload).encode())
+        print(f"\n{name}")
+        print(
+            f"  {'json.dumps (before)':<20} {baseline:9.1f} us {1:6.2f}x {size:9d} bytes"
+        )
+
+        for backend in BACKENDS:
+            try:
+                # Build the serializer
+                serializer = Serializer(backend=backend, compact=True)
+
+            except ImportError:
+                # Skip the backends that are not installed
+                print(f"  {backend:<20} not installed")
+                continue
+
+            # Time the serializer
+            elapsed = time_encode(serializer.dumps, payload, number)
+            size = len(serializer.dumps(payload).encode())
+            print(
+                f"  {backend:<20} {elapsed:9.1f} us {baseline / elapsed:6.2f}x"
+                f" {size:9d} bytes"
+            )
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends")
+    parser.add_argument("--number", type=int, default=2000, help="Encodes per run")
+    parser.add_argument("--payload", type=str, help="Recorded JSON payload to use")
+    parser.add_argument("--corpus", type=str, help="Recorded fixtures to use")
+    args = parser.parse_args()
+
+    # Use the recorded payload, the recorded fixtures, or the representative ones
+    if args.payload:
+        with open(args.payload, "rb") as file:
+            payloads = {args.payload: json.load(file)}
+    elif args.corpus:
+        payloads = {
+            fixture["key"]: json.loads(fixture["body"])
+            for fixture in FixtureCorpus(args.corpus).fixtures()
+            if fixture["status_code"] == 200
+        }
+    else:
+        payloads = {
+            "get-hotels (20 properties)": make_properties(20),
+            "get-flights (best_flights)": make_flights(8),
+        }
+
+    # Run the benchmark
+    main(payloads, args.number)
@@ -0,0 +1,207 @@
+"""
+Workers benchmark for serpapi-google-mcp-server.
+Measures tool calls/sec over SSE sessions as the number of worker processes grows,
+with the server talking to a local stub of SerpApi.
+
+Usage:
+    python benchmarks/workers_benchmark.py --workers 1 2 4 --sessions 32 --duration 10
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import List
+
+# Third party imports
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Local imports
+from load_benchmark import StubUpstream, free_port
+
+
+# Drive SSE sessions from one client process
+def drive(url: str, sessions: int, duration: float, offset: int) -> List[float]:
+    """
+    Call get-finance-data in a loop over several SSE sessions.
+
+    Args:
+        url (str): The SSE endpoint
+        sessions (int): Number of concurrent sessions
+        duration (float): Seconds to keep calling
+        offset (int): Offset of the session numbers, so queries differ across processes
+
+    Returns:
+        List[float]: Latency of every call, in seconds
+    """
+
+    latencies: List[float] = []
+
+    # Run one session
+    async def session(number: int, deadline: float) -> None:
+        async with sse_client(url) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as client:
+                await client.initialize()
+
+                # Each session asks for its own query, so calls are not coalesced
+                arguments = {"query": f"query-{number}"}
+                while time.monotonic() < deadline:
+                    start = time.perf_counter()
+                    await client.call_tool("get-finance-data", arguments)
+                    latencies.append(time.perf_counter() - start)
+
+    # Run every session until the deadline
+    async def run() -> None:
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(session(offset + i, deadline) for i in range(sessions)))
+
+    asyncio.run(run())
+
+    # Return the latencies
+    return latencies
+
+
+# Benchmark one worker count
+def measure(
+    workers: int, stub_url: str, clients: int, sessions: int, duration: float
+) -> List[float]:
+    """
+    Start the server with a worker count and load it from several client processes.
+
+    Args:
+        workers (int): Number of worker processes
+        stub_url (str): Base URL of the stub SerpApi
+        clients (int): Number of client processes
+        sessions (int): Total number of SSE sessions
+        duration (float): Seconds to keep calling
+
+    Returns:
+        List[float]: Latency of every call, in seconds
+    """
+
+    # Start the server against the stub, without pacing or result caching, so every
+    # call reaches the stub
+    port = free_port()
+    env = {
+        **os.environ,
+        "SERPAPI_API_KEY": "benchmark",
+        "SERPAPI_BASE_URL": stub_url,
+        "SERPAPI_PROBE_URL": stub_url,
+        "SERPAPI_RATE_LIMIT": "0",
+        "SERPAPI_CACHE_ENABLED": "false",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from serpapi_google_mcp_server import main; main()",
+            "--host=127.0.0.1",
+            f"--port={port}",
+            f"--workers={workers}",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        # Wait for the server
+        base_url = f"http://127.0.0.1:{port}"
+        for _ in range(600):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.HTTPError:
+                time.sleep(0.05)
+
+        # Spread the sessions over the client processes
+        per_client = [
+            sessions // clients + (i < sessions % clients) for i in range(clients)
+        ]
+        jobs = [
+            (f"{base_url}/sse", count, duration, sum(per_client[:i]))
+            for i, count in enumerate(per_client)
+            if count
+        ]
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.starmap(drive, jobs)
+
+    finally:
+        # Stop the server, killing it if open streams hold up the shutdown
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    # Return every latency
+    return [latency for result in results for latency in result]
+
+
+# Main benchmark
+def main(workers: List[int], clients: int, sessions: int, duration: float) -> None:
+    """
+    Benchmark tool calls/sec for each worker count.
+
+    Args:
+        workers (List[int]): Worker counts to measure
+        clients (int): Number of client processes
+        sessions (int): Total number of SSE sessions
+        duration (float): Seconds to keep calling per worker count
+    """
+
+    # Start the stub SerpApi on a free port, answering at once and without errors
+    stub = StubUpstream(latency=0, sigma=0, error_rate=0, seed=0)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    stub_url = stub.url()
+
+    # Report the setup
+    print(
+        f"cpus={os.cpu_count()} clients={clients} sessions={sessions}"
+        f" duration={duration:g}s"
+    )
+
+    baseline = None
+    try:
+        for count in workers:
+            # Measure the worker count
+            latencies = measure(count, stub_url, clients, sessions, duration)
+            rate = len(latencies) / duration
+            baseline = baseline or rate
+
+            # Report the results
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"workers={count:<3} {rate:9.1f} calls/s {rate / baseline:6.2f}x"
+                f"  p50={quantiles[49] * 1e3:7.1f} ms p99={quantiles[98] * 1e3:7.1f} ms"
+            )
+
+    finally:
+        # Clean up
+        stub.shutdown()
+
+
+# Entry point
+if __name__ == "__main__":
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker serving")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts"
+    )
+    parser.add_argument(
+        "--clients", type=int, default=os.cpu_count(), help="Client processes"
+    )
+    parser.add_argument("--sessions", type=int, default=32, help="SSE sessions")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per run")
+    args = parser.parse_args()
+
+    # Run the benchmark
+    main(args.workers, args.clients, args.sessions, args.duration)
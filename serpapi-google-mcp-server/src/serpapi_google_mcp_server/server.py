@@ -1,39 +1,70 @@
 # Standard library imports
 import argparse
-import json
-from typing import Dict, List, Optional, Union
+import functools
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 # Third party imports
 import mcp.types as types
 import uvicorn
-from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 
 # Import health routes
 from serpapi_google_mcp_server.health import health_routes
-from serpapi_google_mcp_server.tools import (
-    get_events,
-    get_finance_data,
-    get_flights,
-    get_hotels,
-    get_jobs,
-    get_places,
-    get_shopping,
-)
 
-# Local imports
-from serpapi_google_mcp_server.utils.logger import get_logger
+# Import tools, each tool module is loaded when its tool is first called
+from serpapi_google_mcp_server import tools
 
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.circuit_breaker import CircuitBreakers
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.fixtures import SERPAPI_FIXTURES_MODE
+from serpapi_google_mcp_server.utils.logger import (
+    configure_uvicorn_logging,
+    get_logger,
+    log_stats,
+)
+from serpapi_google_mcp_server.utils.result_cache import (
+    SERPAPI_CACHE_ENABLED,
+    ResultCache,
+)
+from serpapi_google_mcp_server.utils.metrics import CONTENT_TYPE, Metrics, current_tool
+from serpapi_google_mcp_server.utils.projection import (
+    FIELDS_SCHEMA,
+    Fields,
+    ProjectionCache,
+    parse_fields,
+    project,
+)
+from serpapi_google_mcp_server.utils.rate_limiter import RateLimiter
+from serpapi_google_mcp_server.utils.readiness import Readiness, UpstreamProbe
+from serpapi_google_mcp_server.utils.retry import RetryPolicy
+from serpapi_google_mcp_server.utils.serializer import Serializer
+from serpapi_google_mcp_server.utils.single_flight import SingleFlight
+from serpapi_google_mcp_server.utils.streamable_http import StreamableHTTPTransport
+from serpapi_google_mcp_server.utils.tool_catalog import ToolCatalog
+from serpapi_google_mcp_server.utils.workers import run_workers
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# SerpApi engine each tool searches
+TOOL_ENGINES = {
+    "get-events": "google_events",
+    "get-finance-data": "google_finance",
+    "get-flights": "google_flights",
+    "get-hotels": "google_hotels",
+    "get-jobs": "google_jobs",
+    "get-places": "google_local",
+    "get-shopping": "google_shopping",
+}
+
 
 # SerpAPI Google MCP Server
 class SerpAPIGoogleMCPServer:
@@ -44,6 +75,41 @@ class SerpAPIGoogleMCPServer:
         # Initialize the server
         self.server = Server("serpapi-google-mcp-server")
 
+        # Initialize the serializer for tool results and cached searches
+        self.serializer = Serializer()
+
+        # Initialize the shared search executor with the persistent result cache
+        self.executor = SearchExecutor(
+            cache=(
+                ResultCache(serializer=self.serializer)
+                if SERPAPI_CACHE_ENABLED
+                else None
+            ),
+            rate_limiter=RateLimiter(),
+            retry_policy=RetryPolicy(),
+            circuit_breakers=CircuitBreakers(),
+        )
+
+        # Initialize the single-flight group for identical concurrent calls
+        self.single_flight = SingleFlight()
+
+        # Initialize the cache of slim projections, kept apart from full results
+        self.projection_cache = ProjectionCache()
+
+        # Build the tool list once, it never changes at runtime
+        self.tool_catalog = ToolCatalog(self._build_tools())
+
+        # Allocate the metrics of every tool once
+        self.metrics = Metrics(tool.name for tool in self.tool_catalog.tools)
+
+        # Initialize the readiness, measured in the background while the app runs,
+        # the upstream is not probed while fixtures are replayed
+        self.readiness = Readiness(
+            probe=(
+                UpstreamProbe(interval=0) if SERPAPI_FIXTURES_MODE == "replay" else None
+            )
+        )
+
         # Register handlers
         self._register_handlers()
 
@@ -52,12 +118,67 @@ class SerpAPIGoogleMCPServer:
         """Register the handlers for the Weather MCP Server."""
 
         # Tools handlers
-        self.server.list_tools()(self.handle_list_tools)
+        self.server.request_handlers[types.ListToolsRequest] = (
+            self.tool_catalog.handle_list_tools
+        )
         self.server.call_tool()(self.handle_call_tool)
 
-    # Method to handle list tools
-    async def handle_list_tools(self) -> List[types.Tool]:
-        """Handle the list tools request.
+    # Method to manage the application lifespan
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """Manage the application lifespan.
+
+        Args:
+            app (Starlette): The Starlette application.
+
+        Yields:
+            None: Control back to the application while it is running.
+        """
+
+        # Log the executor configuration
+        logger.info(
+            f"SerpApi search executor started with {self.executor.max_workers} workers"
+        )
+
+        # Log the serializer backend
+        logger.info(f"JSON serializer: {self.serializer.info()}")
+
+        # Start measuring the event loop lag and probing the upstream
+        self.readiness.start()
+
+        try:
+            # Run the application
+            yield
+
+        finally:
+            # Stop the readiness monitors
+            await self.readiness.stop()
+
+            # Log the coalescing and cost counters
+            logger.info(f"Single-flight stats: {self.single_flight.stats()}")
+
+            # Log the projection cache counters
+            logger.info(f"Projection cache stats: {self.projection_cache.stats()}")
+
+            # Log the rate limiter counters
+            logger.info(f"Rate limiter stats: {self.executor.rate_limiter.stats()}")
+
+            # Log the retry counters
+            logger.info(f"Retry stats: {self.executor.retry_policy.stats()}")
+
+            # Log the circuit breaker counters
+            logger.info(
+                f"Circuit breaker stats: {self.executor.circuit_breakers.stats()}"
+            )
+            if self.executor.cache is not None:
+                logger.info(f"Result cache stats: {self.executor.cache.stats()}")
+
+            # Shut down the search executor
+            self.executor.shutdown()
+
+    # Method to build the tool definitions
+    def _build_tools(self) -> List[types.Tool]:
+        """Build the tool definitions, called once at startup.
 
         Returns:
             List[types.Tool]: The list of tools.
@@ -79,6 +200,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "number",
                             "description": "Page number to return",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["query", "page"],
                 },
@@ -93,6 +215,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "string",
                             "description": "Query to search for",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["query"],
                 },
@@ -186,6 +309,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "number",
                             "description": "Maximum price",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": [
                         "departure_id",
@@ -292,6 +416,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "number",
                             "description": "Number of bathrooms",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": [
                         "query",
@@ -327,6 +452,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "string",
                             "description": "Location",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["query", "location"],
                 },
@@ -345,6 +471,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "string",
                             "description": "Location",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["query", "location"],
                 },
@@ -359,6 +486,7 @@ class SerpAPIGoogleMCPServer:
                             "type": "string",
                             "description": "Query to search for",
                         },
+                        "fields": FIELDS_SCHEMA,
                     },
                     "required": ["query"],
                 },
@@ -378,8 +506,124 @@ class SerpAPIGoogleMCPServer:
         Returns:
             List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
         """
+
+        # Get the metrics of the tool and time the call against them
+        tool = self.metrics.tool(name)
+        token = current_tool.set(tool)
+        start = tool.start()
+
+        try:
+            # Handle the call
+            content = await self._handle_call_tool(name, arguments)
+
+        # Handle any exception, including cancellation
+        except BaseException as e:
+            # Record the failure
+            tool.fail(start, e)
+            raise
+
+        finally:
+            # Stop attributing upstream requests to the tool
+            current_tool.reset(token)
+
+        # Record the call
+        tool.finish(start, len(content[0].text))
+
+        # Return the content
+        return content
+
+    # Method to handle call tool without metrics
+    async def _handle_call_tool(
+        self, name: str, arguments: Optional[Dict]
+    ) -> List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]:
+        """Handle the call tool request, coalescing calls and serving cached projections.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Optional[Dict]): The arguments for the tool.
+
+        Returns:
+            List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
+        """
+
         # Default to empty dict if arguments is None
-        arguments = arguments or {}
+        arguments = dict(arguments or {})
+
+        # Split off the projection, it applies to the result rather than the tool
+        fields = parse_fields(arguments.pop("fields", None))
+
+        # Build the call key, equal projections share it
+        key = self.single_flight.make_key(name, {**arguments, "fields": fields})
+
+        # If a slim projection of this call is cached
+        if fields and (text := self.projection_cache.get(key)) is not None:
+            # Return the cached projection
+            return [types.TextContent(type="text", text=text)]
+
+        # Share one upstream call between identical concurrent calls
+        return await self.single_flight.run(
+            key, lambda: self._respond(name, arguments, fields, key)
+        )
+
+    # Method to call a tool and serialize its result
+    async def _respond(
+        self, name: str, arguments: Dict, fields: Optional[Fields], key: str
+    ) -> List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]:
+        """Call a tool, project its result onto the requested fields and serialize it.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Dict): The arguments for the tool, without the fields.
+            fields (Optional[Fields]): The parsed projection, or None for the full result.
+            key (str): The call key, used to cache the projection.
+
+        Returns:
+            List[Union[types.TextContent, types.ImageContent, types.EmbeddedResource]]: The list of content items.
+        """
+
+        # Call the tool
+        result = await self._call_tool(name, arguments)
+
+        # Project the result before serializing it
+        text = self.serializer.dumps(project(result, fields))
+
+        # If a projection was requested
+        if fields:
+            # Cache the slim projection, for no longer than the search results
+            self.projection_cache.set(key, text, self._result_ttl(name))
+
+        # Return the content
+        return [types.TextContent(type="text", text=text)]
+
+    # Method to get how long the search results of a tool are cached
+    def _result_ttl(self, name: str) -> float:
+        """Get the seconds the result cache keeps the search results of a tool.
+
+        Args:
+            name (str): The name of the tool.
+
+        Returns:
+            float: The TTL of the tool's engine, 0 if its results are not cached.
+        """
+
+        # If the result cache is disabled or the tool unknown, nothing is cached
+        if self.executor.cache is None or name not in TOOL_ENGINES:
+            return 0.0
+
+        # Return the TTL of the tool's engine
+        return ResultCache.ttl(TOOL_ENGINES[name])
+
+    # Method to call a tool
+    async def _call_tool(self, name: str, arguments: Dict) -> Any:
+        """Call a tool without request coalescing or serialization.
+
+        Args:
+            name (str): The name of the tool.
+            arguments (Dict): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool.
+        """
 
         # Match the name of the tool
         match name:
@@ -394,10 +638,12 @@ class SerpAPIGoogleMCPServer:
                 page = arguments.get("page", 1)
 
                 # Call the function with extracted parameters
-                result = await get_events(query=query, page=page)
+                result = await tools.get_events(
+                    executor=self.executor, query=query, page=page
+                )
 
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get finance data
             case "get-finance-data":
@@ -410,10 +656,12 @@ class SerpAPIGoogleMCPServer:
                     raise ValueError("Query is required for get-finance-data")
 
                 # Call the function with extracted parameters
-                result = await get_finance_data(query=query)
+                result = await tools.get_finance_data(
+                    executor=self.executor, query=query
+                )
 
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get flights
             case "get-flights":
@@ -444,7 +692,8 @@ class SerpAPIGoogleMCPServer:
                 max_price = arguments.get("max_price")
 
                 # Call the function with extracted parameters
-                result = await get_flights(
+                result = await tools.get_flights(
+                    executor=self.executor,
                     departure_id=departure_id,
                     arrival_id=arrival_id,
                     outbound_date=outbound_date,
@@ -461,7 +710,7 @@ class SerpAPIGoogleMCPServer:
                     bags=bags,
                     max_price=max_price,
                 )
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get hotels
             case "get-hotels":
@@ -493,7 +742,8 @@ class SerpAPIGoogleMCPServer:
                 bathrooms = arguments.get("bathrooms")
 
                 # Call the function with extracted parameters
-                result = await get_hotels(
+                result = await tools.get_hotels(
+                    executor=self.executor,
                     query=query,
                     check_in_date=check_in_date,
                     check_out_date=check_out_date,
@@ -511,7 +761,7 @@ class SerpAPIGoogleMCPServer:
                     bedrooms=bedrooms,
                     bathrooms=bathrooms,
                 )
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get jobs
             case "get-jobs":
@@ -527,10 +777,12 @@ class SerpAPIGoogleMCPServer:
                 location = arguments.get("location")
 
                 # Call the function with extracted parameters
-                result = await get_jobs(query=query, location=location)
+                result = await tools.get_jobs(
+                    executor=self.executor, query=query, location=location
+                )
 
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get places
             case "get-places":
@@ -546,10 +798,12 @@ class SerpAPIGoogleMCPServer:
                 location = arguments.get("location")
 
                 # Call the function with extracted parameters
-                result = await get_places(query=query, location=location)
+                result = await tools.get_places(
+                    executor=self.executor, query=query, location=location
+                )
 
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Get shopping
             case "get-shopping":
@@ -562,21 +816,128 @@ class SerpAPIGoogleMCPServer:
                     raise ValueError("Query is required for get-shopping")
 
                 # Call the function with extracted parameters
-                result = await get_shopping(query=query)
+                result = await tools.get_shopping(executor=self.executor, query=query)
 
                 # Return the result
-                return [types.TextContent(type="text", text=json.dumps(result))]
+                return result
 
             # Default
             case _:
                 raise ValueError(f"Tool {name} not found")
 
-    # Method to run the server
-    def run(self):
-        """Run the server."""
+    # Method to serve the metrics
+    async def handle_metrics(self, request: Request) -> Response:
+        """Serve the metrics in the Prometheus text format.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The exposition text.
+        """
+
+        # Get the component counters
+        stats = {
+            "executor": self.executor.stats(),
+            "single_flight": self.single_flight.stats(),
+            "projection_cache": self.projection_cache.stats(),
+            "rate_limiter": self.executor.rate_limiter.stats(),
+            "retry": self.executor.retry_policy.stats(),
+            "circuit_breaker": self.executor.circuit_breakers.stats(),
+            "logging": log_stats(),
+        }
+
+        # If a result cache is configured, query its counters off the event loop
+        if self.executor.cache is not None:
+            stats["result_cache"] = await asyncio.to_thread(self.executor.cache.stats)
+
+        # Render the tool metrics with the component counters
+        text = self.metrics.render(stats)
+
+        # Return the metrics
+        return Response(text, media_type=CONTENT_TYPE)
+
+    # Method to serve the circuit breaker states
+    async def handle_circuits(self, request: Request) -> JSONResponse:
+        """Serve the state of every circuit breaker.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            JSONResponse: The states, "degraded" while any circuit is not closed.
+        """
+
+        # Get the states
+        circuits = self.executor.circuit_breakers.states()
+
+        # Return the states
+        return JSONResponse(
+            {
+                "status": (
+                    "ok"
+                    if all(state == "closed" for state in circuits.values())
+                    else "degraded"
+                ),
+                "circuits": circuits,
+            }
+        )
+
+    # Method to judge readiness
+    def ready_report(self) -> Tuple[bool, Dict[str, Any]]:
+        """Judge readiness from figures measured in the background.
+
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Whether the replica is ready, and the report.
+        """
+
+        # Get the lookup counters of the caches, the result cache is not queried
+        caches = {"projection_cache": self.projection_cache.stats()}
+        if self.executor.cache is not None:
+            caches["result_cache"] = self.executor.cache.lookups()
+
+        # Judge readiness, the upstream is not contacted
+        return self.readiness.report(
+            in_flight=self.metrics.in_flight(),
+            pool=self.executor.pool_stats(),
+            caches=caches,
+        )
+
+    # Method to serve the readiness
+    async def handle_ready(self, request: Request) -> JSONResponse:
+        """Serve the readiness of the replica from figures measured in the background.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            JSONResponse: The readiness report, 200 when ready and 503 when not.
+        """
+
+        # Judge readiness
+        ready, report = self.ready_report()
+
+        # Return the report
+        return JSONResponse(report, status_code=200 if ready else 503)
+
+    # Method to build the app
+    def create_app(
+        self, transport: str = "sse", debug: bool = False, root_path: str = ""
+    ) -> Starlette:
+        """
+        Build the Starlette app.
+
+        Args:
+            transport (str): Serve "sse", "streamable-http" or "both"
+            debug (bool): Debug mode
+            root_path (str): Path prefix the app is mounted under, for the message endpoint sent to SSE clients
+
+        Returns:
+            Starlette: The app
+        """
 
         # Initialize the server
-        sse = SseServerTransport("/messages/")
+        sse = SseServerTransport(f"{root_path}/messages/")
 
         # Function to handle the SSE
         async def handle_sse(request: Request) -> None:
@@ -592,6 +953,57 @@ class SerpAPIGoogleMCPServer:
                     self.server.create_initialization_options(),
                 )
 
+        # Initialize the transport routes
+        transport_routes = []
+
+        # If the SSE transport is enabled
+        if transport in ("sse", "both"):
+            # SSE routes
+            transport_routes += [
+                Route("/sse", endpoint=handle_sse),
+                Mount("/messages/", app=sse.handle_post_message),
+            ]
+
+        # If the streamable HTTP transport is enabled
+        if transport in ("streamable-http", "both"):
+            # Stateless streamable HTTP route, any worker can answer any request
+            streamable_http = StreamableHTTPTransport(self.server)
+            transport_routes.append(
+                Route(
+                    "/mcp",
+                    endpoint=streamable_http.handle,
+                    methods=["GET", "POST", "DELETE"],
+                )
+            )
+
+        # Return the Starlette app
+        return Starlette(
+            debug=debug,
+            lifespan=self.lifespan,
+            routes=[
+                # Transport routes
+                *transport_routes,
+                # Tool list route, versioned with an ETag
+                Route(
+                    "/tools", endpoint=self.tool_catalog.handle_http, methods=["GET"]
+                ),
+                # Add health routes
+                *health_routes,
+                # Circuit breaker states route
+                Route(
+                    "/health/circuits", endpoint=self.handle_circuits, methods=["GET"]
+                ),
+                # Readiness route, for routing traffic away from an overloaded replica
+                Route("/ready", endpoint=self.handle_ready, methods=["GET"]),
+                # Metrics route, in the Prometheus text format
+                Route("/metrics", endpoint=self.handle_metrics, methods=["GET"]),
+            ],
+        )
+
+    # Method to run the server
+    def run(self):
+        """Run the server."""
+
         # Initialize the parser
         parser = argparse.ArgumentParser(
             description="Run the SerpAPI Google MCP Server"
@@ -603,25 +1015,81 @@ class SerpAPIGoogleMCPServer:
         )
         parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
         parser.add_argument("--debug", type=bool, default=False, help="Debug mode")
+        parser.add_argument(
+            "--transport",
+            type=str,
+            choices=["sse", "streamable-http", "both"],
+            default="sse",
+            help="Serve SSE at /sse, stateless streamable HTTP at /mcp, or both",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes, SSE sessions stay on the worker that opened them",
+        )
 
         # Parse the arguments
         args = parser.parse_args()
 
-        # Initiailze the Starlette app
-        starlette_app = Starlette(
-            debug=args.debug,
-            routes=[
-                # SSE route
-                Route("/sse", endpoint=handle_sse),
-                Mount("/messages/", app=sse.handle_post_message),
-                # Add health routes
-                *health_routes,
-            ],
-        )
+        # If several workers are requested
+        if args.workers > 1:
+            # Run the workers behind a session-affine front process
+            run_workers(
+                f"{__name__}:get_server",
+                args.workers,
+                args.host,
+                args.port,
+                args.transport,
+                args.debug,
+            )
+            return
+
+        # Route the uvicorn logs through the log thread
+        configure_uvicorn_logging()
 
         # Run the server
-        uvicorn.run(starlette_app, host=args.host, port=args.port)
+        uvicorn.run(
+            self.create_app(args.transport, args.debug),
+            host=args.host,
+            port=args.port,
+            log_config=None,
+        )
+
+
+# Get the server
+@functools.cache
+def get_server() -> SerpAPIGoogleMCPServer:
+    """Get the SerpAPI Google MCP Server, built on the first call and shared afterwards.
+
+    Building it creates its HTTP client, caches and metrics, so importing this module
+    stays cheap and a process that never serves builds none of them.
+
+    Returns:
+        SerpAPIGoogleMCPServer: The server.
+    """
+
+    # Build the server
+    return SerpAPIGoogleMCPServer()
+
+
+# Get the server as a module attribute
+def __getattr__(name: str) -> Any:
+    """Build the server when the server attribute is first read.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The server.
+
+    Raises:
+        AttributeError: For any other name.
+    """
 
+    # The server is built on first use
+    if name == "server":
+        return get_server()
 
-# Initialize the SerpAPI Google MCP Server
-server = SerpAPIGoogleMCPServer()
+    # Raise an error for any other name
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,50 @@
-# Import tools
-from serpapi_google_mcp_server.tools.events_tool import get_events
-from serpapi_google_mcp_server.tools.finance_tool import get_finance_data
-from serpapi_google_mcp_server.tools.flights_tool import get_flights
-from serpapi_google_mcp_server.tools.hotels_tool import get_hotels
-from serpapi_google_mcp_server.tools.jobs_tool import get_jobs
-from serpapi_google_mcp_server.tools.places_tool import get_places
-from serpapi_google_mcp_server.tools.shopping_tool import get_shopping
-
-# Exports
+# Standard library imports
+import importlib
+from typing import Any
+
+# Module of each tool, imported when the tool is first used
+TOOL_MODULES = {
+    "get_events": "events_tool",
+    "get_finance_data": "finance_tool",
+    "get_flights": "flights_tool",
+    "get_hotels": "hotels_tool",
+    "get_jobs": "jobs_tool",
+    "get_places": "places_tool",
+    "get_shopping": "shopping_tool",
+}
+
+
+# Import a tool on first use
+def __getattr__(name: str) -> Any:
+    """
+    Import a tool from its module on first use and keep it on the package.
+
+    Args:
+        name (str): The tool function name
+
+    Returns:
+        Any: The tool function
+
+    Raises:
+        AttributeError: If the name is not a tool
+    """
+
+    # If the name is not a tool
+    if name not in TOOL_MODULES:
+        # Raise an error
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import the module of the tool
+    tool = getattr(importlib.import_module(f"{__name__}.{TOOL_MODULES[name]}"), name)
+
+    # Keep the tool on the package, later lookups skip this function
+    globals()[name] = tool
+
+    # Return the tool
+    return tool
+
+
+# Export tools
 __all__ = [
     "get_events",
     "get_finance_data",
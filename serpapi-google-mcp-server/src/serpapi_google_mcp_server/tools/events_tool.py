@@ -1,24 +1,23 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List, Optional
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get events
-async def get_events(query: str, page: Optional[int] = 1) -> List[Dict[str, Any]]:
+async def get_events(
+    executor: SearchExecutor, query: str, page: Optional[int] = 1
+) -> List[Dict[str, Any]]:
     """
     Get events from SerpApi.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): The query to search for
         page (Optional[int]): The page number to return. Defaults to 1.
 
@@ -35,7 +34,7 @@ async def get_events(query: str, page: Optional[int] = 1) -> List[Dict[str, Any]
     }
 
     # Get events
-    results = GoogleSearch(params).get_dict()["events_results"]
+    results = (await executor.search(params, key="events_results"))["events_results"]
 
     # Return events
     return results
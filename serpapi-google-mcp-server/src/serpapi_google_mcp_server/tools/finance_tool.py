@@ -1,24 +1,21 @@
 # Standard library imports
-import os
 from typing import Any, Dict
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get finance data
-async def get_finance_data(query: str) -> Dict[str, Any]:
+async def get_finance_data(executor: SearchExecutor, query: str) -> Dict[str, Any]:
     """
     Get finance data from SerpApi.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): The finance query to search for
 
     Returns:
@@ -33,7 +30,7 @@ async def get_finance_data(query: str) -> Dict[str, Any]:
     }
 
     # Get finance data
-    results = GoogleSearch(params).get_dict()["summary"]
+    results = (await executor.search(params, key="summary"))["summary"]
 
     # Return finance data
     return results
@@ -1,20 +1,17 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List, Optional
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get flights
 async def get_flights(
+    executor: SearchExecutor,
     departure_id: str,
     arrival_id: str,
     outbound_date: str,
@@ -35,6 +32,7 @@ async def get_flights(
     Get flight information from SerpApi.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         departure_id (str): Departure airport ID (e.g., "CDG,ORY" for Paris airports)
         arrival_id (str): Arrival airport ID (e.g., "LAX" for Los Angeles)
         outbound_date (str): Outbound date in YYYY-MM-DD format
@@ -102,7 +100,7 @@ async def get_flights(
     params.update({k: v for k, v in optional_params.items() if v is not None})
 
     # Get flights
-    results = GoogleSearch(params).get_dict()["best_flights"]
+    results = (await executor.search(params, key="best_flights"))["best_flights"]
 
     # Return flights
     return results
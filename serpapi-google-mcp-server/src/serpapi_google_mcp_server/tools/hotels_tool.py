@@ -1,20 +1,17 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List, Optional, Union
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get hotels
 async def get_hotels(
+    executor: SearchExecutor,
     query: str,
     check_in_date: str,
     check_out_date: str,
@@ -36,6 +33,7 @@ async def get_hotels(
     Get hotel information from SerpApi.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): Search query for hotels (e.g., "Bali Resorts")
         check_in_date (str): Check-in date in YYYY-MM-DD format
         check_out_date (str): Check-out date in YYYY-MM-DD format
@@ -100,7 +98,7 @@ async def get_hotels(
     params.update({k: v for k, v in optional_params.items() if v is not None})
 
     # Get hotels
-    results = GoogleSearch(params).get_dict()["properties"]
+    results = (await executor.search(params, key="properties"))["properties"]
 
     # Return hotels
     return results
@@ -1,20 +1,17 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List, Optional
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get jobs
 async def get_jobs(
+    executor: SearchExecutor,
     query: str,
     location: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
@@ -22,6 +19,7 @@ async def get_jobs(
     Get job listings from SerpApi's Google Jobs engine.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): Job search query (e.g., "barista new york" or "software engineer")
         location (Optional[str]): Location for job search (e.g., "New York, NY")
 
@@ -42,7 +40,7 @@ async def get_jobs(
         params["location"] = location
 
     # Get jobs
-    results = GoogleSearch(params).get_dict()["jobs_results"]
+    results = (await executor.search(params, key="jobs_results"))["jobs_results"]
 
     # Return jobs
     return results
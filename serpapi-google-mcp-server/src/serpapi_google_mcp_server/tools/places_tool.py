@@ -1,20 +1,17 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List, Optional
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get places
 async def get_places(
+    executor: SearchExecutor,
     query: str,
     location: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
@@ -22,6 +19,7 @@ async def get_places(
     Get local place listings from SerpApi's Google Local engine.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): Search query for places (e.g., "Coffee" or "Restaurants")
         location (Optional[str]): Location for place search (e.g., "Austin, Texas, United States")
 
@@ -42,7 +40,7 @@ async def get_places(
         params["location"] = location
 
     # Get places
-    results = GoogleSearch(params).get_dict()["local_results"]
+    results = (await executor.search(params, key="local_results"))["local_results"]
 
     # Return places
     return results
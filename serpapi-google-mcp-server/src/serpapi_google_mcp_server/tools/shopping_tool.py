@@ -1,26 +1,24 @@
 # Standard library imports
-import os
 from typing import Any, Dict, List
 
-# Third party imports
-from dotenv import load_dotenv
-from serpapi import GoogleSearch
-
-# Load environment variables
-load_dotenv()
+# Local imports
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.settings import settings
 
 # Set constants
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+SERPAPI_API_KEY = settings.get("SERPAPI_API_KEY")
 
 
 # Function to get shopping results
 async def get_shopping(
+    executor: SearchExecutor,
     query: str,
 ) -> List[Dict[str, Any]]:
     """
     Get shopping results from SerpApi's Google Shopping engine.
 
     Args:
+        executor (SearchExecutor): The shared SerpApi search executor
         query (str): Search query for products (e.g., "Macbook M3" or "Nike shoes")
 
     Returns:
@@ -35,7 +33,9 @@ async def get_shopping(
     }
 
     # Get shopping results
-    results = GoogleSearch(params).get_dict()["shopping_results"]
+    results = (await executor.search(params, key="shopping_results"))[
+        "shopping_results"
+    ]
 
     # Return shopping results
     return results
@@ -0,0 +1,533 @@
+"""
+Search executor module for serpapi-google-mcp-server.
+Runs the blocking SerpApi client on a bounded thread pool so searches never stall the event loop.
+"""
+
+# Standard library imports
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Local imports
+from serpapi_google_mcp_server.utils.circuit_breaker import (
+    FAILURE_STATUS_CODES,
+    NO_TOOL,
+    CircuitBreakers,
+    CircuitOpenError,
+)
+from serpapi_google_mcp_server.utils.extract import extract_key
+from serpapi_google_mcp_server.utils.fixtures import (
+    SERPAPI_FIXTURES_MODE,
+    SERPAPI_FIXTURES_PATH,
+    FixtureCorpus,
+    FixtureNotFoundError,
+)
+from serpapi_google_mcp_server.utils.metrics import current_tool, observe_upstream
+from serpapi_google_mcp_server.utils.rate_limiter import RateLimiter, RateLimitExceeded
+from serpapi_google_mcp_server.utils.result_cache import ResultCache
+from serpapi_google_mcp_server.utils.retry import RetryPolicy
+from serpapi_google_mcp_server.utils.settings import settings
+
+# Set constants
+SERPAPI_BASE_URL = settings.get("SERPAPI_BASE_URL", "https://serpapi.com")
+SERPAPI_MAX_WORKERS = settings.get_int("SERPAPI_MAX_WORKERS", 16)
+SERPAPI_MAX_CONCURRENCY = settings.get_int("SERPAPI_MAX_CONCURRENCY", 0)
+SERPAPI_TIMEOUT = settings.get_float("SERPAPI_TIMEOUT", 30)
+
+# Host the searches are paced against
+SERPAPI_HOST = "serpapi.com"
+
+
+# Bounded executor for SerpApi searches
+class SearchExecutor:
+    """
+    Bounded executor for SerpApi searches.
+
+    Attributes:
+        max_workers (int): Number of threads in the shared pool
+        max_concurrency (int): Maximum number of searches allowed in flight at once
+        timeout (float): Per-call timeout in seconds, covering every retry
+        cache (Optional[ResultCache]): Persistent cache consulted before spending a search
+        rate_limiter (Optional[RateLimiter]): Paces the searches sent to SerpApi
+        retry_policy (Optional[RetryPolicy]): Retries failed searches within the timeout
+        circuit_breakers (Optional[CircuitBreakers]): Fail fast while SerpApi is failing
+        fixtures_mode (str): "record" to record SerpApi responses, "replay" to answer from the recordings
+        fixtures (Optional[FixtureCorpus]): The recordings, if fixtures are recorded or replayed
+
+    Methods:
+        search(params: Dict[str, Any], key: Optional[str]) -> Dict[str, Any]: Run a search without blocking the event loop
+        stats() -> Dict[str, Any]: Get the executor queue and call metrics
+        pool_stats() -> Dict[str, Any]: Get the search slots in use and waited for
+        shutdown() -> None: Shut down the thread pool, close the cache and compact the recordings
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        max_workers: int = SERPAPI_MAX_WORKERS,
+        max_concurrency: Optional[int] = SERPAPI_MAX_CONCURRENCY or None,
+        timeout: float = SERPAPI_TIMEOUT,
+        cache: Optional[ResultCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        fixtures_mode: str = SERPAPI_FIXTURES_MODE,
+        fixtures_path: str = SERPAPI_FIXTURES_PATH,
+    ):
+        """
+        Initialize the search executor.
+
+        Args:
+            max_workers (int): Number of threads in the shared pool
+            max_concurrency (Optional[int]): Maximum number of searches in flight. Defaults to max_workers.
+            timeout (float): Per-call timeout in seconds
+            cache (Optional[ResultCache]): Persistent cache consulted before spending a search. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): Paces the searches sent to SerpApi. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): Retries failed searches within the timeout. Defaults to None.
+            circuit_breakers (Optional[CircuitBreakers]): Fail fast while SerpApi is failing. Defaults to None.
+            fixtures_mode (str): "record" to record SerpApi responses, "replay" to answer from the recordings, anything else for neither
+            fixtures_path (str): The file the responses are recorded to and replayed from
+        """
+
+        # Set the configuration
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency or max_workers
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+
+        # If fixtures are recorded or replayed, load the recordings
+        self.fixtures_mode = fixtures_mode
+        self.fixtures = (
+            FixtureCorpus(fixtures_path)
+            if fixtures_mode in ("record", "replay")
+            else None
+        )
+
+        # Initialize the thread pool and the concurrency cap
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="serpapi-search"
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Initialize the metrics
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+
+    # Blocking SerpApi call, run on the thread pool
+    def _fetch(
+        self, params: Dict[str, Any], key: Optional[str]
+    ) -> Tuple[Dict[str, Any], int, Mapping[str, str]]:
+        """
+        Run the blocking SerpApi search.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            key (Optional[str]): The only top-level key to materialize, or None for all
+
+        Returns:
+            Tuple[Dict[str, Any], int, Mapping[str, str]]: The search results, and the status code and headers fed to the rate limiter
+
+        Raises:
+            FixtureNotFoundError: If fixtures are replayed and none answers the search
+        """
+
+        # If fixtures are replayed, answer from the recordings instead of SerpApi
+        if self.fixtures_mode == "replay":
+            body, status_code, headers = self._replay(params)
+
+        # Otherwise, run the search
+        else:
+            # Import the SerpApi client on first use, it pulls in requests
+            from serpapi import GoogleSearch
+
+            # Initialize the search on a copy, the client adds its own parameters
+            search = GoogleSearch(dict(params))
+            search.BACKEND = SERPAPI_BASE_URL
+            search.timeout = self.timeout
+
+            # Get the raw JSON body without parsing it
+            search.params_dict["output"] = "json"
+            response = search.get_response()
+            body, status_code, headers = (
+                response.content,
+                response.status_code,
+                response.headers,
+            )
+
+            # If fixtures are recorded, record the response unless it is throttling
+            # or a server error, a replay should not reproduce a bad day
+            if (
+                self.fixtures_mode == "record"
+                and status_code != 429
+                and status_code < 500
+            ):
+                self.fixtures.put(
+                    params.get("engine", ""),
+                    params,
+                    status_code,
+                    headers.get("content-type"),
+                    response.text,
+                    secrets=[params.get("api_key")],
+                )
+
+        # Parse the whole response, or only the requested key
+        results = json.loads(body) if key is None else extract_key(body, key)
+
+        # Return the search results with the response metadata
+        return results, status_code, headers
+
+    # Answer a search from the recordings
+    def _replay(self, params: Dict[str, Any]) -> Tuple[bytes, int, Mapping[str, str]]:
+        """
+        Answer a search from the recordings.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+
+        Returns:
+            Tuple[bytes, int, Mapping[str, str]]: The recorded body, status code and headers
+
+        Raises:
+            FixtureNotFoundError: If no fixture answers the search
+        """
+
+        # Find the fixture
+        engine = params.get("engine", "")
+        fixture = self.fixtures.get(engine, params)
+
+        # If there is none, fail the search
+        if fixture is None:
+            raise FixtureNotFoundError(
+                f"No fixture for {engine} in {self.fixtures.path}"
+            )
+
+        # Return the recorded response
+        return (
+            fixture["body"].encode("utf-8"),
+            fixture["status_code"],
+            {"content-type": fixture["content_type"] or "application/json"},
+        )
+
+    # Release the concurrency slot once the thread is done
+    def _release(self, future: asyncio.Future) -> None:
+        """
+        Release the concurrency slot held by a finished search.
+
+        Args:
+            future (asyncio.Future): The finished search future
+        """
+
+        # Update the metrics
+        self._in_flight -= 1
+
+        # If the search raised, mark the exception as retrieved
+        if not future.cancelled() and future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+        # Release the slot
+        self._semaphore.release()
+
+    # Run a search without blocking the event loop
+    async def search(
+        self, params: Dict[str, Any], key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a SerpApi search, serving it from the result cache when possible.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            key (Optional[str]): The only top-level key the caller needs. Defaults to None for all.
+
+        Raises:
+            TimeoutError: SerpApi search timed out
+            CircuitOpenError: The circuit is open and no stale results are cached
+
+        Returns:
+            Dict[str, Any]: The search results
+        """
+
+        # Extracted results are cached apart from full ones
+        cache_params = params if key is None else {**params, "extract": key}
+
+        # If a result cache is configured
+        if self.cache is not None:
+            # If the search is cached, return it without spending a search
+            cached = await asyncio.to_thread(self.cache.get, cache_params)
+            if cached is not None:
+                return cached
+
+        try:
+            # Run the search on the thread pool
+            results = await self._search(params, key)
+
+        # Handle an open circuit
+        except CircuitOpenError:
+            # If the search was cached before, serve it stale while SerpApi recovers
+            if self.cache is not None:
+                stale = await asyncio.to_thread(self.cache.get_stale, cache_params)
+                if stale is not None:
+                    return stale
+
+            raise
+
+        # If a result cache is configured and the search succeeded
+        if (
+            self.cache is not None
+            and "error" not in results
+            and (key is None or key in results)
+        ):
+            # Cache the results
+            await asyncio.to_thread(self.cache.set, cache_params, results)
+
+        # Return the search results
+        return results
+
+    # Run a search through its circuit breaker
+    async def _search(
+        self, params: Dict[str, Any], key: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Run a SerpApi search through the circuit breaker of the tool making it.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            key (Optional[str]): The only top-level key to materialize, or None for all
+
+        Raises:
+            TimeoutError: SerpApi search timed out
+            RateLimitExceeded: The rate limiter queue is full
+            CircuitOpenError: The circuit is open
+
+        Returns:
+            Dict[str, Any]: The search results
+        """
+
+        # If no circuit breakers are configured, run the search
+        if self.circuit_breakers is None:
+            return (await self._retry(params, key, {}))[0]
+
+        # Get the breaker of the tool being called
+        tool = current_tool.get()
+        breaker = self.circuit_breakers.get(
+            SERPAPI_HOST, tool.name if tool is not None else NO_TOOL
+        )
+
+        # Let the search through or refuse it
+        _, admission = breaker.acquire()
+
+        # The last attempt records when it was submitted to the thread pool
+        timing: Dict[str, float] = {}
+
+        try:
+            # Run the search
+            results, status_code = await self._retry(params, key, timing)
+
+        # Handle a search refused locally or cancelled
+        except (RateLimitExceeded, asyncio.CancelledError):
+            # Forget the search
+            breaker.abandon(admission)
+            raise
+
+        # Handle a failed search
+        except Exception:
+            # If the search timed out before reaching SerpApi, the local queue was slow
+            if "start" not in timing:
+                breaker.abandon(admission)
+
+            # Otherwise, record the failure
+            else:
+                breaker.record(timing["start"], admission, failed=True)
+            raise
+
+        # Record the outcome, timed from when the last attempt reached SerpApi, so
+        # waits for a token, a free slot or a retry backoff do not count as slow
+        breaker.record(
+            timing["start"], admission, failed=status_code in FAILURE_STATUS_CODES
+        )
+
+        # Return the search results
+        return results
+
+    # Run a search on the thread pool
+    async def _retry(
+        self, params: Dict[str, Any], key: Optional[str], timing: Dict[str, float]
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Run a SerpApi search on the thread pool, retrying failed attempts.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            key (Optional[str]): The only top-level key to materialize, or None for all
+            timing (Dict[str, float]): Receives the "start" of the last attempt submitted to the thread pool
+
+        Raises:
+            TimeoutError: SerpApi search timed out
+            RateLimitExceeded: The rate limiter queue is full
+
+        Returns:
+            Tuple[Dict[str, Any], int]: The search results and the status code of the last attempt
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+
+        try:
+            # Bound the whole call, including waits for a slot and retry backoffs
+            async with asyncio.timeout_at(deadline):
+                attempt = 1
+                while True:
+                    results, status_code, error = None, None, None
+                    try:
+                        # Run the attempt
+                        results, status_code = await self._attempt(params, key, timing)
+
+                    # Handle a failed attempt, it is classified below
+                    except Exception as e:
+                        error = e
+
+                    # If the attempt succeeded or may not be retried, return it
+                    delay = None
+                    if (
+                        self.retry_policy is not None
+                        and self.retry_policy.should_retry(status_code, error)
+                    ):
+                        delay = self.retry_policy.next_delay(
+                            attempt, deadline - loop.time()
+                        )
+                    if delay is None:
+                        if error is not None:
+                            raise error
+                        return results, status_code
+
+                    # Wait before the next attempt
+                    attempt += 1
+                    await asyncio.sleep(delay)
+
+        # Handle the timeout
+        except TimeoutError:
+            # Update the metrics
+            self._timed_out += 1
+
+            # Raise an error
+            raise TimeoutError(f"SerpApi search timed out after {self.timeout}s")
+
+    # Run one search attempt on the thread pool
+    async def _attempt(
+        self, params: Dict[str, Any], key: Optional[str], timing: Dict[str, float]
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Run one SerpApi search attempt on the thread pool.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            key (Optional[str]): The only top-level key to materialize, or None for all
+            timing (Dict[str, float]): Receives the "start" of the attempt once it is submitted
+
+        Raises:
+            RateLimitExceeded: The rate limiter queue is full
+
+        Returns:
+            Tuple[Dict[str, Any], int]: The search results and the response status code
+        """
+
+        # If a rate limiter is configured, wait for a token
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(SERPAPI_HOST)
+
+        # Wait for a free slot
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        # Submit the search, the slot is held until the thread finishes
+        self._in_flight += 1
+        start = timing["start"] = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(
+            self._pool, self._fetch, params, key
+        )
+        future.add_done_callback(self._release)
+
+        # Wait for the search without cancelling the running thread
+        results, status_code, headers = await asyncio.shield(future)
+
+        # Time the search against the tool that made it
+        observe_upstream(start)
+
+        # If a rate limiter is configured, adapt it to the response
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(SERPAPI_HOST, status_code, headers)
+
+        # Return the search results with the status code
+        return results, status_code
+
+    # Get the executor metrics
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the executor queue and call metrics.
+
+        Returns:
+            Dict[str, Any]: The executor metrics
+        """
+
+        # Return the metrics
+        return {
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._queued,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+        }
+
+    # Get the search slots in use and waited for
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get the search slots in use and waited for, in the shape of a connection pool.
+
+        Returns:
+            Dict[str, Any]: The slots, the searches running and queued, and the slot utilization
+        """
+
+        # Return the figures
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "utilization": round(self._in_flight / self.max_concurrency, 4),
+        }
+
+    # Shut down the thread pool
+    def shutdown(self) -> None:
+        """
+        Shut down the thread pool without waiting for pending searches, close the cache
+        and compact the recordings.
+        """
+
+        # Shut down the pool
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        # If a result cache is configured
+        if self.cache is not None:
+            # Close the cache
+            self.cache.close()
+
+        # If fixtures are recorded, compact the recordings
+        if self.fixtures_mode == "record":
+            self.fixtures.compact()
+
+
+# Exports
+__all__ = ["SearchExecutor"]
@@ -0,0 +1,55 @@
+"""
+Extraction module for serpapi-google-mcp-server.
+Stream-parses SerpApi responses and materializes only the top-level key a tool returns.
+"""
+
+# Standard library imports
+import io
+import json
+from typing import Any, Dict
+
+# Third party imports, the streaming parser is optional
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Parse in small chunks so parsing stops soon after the key's value ends
+BUFFER_SIZE = 4096
+
+
+# Extract one top-level key from a SerpApi response body
+def extract_key(body: bytes, key: str) -> Dict[str, Any]:
+    """
+    Extract one top-level key from a SerpApi response body.
+
+    With ijson installed, the body is stream-parsed and only the value of the key is
+    built into Python objects; parsing stops once it is complete. Without ijson, or
+    when the key is missing, the whole body is parsed.
+
+    Args:
+        body (bytes): The raw JSON response body
+        key (str): The top-level key to extract
+
+    Returns:
+        Dict[str, Any]: The key and its value, or the SerpApi error if the key is missing
+    """
+
+    # If the streaming parser is installed
+    if ijson is not None:
+        # Build only the value of the key, everything else is scanned and dropped
+        for value in ijson.items(
+            io.BytesIO(body), key, use_float=True, buf_size=BUFFER_SIZE
+        ):
+            # Return the key and its value
+            return {key: value}
+
+    # Parse the whole body, which also surfaces the error when the key is missing
+    results = json.loads(body)
+
+    # Return the key and any error
+    return {name: results[name] for name in (key, "error") if name in results}
+
+
+# Exports
+__all__ = ["extract_key"]
@@ -0,0 +1,296 @@
+"""
+Fixtures module for serpapi-google-mcp-server.
+Records SerpApi responses, with API keys scrubbed, to a compact corpus on disk and
+replays them in place of SerpApi, so benchmarks and tests run with no network on
+real-shaped payloads.
+"""
+
+# Standard library imports
+import gzip
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+# Local imports
+from serpapi_google_mcp_server.utils.logger import get_logger
+from serpapi_google_mcp_server.utils.settings import settings
+
+# Set constants
+SERPAPI_FIXTURES_MODE = settings.get("SERPAPI_FIXTURES_MODE", "off").lower()
+SERPAPI_FIXTURES_PATH = settings.get(
+    "SERPAPI_FIXTURES_PATH", "fixtures/serpapi-google-mcp-server.jsonl.gz"
+)
+SERPAPI_FIXTURES_STRICT = settings.get_bool("SERPAPI_FIXTURES_STRICT", False)
+
+# Query parameters and headers that carry API keys, compared in lower case
+SECRET_PARAMS = frozenset({"apikey", "api_key", "appid", "key", "serp_api_key"})
+SECRET_HEADERS = frozenset({"x-api-key", "authorization"})
+
+# Placeholder of a scrubbed API key
+REDACTED = "REDACTED"
+
+# Shortest value scrubbed from bodies, shorter ones would match by chance
+MIN_SECRET_LENGTH = 8
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Query parameters, as a mapping or as name and value pairs
+Params = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+
+# Error raised when no fixture answers a replayed request
+class FixtureNotFoundError(LookupError):
+    """
+    Error raised when no fixture answers a replayed request.
+
+    Inherits:
+        LookupError
+    """
+
+
+# Build the key of a request
+def fixture_key(route: str, params: Params) -> str:
+    """
+    Build the key of a request from its route and its query parameters, sorted and
+    without API keys, so the key does not depend on the key it was recorded with.
+
+    Args:
+        route (str): The route of the request, the SerpApi engine such as "google_hotels"
+        params (Params): The query parameters
+
+    Returns:
+        str: The key
+    """
+
+    # Drop the API keys and sort the parameters
+    items = params.items() if isinstance(params, Mapping) else params
+    query = urlencode(
+        sorted(
+            (str(name), str(value))
+            for name, value in items
+            if str(name).lower() not in SECRET_PARAMS
+        )
+    )
+
+    # Return the key
+    return f"{route}?{query}" if query else route
+
+
+# Recorded upstream responses kept on disk
+class FixtureCorpus:
+    """
+    Recorded upstream responses, kept on disk as gzipped JSON lines, one fixture per
+    line. Each recorded response is appended at once, so a recording survives a killed
+    process, and compact rewrites the file with one fixture per key. A fixture is
+    looked up by its key. A miss falls back to another fixture of
+    the same route, picked by the key so it is stable across runs, unless strict.
+
+    Attributes:
+        path (str): The corpus file
+        strict (bool): Whether a miss fails instead of falling back to the same route
+
+    Methods:
+        get(route: str, params: Params) -> Optional[Dict[str, Any]]: Find the fixture of a request
+        put(route: str, params: Params, status_code: int, content_type: Optional[str], body: str, secrets: Iterable[Optional[str]]) -> None: Record a response
+        fixtures() -> List[Dict[str, Any]]: Get the fixtures sorted by key
+        compact() -> None: Rewrite the corpus with one fixture per key
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        path: str = SERPAPI_FIXTURES_PATH,
+        strict: bool = SERPAPI_FIXTURES_STRICT,
+    ):
+        """
+        Initialize the corpus and load the fixtures already on disk.
+
+        Args:
+            path (str): The corpus file
+            strict (bool): Whether a miss fails instead of falling back to the same route
+        """
+
+        # Set the configuration
+        self.path = path
+        self.strict = strict
+
+        # Initialize the fixtures, by key and by route
+        self._fixtures: Dict[str, Dict[str, Any]] = {}
+        self._routes: Dict[str, List[str]] = {}
+        self._appended = 0
+        self._lock = threading.Lock()
+
+        # Load the fixtures on disk
+        self._load()
+
+    # Load the fixtures on disk
+    def _load(self) -> None:
+        """Load the fixtures on disk, a missing file is an empty corpus."""
+
+        # If there is no corpus yet, start empty
+        if not os.path.exists(self.path):
+            logger.warning(f"No fixtures at {self.path}, the corpus is empty")
+            return
+
+        lines = 0
+        try:
+            # Read one fixture per line, a later line replaces an earlier one
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self._add(json.loads(line))
+                        lines += 1
+
+        # Handle a file cut short by a killed recording
+        except (EOFError, gzip.BadGzipFile, json.JSONDecodeError) as error:
+            logger.warning(f"Fixtures at {self.path} are cut short: {error}")
+
+        # Count the replaced lines as appended, so they go at the next compaction
+        self._appended = lines - len(self._fixtures)
+
+        # Log the corpus size
+        logger.info(f"Loaded {len(self._fixtures)} fixtures from {self.path}")
+
+    # Add a fixture to the indexes
+    def _add(self, fixture: Dict[str, Any]) -> None:
+        """
+        Add a fixture to the indexes, replacing the fixture with the same key.
+
+        Args:
+            fixture (Dict[str, Any]): The fixture
+        """
+
+        # If the key is new, index it under its route
+        if fixture["key"] not in self._fixtures:
+            self._routes.setdefault(fixture["route"], []).append(fixture["key"])
+
+        # Keep the fixture
+        self._fixtures[fixture["key"]] = fixture
+
+    # Find the fixture of a request
+    def get(self, route: str, params: Params) -> Optional[Dict[str, Any]]:
+        """
+        Find the fixture of a request.
+
+        Args:
+            route (str): The route of the request
+            params (Params): The query parameters
+
+        Returns:
+            Optional[Dict[str, Any]]: The fixture, or None if none answers the request
+        """
+
+        key = fixture_key(route, params)
+
+        # If the request was recorded, return its fixture
+        if (fixture := self._fixtures.get(key)) is not None:
+            return fixture
+
+        # If misses fail, or the route was never recorded, there is no fixture
+        keys = self._routes.get(route)
+        if self.strict or not keys:
+            return None
+
+        # Return a fixture of the same route, picked by the key
+        return self._fixtures[keys[zlib.crc32(key.encode()) % len(keys)]]
+
+    # Get the fixtures sorted by key
+    def fixtures(self) -> List[Dict[str, Any]]:
+        """
+        Get the fixtures sorted by key.
+
+        Returns:
+            List[Dict[str, Any]]: The fixtures
+        """
+
+        # Return the fixtures
+        return [self._fixtures[key] for key in sorted(self._fixtures)]
+
+    # Record a response
+    def put(
+        self,
+        route: str,
+        params: Params,
+        status_code: int,
+        content_type: Optional[str],
+        body: str,
+        secrets: Iterable[Optional[str]] = (),
+    ) -> None:
+        """
+        Record a response, scrubbing the API keys from its body, and append it to the
+        corpus file.
+
+        Args:
+            route (str): The route of the request
+            params (Params): The query parameters
+            status_code (int): The response status code
+            content_type (Optional[str]): The response content type
+            body (str): The response body
+            secrets (Iterable[Optional[str]]): The API keys sent with the request
+        """
+
+        # Scrub the API keys, some upstreams echo the request back
+        for secret in secrets:
+            if secret and len(secret) >= MIN_SECRET_LENGTH:
+                body = body.replace(secret, REDACTED)
+
+        # Build the fixture
+        fixture = {
+            "key": fixture_key(route, params),
+            "route": route,
+            "status_code": status_code,
+            "content_type": content_type,
+            "body": body,
+        }
+
+        # Encode the line outside the lock
+        line = json.dumps(fixture, ensure_ascii=False)
+
+        # Keep the fixture, requests may be recorded from several threads
+        with self._lock:
+            # If the same response is already recorded, keep the file as it is
+            if self._fixtures.get(fixture["key"]) == fixture:
+                return
+            self._add(fixture)
+
+            # Append it as a gzip member of its own, readers see one stream
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with gzip.open(self.path, "ab") as file:
+                file.write(f"{line}\n".encode("utf-8"))
+            self._appended += 1
+
+    # Rewrite the corpus with one fixture per key
+    def compact(self) -> None:
+        """
+        Rewrite the corpus with one fixture per key, sorted by key and compressed as
+        one stream, if anything was appended.
+        """
+
+        with self._lock:
+            # If nothing was appended, leave the file as it is
+            if not self._appended:
+                return
+
+            # Write to a temporary file, then replace the corpus in one step
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with gzip.GzipFile(temporary, "wb", compresslevel=9, mtime=0) as file:
+                for fixture in self.fixtures():
+                    line = json.dumps(fixture, ensure_ascii=False)
+                    file.write(f"{line}\n".encode("utf-8"))
+            os.replace(temporary, self.path)
+
+            # Log the corpus size
+            logger.info(
+                f"Compacted {len(self._fixtures)} fixtures to {self.path}"
+                f" ({self._appended} recorded)"
+            )
+            self._appended = 0
+
+
+# Exports
+__all__ = ["FixtureCorpus", "FixtureNotFoundError", "fixture_key"]
@@ -0,0 +1,346 @@
+"""
+Result cache module for serpapi-google-mcp-server.
+Provides a persistent, size-bounded SQLite cache of SerpApi results that survives restarts.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Local imports
+from serpapi_google_mcp_server.utils.serializer import Serializer
+from serpapi_google_mcp_server.utils.settings import settings
+
+# Set constants
+SERPAPI_CACHE_ENABLED = settings.get_bool("SERPAPI_CACHE_ENABLED", True)
+SERPAPI_CACHE_DIR = settings.get("SERPAPI_CACHE_DIR", ".cache")
+SERPAPI_CACHE_MAX_BYTES = settings.get_int("SERPAPI_CACHE_MAX_BYTES", 256 * 2**20)
+SERPAPI_CACHE_DEFAULT_TTL = settings.get_float("SERPAPI_CACHE_DEFAULT_TTL", 3600)
+SERPAPI_COST_PER_SEARCH = settings.get_float("SERPAPI_COST_PER_SEARCH", 0)
+SERPAPI_CACHE_MAX_STALE = settings.get_float("SERPAPI_CACHE_MAX_STALE", 86400)
+
+# Default TTL in seconds per SerpApi engine
+SERPAPI_CACHE_TTLS = {
+    "google_events": 21600,
+    "google_finance": 60,
+    "google_flights": 900,
+    "google_hotels": 3600,
+    "google_jobs": 21600,
+    "google_local": 86400,
+    "google_shopping": 1800,
+}
+
+# Parameters that do not change the search results
+IGNORED_PARAMS = {"api_key", "output", "source"}
+
+
+# Persistent SerpApi result cache
+class ResultCache:
+    """
+    Persistent SerpApi result cache backed by SQLite.
+
+    Attributes:
+        path (str): Path of the SQLite database
+        max_bytes (int): Maximum total size of the cached results in bytes
+        max_stale (float): Seconds expired results are kept to be served stale
+        serializer (Serializer): Serializer for the stored results
+
+    Methods:
+        make_key(params: Dict[str, Any]) -> str: Build a cache key from the search parameters
+        ttl(engine: str) -> float: Get the TTL for an engine
+        get(params: Dict[str, Any]) -> Optional[Dict[str, Any]]: Get cached search results
+        get_stale(params: Dict[str, Any]) -> Optional[Dict[str, Any]]: Get cached search results, even if they have expired
+        set(params: Dict[str, Any], results: Dict[str, Any]) -> None: Cache search results
+        lookups() -> Dict[str, int]: Get the lookup counters without querying the database
+        stats() -> Dict[str, Any]: Get the cache and cost counters
+        close() -> None: Close the database
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        directory: str = SERPAPI_CACHE_DIR,
+        max_bytes: int = SERPAPI_CACHE_MAX_BYTES,
+        serializer: Optional[Serializer] = None,
+        max_stale: float = SERPAPI_CACHE_MAX_STALE,
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            directory (str): Directory holding the SQLite database
+            max_bytes (int): Maximum total size of the cached results in bytes
+            serializer (Optional[Serializer]): Serializer for the stored results
+            max_stale (float): Seconds expired results are kept to be served stale
+        """
+
+        # Set the configuration
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "serpapi_results.sqlite3")
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self.serializer = serializer or Serializer()
+
+        # Open the database, shared by the event loop and worker threads
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, engine TEXT NOT NULL, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS searches_saved ("
+            "engine TEXT PRIMARY KEY, count INTEGER NOT NULL)"
+        )
+        self._db.commit()
+
+        # Initialize the counters for this process
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_hits = 0
+
+    # Build a cache key from the search parameters
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from the canonicalized search parameters, without the API key.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+
+        Returns:
+            str: The cache key
+        """
+
+        # Canonicalize the parameters
+        canonical = json.dumps(
+            {k: v for k, v in params.items() if k not in IGNORED_PARAMS},
+            sort_keys=True,
+            default=str,
+        )
+
+        # Return the key
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    # Get the TTL for an engine
+    @staticmethod
+    def ttl(engine: str) -> float:
+        """
+        Get the TTL for an engine, overridable with SERPAPI_CACHE_TTL_<ENGINE>.
+
+        Args:
+            engine (str): The SerpApi engine
+
+        Returns:
+            float: The TTL in seconds, 0 or less disables caching
+        """
+
+        # Return the TTL
+        return float(
+            settings.get(
+                f"SERPAPI_CACHE_TTL_{engine.upper()}",
+                SERPAPI_CACHE_TTLS.get(engine, SERPAPI_CACHE_DEFAULT_TTL),
+            )
+        )
+
+    # Get cached search results
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get cached search results.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached results, or None on a miss
+        """
+
+        # Build the key
+        key = self.make_key(params)
+        now = time.time()
+
+        with self._lock:
+            # Get the entry
+            row = self._db.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            # If the entry is missing or expired
+            if row is None or row[1] <= now:
+                # Count the miss
+                self._misses += 1
+                return None
+
+            # Mark the entry as recently used and record the saved search
+            self._db.execute(
+                "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._db.execute(
+                "INSERT INTO searches_saved (engine, count) VALUES (?, 1) "
+                "ON CONFLICT (engine) DO UPDATE SET count = count + 1",
+                (params.get("engine", ""),),
+            )
+            self._db.commit()
+            self._hits += 1
+
+        # Return the cached results
+        return self.serializer.loads(row[0])
+
+    # Get cached search results, even if they have expired
+    def get_stale(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get cached search results, even if they have expired, as long as they are not too old.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached results, or None if there are none to serve
+        """
+
+        with self._lock:
+            # Get the entry
+            row = self._db.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?",
+                (self.make_key(params),),
+            ).fetchone()
+
+            # If the entry is missing or too old to serve stale
+            if row is None or row[1] + self.max_stale <= time.time():
+                return None
+
+            # Count the stale hit
+            self._stale_hits += 1
+
+        # Return the cached results
+        return self.serializer.loads(row[0])
+
+    # Cache search results
+    def set(self, params: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """
+        Cache search results and evict the least recently used entries over the size bound.
+
+        Args:
+            params (Dict[str, Any]): The SerpApi search parameters
+            results (Dict[str, Any]): The search results
+        """
+
+        # Get the TTL for the engine
+        engine = params.get("engine", "")
+        ttl = self.ttl(engine)
+
+        # If caching is disabled for this engine
+        if ttl <= 0:
+            return
+
+        # Serialize the results
+        value = self.serializer.dumps(results).encode()
+        now = time.time()
+
+        # If the results can never fit
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            # Store the entry
+            self._db.execute(
+                "INSERT OR REPLACE INTO results "
+                "(key, engine, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.make_key(params), engine, value, len(value), now + ttl, now),
+            )
+
+            # Drop entries too old to serve stale
+            self._evictions += self._db.execute(
+                "DELETE FROM results WHERE expires_at <= ?", (now - self.max_stale,)
+            ).rowcount
+
+            # Evict the least recently used entries until the cache fits
+            (total,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            if total > self.max_bytes:
+                for key, size in self._db.execute(
+                    "SELECT key, size FROM results ORDER BY accessed_at"
+                ).fetchall():
+                    self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._evictions += 1
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+
+            self._db.commit()
+
+    # Get the lookup counters without querying the database
+    def lookups(self) -> Dict[str, int]:
+        """
+        Get the lookup counters of this process, cheap enough for the event loop.
+
+        Returns:
+            Dict[str, int]: The hits, misses and stale hits
+        """
+
+        # Return the counters
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale_hits": self._stale_hits,
+        }
+
+    # Get the cache and cost counters
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache and cost counters.
+
+        Returns:
+            Dict[str, Any]: The counters, searches saved are persisted across restarts
+        """
+
+        with self._lock:
+            # Get the size of the cache
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+
+            # Get the searches saved per engine
+            saved = dict(
+                self._db.execute("SELECT engine, count FROM searches_saved").fetchall()
+            )
+
+        # Return the counters
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "stale_hits": self._stale_hits,
+            "searches_saved": sum(saved.values()),
+            "searches_saved_by_engine": saved,
+            "cost_saved": round(sum(saved.values()) * SERPAPI_COST_PER_SEARCH, 4),
+        }
+
+    # Close the database
+    def close(self) -> None:
+        """Close the database."""
+
+        with self._lock:
+            # Close the connection
+            self._db.close()
+
+
+# Exports
+__all__ = ["ResultCache"]
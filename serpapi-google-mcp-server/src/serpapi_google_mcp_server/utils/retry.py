@@ -0,0 +1,132 @@
+"""
+Retry module for serpapi-google-mcp-server.
+Classifies failed SerpApi searches and spaces their retries with exponential backoff and
+full jitter, the executor timeout bounds every attempt and backoff of a search.
+"""
+
+# Standard library imports
+import random
+from typing import Dict, Optional
+
+# Local imports
+from serpapi_google_mcp_server.utils.settings import settings
+
+# Set constants
+SERPAPI_RETRY_ATTEMPTS = settings.get_int("SERPAPI_RETRY_ATTEMPTS", 3)
+SERPAPI_RETRY_BASE_DELAY = settings.get_float("SERPAPI_RETRY_BASE_DELAY", 0.25)
+SERPAPI_RETRY_MAX_DELAY = settings.get_float("SERPAPI_RETRY_MAX_DELAY", 4)
+
+# Status codes worth retrying, the search did not run or may succeed later
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+# Retry policy for SerpApi searches
+class RetryPolicy:
+    """
+    Retry policy for SerpApi searches.
+
+    Attributes:
+        attempts (int): Maximum number of attempts, including the first
+        base_delay (float): Backoff before the first retry, doubled on every retry
+        max_delay (float): Maximum backoff in seconds
+
+    Methods:
+        should_retry(status_code: Optional[int], error: Optional[Exception]) -> bool: Classify an attempt
+        next_delay(attempt: int, remaining: float) -> Optional[float]: Get the jittered delay before the next attempt
+        stats() -> Dict[str, int]: Get the retry counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        attempts: int = SERPAPI_RETRY_ATTEMPTS,
+        base_delay: float = SERPAPI_RETRY_BASE_DELAY,
+        max_delay: float = SERPAPI_RETRY_MAX_DELAY,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            attempts (int): Maximum number of attempts, including the first
+            base_delay (float): Backoff before the first retry, doubled on every retry
+            max_delay (float): Maximum backoff in seconds
+        """
+
+        # Set the configuration
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # Initialize the counters
+        self._retries = 0
+        self._exhausted = 0
+
+    # Classify an attempt
+    @staticmethod
+    def should_retry(status_code: Optional[int], error: Optional[Exception]) -> bool:
+        """
+        Classify an attempt by its status code or the error it raised.
+
+        Args:
+            status_code (Optional[int]): The response status code, or None if the attempt raised
+            error (Optional[Exception]): The raised error, or None if there is a response
+
+        Returns:
+            bool: True if another attempt may succeed
+        """
+
+        # If the attempt raised, only connection failures and timeouts are retried
+        if status_code is None:
+            # Import the client errors here, the first search has loaded requests
+            import requests
+
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+        # Retry throttling and server errors
+        return status_code in RETRYABLE_STATUS_CODES
+
+    # Get the delay before the next attempt
+    def next_delay(self, attempt: int, remaining: float) -> Optional[float]:
+        """
+        Get the jittered delay before the next attempt, counting the retry.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1
+            remaining (float): Seconds left before the search times out
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the attempts or the time ran out
+        """
+
+        # Pick a delay up to the exponential backoff, so retries spread out
+        delay = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+        # If no attempt is left, or the next one could not start in time
+        if attempt >= self.attempts or delay >= remaining:
+            # Count the exhausted retries
+            self._exhausted += 1
+            return None
+
+        # Count the retry
+        self._retries += 1
+
+        # Return the delay
+        return delay
+
+    # Get the retry counters
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the retry counters.
+
+        Returns:
+            Dict[str, int]: The counters
+        """
+
+        # Return the counters
+        return {"retries": self._retries, "exhausted": self._exhausted}
+
+
+# Exports
+__all__ = ["RetryPolicy"]
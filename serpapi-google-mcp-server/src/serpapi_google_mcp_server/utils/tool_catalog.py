@@ -0,0 +1,108 @@
+"""
+Tool catalog module for serpapi-google-mcp-server.
+Freezes the tool list at startup and serves it prebuilt, with a version hash.
+"""
+
+# Standard library imports
+import hashlib
+import json
+from typing import Any, Iterable, Tuple
+
+# Third party imports
+import mcp.types as types
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+# Frozen, pre-serialized tool list
+class ToolCatalog:
+    """
+    Frozen, pre-serialized tool list.
+
+    Attributes:
+        tools (Tuple[types.Tool, ...]): The frozen tools
+        json (bytes): The serialized tool list
+        version (str): Hash of the serialized tool list, changes whenever a tool does
+        result (types.ServerResult): The prebuilt list tools result
+
+    Methods:
+        handle_list_tools(request: Any) -> types.ServerResult: Serve the list tools request
+        handle_http(request: Request) -> Response: Serve the tool list over HTTP with an ETag
+    """
+
+    # Constructor
+    def __init__(self, tools: Iterable[types.Tool]):
+        """
+        Build the catalog once from the tool definitions.
+
+        Args:
+            tools (Iterable[types.Tool]): The tool definitions
+        """
+
+        # Freeze the tools
+        self.tools: Tuple[types.Tool, ...] = tuple(tools)
+
+        # Serialize the tools once, in the same shape as the MCP response
+        self.json = json.dumps(
+            {
+                "tools": [
+                    tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    for tool in self.tools
+                ]
+            },
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode()
+
+        # Hash the serialized tools
+        self.version = hashlib.sha256(self.json).hexdigest()[:16]
+
+        # Build the list tools result once, the version lets clients skip refetching
+        self.result = types.ServerResult(
+            types.ListToolsResult(
+                tools=list(self.tools), _meta={"version": self.version}
+            )
+        )
+
+    # Serve the list tools request
+    async def handle_list_tools(self, request: Any) -> types.ServerResult:
+        """
+        Serve the list tools request from the prebuilt result.
+
+        Args:
+            request (Any): The list tools request
+
+        Returns:
+            types.ServerResult: The prebuilt list tools result
+        """
+
+        # Return the prebuilt result
+        return self.result
+
+    # Serve the tool list over HTTP
+    async def handle_http(self, request: Request) -> Response:
+        """
+        Serve the serialized tool list, or 304 if the client already has this version.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The serialized tool list, or an empty 304 response
+        """
+
+        # Quote the version as an ETag
+        etag = f'"{self.version}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        # If the client already has this version
+        if etag in request.headers.get("if-none-match", ""):
+            # Return not modified
+            return Response(status_code=304, headers=headers)
+
+        # Return the serialized tool list
+        return Response(self.json, media_type="application/json", headers=headers)
+
+
+# Exports
+__all__ = ["ToolCatalog"]
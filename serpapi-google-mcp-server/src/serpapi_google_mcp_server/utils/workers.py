@@ -0,0 +1,668 @@
+"""
+Workers module for serpapi-google-mcp-server.
+Runs the server in several worker processes behind a front process that routes every
+SSE session's messages back to the worker that opened it.
+"""
+
+# Standard library imports
+import asyncio
+import importlib
+import itertools
+import multiprocessing
+import os
+import re
+import shutil
+import signal
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+# Third party imports
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+# Local imports
+from serpapi_google_mcp_server.utils.logger import configure_uvicorn_logging, get_logger
+from serpapi_google_mcp_server.utils.metrics import CONTENT_TYPE, merge_expositions
+from serpapi_google_mcp_server.utils.settings import settings
+
+# Set constants
+SERPAPI_WORKER_START_TIMEOUT = settings.get_float("SERPAPI_WORKER_START_TIMEOUT", 30)
+SERPAPI_WORKER_STOP_TIMEOUT = settings.get_float("SERPAPI_WORKER_STOP_TIMEOUT", 10)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Session id announced in the endpoint event of an SSE stream
+SESSION_ID = re.compile(rb"session_id=([0-9a-f]{32})")
+
+# Headers that describe a single connection and are not forwarded
+HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "content-length",
+        "host",
+        "keep-alive",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+# Every method is forwarded to the workers as is
+METHODS = ["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+
+# Circuit states from best to worst, the worst state of a circuit across workers wins
+CIRCUIT_STATES = ("closed", "half_open", "open")
+
+
+# Forwardable headers
+def _forward_headers(headers) -> Dict[str, str]:
+    """
+    Drop the hop-by-hop headers.
+
+    Args:
+        headers: The request or response headers
+
+    Returns:
+        Dict[str, str]: The headers to forward
+    """
+
+    # Return the headers
+    return {k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS}
+
+
+# Exit on SIGTERM
+def _exit(signum: int, frame) -> None:
+    """
+    Raise SystemExit, so cleanup runs when the process is terminated.
+
+    Args:
+        signum (int): The signal number
+        frame: The current stack frame
+
+    Raises:
+        SystemExit: Always
+    """
+
+    # Exit with the conventional code
+    raise SystemExit(128 + signum)
+
+
+# Serve the app in a worker process
+def _serve_worker(app: str, uds: str, transport: str, debug: bool) -> None:
+    """
+    Serve the app on a Unix socket, this is the entry point of a worker process.
+
+    Args:
+        app (str): The factory of the server to serve, as "module:function"
+        uds (str): The Unix socket path to listen on
+        transport (str): The transports to serve
+        debug (bool): Debug mode
+    """
+
+    # Import the factory and build the server
+    module, _, attribute = app.partition(":")
+    server = getattr(importlib.import_module(module), attribute)()
+
+    # Route the uvicorn logs through the log thread
+    configure_uvicorn_logging()
+
+    # Run the server
+    uvicorn.run(server.create_app(transport, debug), uds=uds, log_config=None)
+
+
+# Front process router
+class SessionRouter:
+    """
+    Front process router that pins SSE sessions to the worker that opened them.
+
+    New SSE streams go to the worker with the fewest open streams. The session id is
+    read from the stream's endpoint event, so every message posted for the session is
+    forwarded to that worker. Readiness, circuit states and metrics are per process, so
+    they are asked of every worker and merged. Everything else, such as stateless /mcp requests,
+    is spread round-robin.
+
+    Attributes:
+        sockets (List[str]): Unix socket paths of the workers
+
+    Methods:
+        create_app(debug: bool) -> Starlette: Build the front app
+        handle_sse(request: Request) -> Response: Relay an SSE stream from a worker
+        handle_message(request: Request) -> Response: Forward a session message
+        handle_ready(request: Request) -> Response: Merge the readiness of the workers
+        handle_circuits(request: Request) -> Response: Merge the circuit states of the workers
+        handle_metrics(request: Request) -> Response: Merge the metrics of the workers
+        handle_any(request: Request) -> Response: Forward any other request
+    """
+
+    # Constructor
+    def __init__(self, sockets: List[str]):
+        """
+        Initialize the router.
+
+        Args:
+            sockets (List[str]): Unix socket paths of the workers
+        """
+
+        # Set the sockets
+        self.sockets = sockets
+
+        # Initialize the worker clients, opened by the lifespan
+        self._clients: List[httpx.AsyncClient] = []
+
+        # Initialize the session owners and open streams per worker
+        self._sessions: Dict[str, int] = {}
+        self._streams = [0] * len(sockets)
+
+        # Initialize the round-robin order
+        self._next = itertools.cycle(range(len(sockets)))
+
+    # Lifespan of the front app
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """
+        Open one client per worker and close them on shutdown.
+
+        Args:
+            app (Starlette): The front app
+        """
+
+        # SSE streams hold a connection each, so the pools are unbounded
+        self._clients = [
+            httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    uds=path,
+                    limits=httpx.Limits(max_connections=None),
+                ),
+                base_url="http://worker",
+                timeout=None,
+            )
+            for path in self.sockets
+        ]
+
+        # Log the workers
+        logger.info(f"Routing to {len(self.sockets)} workers")
+
+        try:
+            # Serve
+            yield
+
+        finally:
+            # Close the clients
+            for client in self._clients:
+                await client.aclose()
+
+    # Send a request to a worker
+    async def _send(
+        self, request: Request, worker: int, stream: bool = False
+    ) -> httpx.Response:
+        """
+        Send a request to a worker.
+
+        Args:
+            request (Request): The request to forward
+            worker (int): The worker index
+            stream (bool): Whether to stream the response body
+
+        Returns:
+            httpx.Response: The worker's response
+        """
+
+        # Get the client
+        client = self._clients[worker]
+
+        # Build the request with the same path, query, headers and body
+        forwarded = client.build_request(
+            request.method,
+            request.url.path + (f"?{request.url.query}" if request.url.query else ""),
+            headers=_forward_headers(request.headers),
+            content=await request.body(),
+        )
+
+        # Send the request
+        return await client.send(forwarded, stream=stream)
+
+    # Forward a request and return the whole response
+    async def _forward(self, request: Request, worker: int) -> Response:
+        """
+        Forward a request to a worker and return its whole response.
+
+        Args:
+            request (Request): The request to forward
+            worker (int): The worker index
+
+        Returns:
+            Response: The worker's response, or 502 if the worker is unreachable
+        """
+
+        try:
+            # Send the request
+            upstream = await self._send(request, worker)
+
+        # Handle an unreachable worker
+        except httpx.TransportError as e:
+            # Log the error
+            logger.error(f"Worker {worker} unreachable: {e}")
+
+            return Response("Worker unavailable", status_code=502)
+
+        # Return the response
+        return Response(
+            upstream.content,
+            status_code=upstream.status_code,
+            headers=_forward_headers(upstream.headers),
+        )
+
+    # Send a request to every worker
+    async def _fan_out(self, request: Request) -> List[Optional[httpx.Response]]:
+        """
+        Send a request to every worker at once.
+
+        Args:
+            request (Request): The request to forward
+
+        Returns:
+            List[Optional[httpx.Response]]: The response of each worker, None if it is unreachable
+        """
+
+        # Read the body once, so the concurrent sends share it
+        await request.body()
+
+        # Function to send the request to one worker
+        async def send(worker: int) -> Optional[httpx.Response]:
+            try:
+                # Send the request
+                return await self._send(request, worker)
+
+            # Handle an unreachable worker
+            except httpx.TransportError as e:
+                # Log the error
+                logger.error(f"Worker {worker} unreachable: {e}")
+
+                return None
+
+        # Return the responses in worker order
+        return await asyncio.gather(
+            *(send(worker) for worker in range(len(self.sockets)))
+        )
+
+    # Relay an SSE stream from a worker
+    async def handle_sse(self, request: Request) -> Response:
+        """
+        Open an SSE stream on the least loaded worker and relay it.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The relayed stream, or 502 if the worker is unreachable
+        """
+
+        # Pick the worker with the fewest open streams
+        worker = min(range(len(self._streams)), key=self._streams.__getitem__)
+
+        try:
+            # Open the stream
+            upstream = await self._send(request, worker, stream=True)
+
+        # Handle an unreachable worker
+        except httpx.TransportError as e:
+            # Log the error
+            logger.error(f"Worker {worker} unreachable: {e}")
+
+            return Response("Worker unavailable", status_code=502)
+
+        # Count the stream before the first byte is relayed
+        self._streams[worker] += 1
+
+        # Return the relayed stream
+        return StreamingResponse(
+            self._relay(upstream, worker),
+            status_code=upstream.status_code,
+            headers=_forward_headers(upstream.headers),
+        )
+
+    # Relay the chunks of an SSE stream
+    async def _relay(
+        self, upstream: httpx.Response, worker: int
+    ) -> AsyncIterator[bytes]:
+        """
+        Relay the chunks of an SSE stream, recording the session's owner on the way.
+
+        Args:
+            upstream (httpx.Response): The worker's streaming response
+            worker (int): The worker index
+
+        Yields:
+            bytes: The raw chunks of the stream
+        """
+
+        session_id = None
+        buffer = b""
+
+        try:
+            async for chunk in upstream.aiter_raw():
+                # Until the endpoint event has been seen
+                if session_id is None:
+                    # Look for the session id, it may span chunks
+                    buffer += chunk
+                    match = SESSION_ID.search(buffer)
+
+                    # Record the owner before the client can post to the session
+                    if match:
+                        session_id = match.group(1).decode()
+                        self._sessions[session_id] = worker
+                        buffer = b""
+
+                # Relay the chunk
+                yield chunk
+
+        finally:
+            # Forget the session and close the worker's stream
+            self._sessions.pop(session_id, None)
+            self._streams[worker] -= 1
+            await upstream.aclose()
+
+    # Forward a session message
+    async def handle_message(self, request: Request) -> Response:
+        """
+        Forward a message to the worker that owns its session.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The worker's response, or an error if the session is unknown
+        """
+
+        # Get the session id
+        session_id = request.query_params.get("session_id")
+
+        # If the session id is missing
+        if session_id is None:
+            return Response("session_id is required", status_code=400)
+
+        # Get the owner of the session
+        worker = self._sessions.get(session_id)
+
+        # If the session is not open on any worker
+        if worker is None:
+            return Response("Could not find session", status_code=404)
+
+        # Forward the message
+        return await self._forward(request, worker)
+
+    # Merge the readiness of the workers
+    async def handle_ready(self, request: Request) -> Response:
+        """
+        Ask every worker for its readiness, ready only when every worker is.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The report of each worker by index, 200 when ready and 503 when not
+        """
+
+        reasons: List[str] = []
+        workers: Dict[str, Any] = {}
+
+        # Ask every worker
+        for worker, response in enumerate(await self._fan_out(request)):
+            # If the worker is unreachable, it is not ready
+            if response is None:
+                workers[str(worker)] = {"status": "unreachable"}
+                reasons.append(f"worker {worker} unreachable")
+                continue
+
+            # Keep the worker's report and its reasons
+            report = workers[str(worker)] = response.json()
+            if response.status_code != 200:
+                reasons += [
+                    f"worker {worker}: {reason}" for reason in report.get("reasons", [])
+                ] or [f"worker {worker} not ready"]
+
+        # Return the merged report
+        return JSONResponse(
+            {
+                "status": "not_ready" if reasons else "ready",
+                "reasons": reasons,
+                "workers": workers,
+            },
+            status_code=503 if reasons else 200,
+        )
+
+    # Merge the circuit states of the workers
+    async def handle_circuits(self, request: Request) -> Response:
+        """
+        Ask every worker for its circuit states, keeping the worst state of each circuit.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The merged states and the states of each worker by index
+        """
+
+        circuits: Dict[str, str] = {}
+        workers: Dict[str, Any] = {}
+
+        # Ask every worker
+        for worker, response in enumerate(await self._fan_out(request)):
+            # If the worker is unreachable, skip it
+            if response is None:
+                workers[str(worker)] = {"status": "unreachable"}
+                continue
+
+            # Keep the worker's states and the worst state of each circuit
+            report = workers[str(worker)] = response.json()
+            for name, state in report.get("circuits", {}).items():
+                circuits[name] = max(
+                    circuits.get(name, state), state, key=CIRCUIT_STATES.index
+                )
+
+        # Return the merged states
+        return JSONResponse(
+            {
+                "status": (
+                    "ok"
+                    if all(state == "closed" for state in circuits.values())
+                    and all("circuits" in report for report in workers.values())
+                    else "degraded"
+                ),
+                "circuits": circuits,
+                "workers": workers,
+            }
+        )
+
+    # Merge the metrics of the workers
+    async def handle_metrics(self, request: Request) -> Response:
+        """
+        Scrape every worker and merge their metrics, each sample labeled with its worker.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The merged exposition text, or 502 if no worker is reachable
+        """
+
+        # Scrape every worker, an unreachable worker is left out
+        expositions = {
+            str(worker): response.text
+            for worker, response in enumerate(await self._fan_out(request))
+            if response is not None
+        }
+
+        # If no worker answered
+        if not expositions:
+            return Response("Worker unavailable", status_code=502)
+
+        # Return the merged metrics
+        return Response(merge_expositions(expositions), media_type=CONTENT_TYPE)
+
+    # Forward any other request
+    async def handle_any(self, request: Request) -> Response:
+        """
+        Forward a request that is not tied to a session to the next worker.
+
+        Args:
+            request (Request): The request object
+
+        Returns:
+            Response: The worker's response
+        """
+
+        # Forward the request round-robin
+        return await self._forward(request, next(self._next))
+
+    # Build the front app
+    def create_app(self, debug: bool = False) -> Starlette:
+        """
+        Build the front app.
+
+        Args:
+            debug (bool): Debug mode
+
+        Returns:
+            Starlette: The front app
+        """
+
+        # Return the app
+        return Starlette(
+            debug=debug,
+            lifespan=self.lifespan,
+            routes=[
+                # SSE streams and their messages are pinned to a worker
+                Route("/sse", endpoint=self.handle_sse),
+                Route("/messages/", endpoint=self.handle_message, methods=["POST"]),
+                # Per process figures are merged over the workers
+                Route("/ready", endpoint=self.handle_ready, methods=["GET"]),
+                Route(
+                    "/health/circuits", endpoint=self.handle_circuits, methods=["GET"]
+                ),
+                Route("/metrics", endpoint=self.handle_metrics, methods=["GET"]),
+                # Everything else goes to any worker
+                Route("/{path:path}", endpoint=self.handle_any, methods=METHODS),
+            ],
+        )
+
+
+# Wait for the workers to listen
+def _wait_for_workers(
+    sockets: List[str],
+    processes: List[multiprocessing.Process],
+    timeout: float,
+) -> None:
+    """
+    Wait until every worker listens on its socket.
+
+    Args:
+        sockets (List[str]): Unix socket paths of the workers
+        processes (List[multiprocessing.Process]): The worker processes
+        timeout (float): Seconds to wait
+
+    Raises:
+        RuntimeError: If a worker exits or does not start in time
+    """
+
+    # Set the deadline
+    deadline = time.monotonic() + timeout
+
+    for path, process in zip(sockets, processes):
+        # Wait for the socket to appear
+        while not os.path.exists(path):
+            # If the worker exited
+            if not process.is_alive():
+                # Raise an error
+                raise RuntimeError(f"Worker exited with code {process.exitcode}")
+
+            # If the deadline passed
+            if time.monotonic() > deadline:
+                # Raise an error
+                raise RuntimeError(f"Worker did not start in {timeout:g}s")
+
+            # Wait a moment
+            time.sleep(0.05)
+
+
+# Run the server in several worker processes
+def run_workers(
+    app: str,
+    workers: int,
+    host: str,
+    port: int,
+    transport: str = "sse",
+    debug: bool = False,
+    start_timeout: float = SERPAPI_WORKER_START_TIMEOUT,
+    stop_timeout: float = SERPAPI_WORKER_STOP_TIMEOUT,
+) -> None:
+    """
+    Run the server in several worker processes behind a session-affine front process.
+
+    Args:
+        app (str): The factory of the server to serve, as "module:function"
+        workers (int): Number of worker processes
+        host (str): Host to bind to
+        port (int): Port to listen on
+        transport (str): The transports to serve
+        debug (bool): Debug mode
+        start_timeout (float): Seconds to wait for the workers to start
+        stop_timeout (float): Seconds to wait for each worker to stop before killing it
+    """
+
+    # Give every worker a private Unix socket
+    directory = tempfile.mkdtemp(prefix="serpapi-google-mcp-server-")
+    sockets = [os.path.join(directory, f"worker-{i}.sock") for i in range(workers)]
+
+    # Start the workers, spawned so they do not inherit the front process's state
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_serve_worker,
+            args=(app, path, transport, debug),
+            name=f"worker-{i}",
+            daemon=True,
+        )
+        for i, path in enumerate(sockets)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        # Wait for the workers
+        _wait_for_workers(sockets, processes, start_timeout)
+
+        # Uvicorn re-raises SIGTERM after shutting down, exit instead of dying
+        # so the workers below are stopped rather than orphaned
+        signal.signal(signal.SIGTERM, _exit)
+
+        # Run the front process, with the uvicorn logs on the log thread
+        router = SessionRouter(sockets)
+        configure_uvicorn_logging()
+        uvicorn.run(router.create_app(debug), host=host, port=port, log_config=None)
+
+    finally:
+        # Stop the workers
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(stop_timeout)
+
+            # Kill a worker still waiting on open streams
+            if process.is_alive():
+                process.kill()
+
+        # Remove the sockets
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# Exports
+__all__ = ["SessionRouter", "run_workers"]
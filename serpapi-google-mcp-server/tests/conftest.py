@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the tests of serpapi-google-mcp-server.
+"""
+
+# Third party imports
+import pytest
+
+
+# Backend of the async tests
+@pytest.fixture
+def anyio_backend() -> str:
+    """
+    Run the async tests on asyncio, the event loop the server runs on.
+
+    Returns:
+        str: The backend name
+    """
+
+    # Return the backend
+    return "asyncio"
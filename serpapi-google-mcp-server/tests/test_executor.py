@@ -0,0 +1,175 @@
+"""
+Tests for the executor module of serpapi-google-mcp-server.
+"""
+
+# Standard library imports
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Third party imports
+import pytest
+
+# Local imports
+from serpapi_google_mcp_server.utils.circuit_breaker import (
+    CircuitBreakers,
+    CircuitOpenError,
+)
+from serpapi_google_mcp_server.utils.executor import SearchExecutor
+from serpapi_google_mcp_server.utils.fixtures import (
+    FixtureCorpus,
+    FixtureNotFoundError,
+)
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# Breaker name of searches made outside a tool call
+BREAKER = "serpapi.com/-"
+
+
+# Search executor answering every search after a delay
+class DelayedExecutor(SearchExecutor):
+    """
+    Search executor whose searches block their thread for a delay instead of calling
+    SerpApi.
+
+    Attributes:
+        delay (float): Seconds each search takes
+    """
+
+    # Constructor
+    def __init__(self, delay: float, **options):
+        """
+        Initialize the executor.
+
+        Args:
+            delay (float): Seconds each search takes
+            **options: Options of the executor, see SearchExecutor
+        """
+
+        # Set the delay
+        super().__init__(fixtures_mode="off", **options)
+        self.delay = delay
+
+    # Blocking search, run on the thread pool
+    def _fetch(
+        self, params: Dict[str, Any], key: Optional[str]
+    ) -> Tuple[Dict[str, Any], int, Mapping[str, str]]:
+        """
+        Block for the delay and answer the search.
+
+        Args:
+            params (Dict[str, Any]): The search parameters
+            key (Optional[str]): The only top-level key to materialize, or None for all
+
+        Returns:
+            Tuple[Dict[str, Any], int, Mapping[str, str]]: The results, status code and headers
+        """
+
+        # Take the time of a search
+        time.sleep(self.delay)
+
+        # Return the results
+        return {"q": params["q"]}, 200, {}
+
+
+async def test_slow_local_queue_does_not_open_the_circuit():
+    """Searches that wait for a free slot are not slow calls."""
+
+    # One search at a time, so the last of 10 searches waits for the other nine
+    breakers = CircuitBreakers(window=10, min_calls=5, slow_call=0.1, slow_rate=0.5)
+    executor = DelayedExecutor(
+        0.03, max_workers=1, timeout=10, circuit_breakers=breakers
+    )
+
+    try:
+        # Run the searches at once
+        results = await asyncio.gather(
+            *(executor.search({"q": str(i)}) for i in range(10))
+        )
+
+    finally:
+        executor.shutdown()
+
+    assert results == [{"q": str(i)} for i in range(10)]
+    assert breakers.states() == {BREAKER: "closed"}
+
+
+async def test_timeout_in_local_queue_is_not_a_failure():
+    """Searches that time out before reaching SerpApi do not count as failures."""
+
+    # The first search holds the only slot past the timeout of the others
+    breakers = CircuitBreakers(window=4, min_calls=2, error_rate=0.5)
+    executor = DelayedExecutor(
+        0.3, max_workers=1, timeout=0.2, circuit_breakers=breakers
+    )
+
+    try:
+        # Run the searches at once
+        results = await asyncio.gather(
+            *(executor.search({"q": str(i)}) for i in range(4)),
+            return_exceptions=True,
+        )
+
+    finally:
+        executor.shutdown()
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    # Only the search that reached SerpApi counts, as a failure
+    assert breakers.states() == {BREAKER: "closed"}
+    assert breakers.get("serpapi.com", "-")._outcomes == deque([(True, False)])
+
+
+async def test_slow_searches_open_the_circuit():
+    """Searches SerpApi is slow to answer still open the circuit."""
+
+    breakers = CircuitBreakers(window=4, min_calls=4, slow_call=0.05, slow_rate=0.5)
+    executor = DelayedExecutor(
+        0.1, max_workers=4, timeout=10, circuit_breakers=breakers
+    )
+
+    try:
+        # Run the searches at once
+        await asyncio.gather(*(executor.search({"q": str(i)}) for i in range(4)))
+
+        # The next search fails fast
+        with pytest.raises(CircuitOpenError):
+            await executor.search({"q": "next"})
+
+    finally:
+        executor.shutdown()
+
+    assert breakers.states() == {BREAKER: "open"}
+
+
+async def test_replayed_searches_ignore_the_api_key(tmp_path):
+    """A recorded search is replayed for any API key, a missing engine fails."""
+
+    path = str(tmp_path / "corpus.jsonl.gz")
+    params = {"engine": "google_finance", "q": "GOOGL:NASDAQ"}
+    FixtureCorpus(path).put(
+        "google_finance",
+        {**params, "api_key": "0123456789abcdef"},
+        200,
+        "application/json",
+        '{"summary": {"title": "Alphabet"}, "api_key": "0123456789abcdef"}',
+        secrets=["0123456789abcdef"],
+    )
+    executor = SearchExecutor(fixtures_mode="replay", fixtures_path=path)
+
+    try:
+        # Replay the search with another API key, for one key and in full
+        summary = await executor.search({**params, "api_key": "other"}, "summary")
+        results = await executor.search(params)
+
+        # An engine never recorded fails
+        with pytest.raises(FixtureNotFoundError, match="google_news"):
+            await executor.search({"engine": "google_news", "q": "rates"})
+
+    finally:
+        executor.shutdown()
+
+    assert summary == {"summary": {"title": "Alphabet"}}
+    assert results["api_key"] == "REDACTED"
@@ -0,0 +1,70 @@
+"""
+Tests for the extraction module of serpapi-google-mcp-server.
+"""
+
+# Standard library imports
+import json
+
+# Third party imports
+import pytest
+
+# Local imports
+from serpapi_google_mcp_server.utils import extract
+from serpapi_google_mcp_server.utils.extract import extract_key
+
+# A response with the key between larger ones
+BODY = json.dumps(
+    {
+        "search_metadata": {"id": "1", "status": "Success"},
+        "jobs_results": [{"title": "Engineer", "salary": 1.5, "tags": ["a", None]}],
+        "filters": [{"name": "x" * 1000}],
+    }
+).encode()
+
+
+# Run every test with and without the streaming parser
+@pytest.fixture(params=["ijson", "json"])
+def parser(request, monkeypatch) -> str:
+    """
+    Select the parser, leaving ijson out to test the fallback.
+
+    Args:
+        request: The pytest request
+        monkeypatch: The pytest monkeypatch fixture
+
+    Returns:
+        str: The parser name
+    """
+
+    # If the streaming parser is tested
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(extract, "ijson", None)
+
+    # Return the parser name
+    return request.param
+
+
+def test_extracts_the_key(parser):
+    """Only the requested key is returned, with JSON types kept."""
+
+    assert extract_key(BODY, "jobs_results") == {
+        "jobs_results": [{"title": "Engineer", "salary": 1.5, "tags": ["a", None]}]
+    }
+
+
+def test_missing_key_surfaces_the_error(parser):
+    """A missing key returns the SerpApi error instead."""
+
+    body = json.dumps({"error": "Invalid API key", "search_metadata": {}}).encode()
+
+    assert extract_key(body, "jobs_results") == {"error": "Invalid API key"}
+
+
+def test_nested_keys_are_not_matched(parser):
+    """Only a top-level key is extracted, not a key of the same name deeper down."""
+
+    body = json.dumps({"search_metadata": {"jobs_results": [1]}}).encode()
+
+    assert extract_key(body, "jobs_results") == {}
@@ -0,0 +1,124 @@
+"""
+Tests for the streamable HTTP endpoint of serpapi-google-mcp-server.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Third party imports
+import httpx
+import pytest
+
+# Local imports
+from serpapi_google_mcp_server.server import SerpAPIGoogleMCPServer
+from serpapi_google_mcp_server.tools import finance_tool
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# Summary the fake SerpApi answers with
+SUMMARY = {"title": "Alphabet Inc Class A", "price": "170.00"}
+
+
+# Client of the server's streamable HTTP endpoint
+@pytest.fixture
+async def client(monkeypatch, tmp_path):
+    """
+    Serve the server over streamable HTTP in front of a fake SerpApi.
+
+    Args:
+        monkeypatch: Sets the API key the tools send and replaces the searches
+        tmp_path: Keeps the result cache the server opens out of the tree
+
+    Yields:
+        httpx.AsyncClient: A client of the app, with the searches made in its "searches" attribute
+    """
+
+    # Set the API key the tools send
+    monkeypatch.setattr(finance_tool, "SERPAPI_API_KEY", "key")
+
+    # Function to answer as SerpApi
+    def fetch(
+        params: Dict[str, Any], key: Optional[str]
+    ) -> Tuple[Dict[str, Any], int, Mapping[str, str]]:
+        searches.append((params, key))
+        return {"summary": SUMMARY}, 200, {}
+
+    # Build the server in a temporary directory, and replace its searches
+    searches = []
+    monkeypatch.chdir(tmp_path)
+    server = SerpAPIGoogleMCPServer()
+    monkeypatch.setattr(server.executor, "_fetch", fetch)
+
+    # Yield the client
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(server.create_app("streamable-http")),
+        base_url="http://test",
+    ) as client:
+        client.searches = searches
+        yield client
+
+    # Shut down the search executor
+    server.executor.shutdown()
+
+
+# Call a tool over the endpoint
+async def call(
+    client: httpx.AsyncClient, name: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Call a tool with a tools/call POST.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app
+        name (str): The tool name
+        arguments (Dict[str, Any]): The tool arguments
+
+    Returns:
+        Dict[str, Any]: The tool result
+    """
+
+    # Send the request
+    response = await client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        },
+    )
+
+    # Return the result
+    return response.json()["result"]
+
+
+async def test_get_finance_data(client):
+    """The finance summary is searched once, then answered from the result cache."""
+
+    # Call the tool twice
+    first = await call(client, "get-finance-data", {"query": "GOOGL:NASDAQ"})
+    second = await call(client, "get-finance-data", {"query": "GOOGL:NASDAQ"})
+
+    assert first["isError"] is False
+    assert json.loads(first["content"][0]["text"]) == SUMMARY
+    assert second["content"] == first["content"]
+
+    # Only the first call searched, for the summary alone
+    assert client.searches == [
+        (
+            {"engine": "google_finance", "q": "GOOGL:NASDAQ", "api_key": "key"},
+            "summary",
+        )
+    ]
+
+
+async def test_tool_errors_are_results(client):
+    """An invalid call is answered with an error result, not a JSON-RPC error."""
+
+    result = await call(client, "get-finance-data", {"query": ""})
+
+    assert result["isError"] is True
+    assert "Query is required" in result["content"][0]["text"]
+    assert client.searches == []
@@ -0,0 +1,22 @@
+"""
+Tests for the projection TTLs of serpapi-google-mcp-server.
+"""
+
+# Local imports
+from serpapi_google_mcp_server.server import SerpAPIGoogleMCPServer
+
+
+def test_server_caps_projections_at_the_result_cache(monkeypatch, tmp_path):
+    """Projections live no longer than the search results of the tool's engine."""
+
+    # Keep the result cache the server opens out of the tree
+    monkeypatch.chdir(tmp_path)
+    server = SerpAPIGoogleMCPServer()
+
+    # The TTL of the tool's engine bounds the projection
+    monkeypatch.setenv("SERPAPI_CACHE_TTL_GOOGLE_FINANCE", "5")
+    assert server._result_ttl("get-finance-data") == 5
+
+    # With the result cache disabled, projections are not cached
+    monkeypatch.setattr(server.executor, "cache", None)
+    assert server._result_ttl("get-finance-data") == 0
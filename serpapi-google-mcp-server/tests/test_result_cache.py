@@ -0,0 +1,129 @@
+"""
+Tests for the result cache module of serpapi-google-mcp-server.
+"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from serpapi_google_mcp_server.utils.result_cache import ResultCache
+
+# Search parameters of a finance search
+PARAMS = {"engine": "google_finance", "q": "GOOG:NASDAQ", "api_key": "secret"}
+
+
+# Open a cache in a temporary directory
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    """
+    Open a result cache in a temporary directory.
+
+    Args:
+        tmp_path: The pytest temporary directory
+
+    Yields:
+        ResultCache: The cache
+    """
+
+    # Open the cache and close it after the test
+    cache = ResultCache(directory=str(tmp_path), max_bytes=10_000, max_stale=60)
+    yield cache
+    cache.close()
+
+
+# Move an entry's expiry into the past
+def expire(cache: ResultCache, seconds_ago: float) -> None:
+    """
+    Make every entry expire some seconds ago.
+
+    Args:
+        cache (ResultCache): The cache
+        seconds_ago (float): Seconds since the entries expired
+    """
+
+    # Rewrite the expiry of the entries
+    cache._db.execute(
+        "UPDATE results SET expires_at = strftime('%s', 'now') - ?", (seconds_ago,)
+    )
+    cache._db.commit()
+
+
+def test_keys_ignore_the_api_key_and_order():
+    """The API key and parameter order do not change the key."""
+
+    assert ResultCache.make_key(PARAMS) == ResultCache.make_key(
+        {"q": "GOOG:NASDAQ", "engine": "google_finance", "api_key": "other"}
+    )
+    assert ResultCache.make_key(PARAMS) != ResultCache.make_key(
+        {**PARAMS, "q": "MSFT:NASDAQ"}
+    )
+
+
+def test_ttl_per_engine(monkeypatch):
+    """Engines have their own TTLs, overridable from the environment."""
+
+    assert ResultCache.ttl("google_finance") == 60
+    monkeypatch.setenv("SERPAPI_CACHE_TTL_GOOGLE_FINANCE", "5")
+    assert ResultCache.ttl("google_finance") == 5
+
+
+def test_hits_are_counted_as_searches_saved(cache):
+    """Cached results are served and each hit counts a search saved."""
+
+    assert cache.get(PARAMS) is None
+    cache.set(PARAMS, {"summary": {"price": 1}})
+
+    assert cache.get(PARAMS) == {"summary": {"price": 1}}
+    assert cache.get({**PARAMS, "api_key": "other"}) == {"summary": {"price": 1}}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["searches_saved_by_engine"] == {"google_finance": 2}
+
+
+def test_results_persist_across_restarts(cache, tmp_path):
+    """Results and searches saved survive reopening the database."""
+
+    cache.set(PARAMS, {"summary": {}})
+    cache.get(PARAMS)
+    cache.close()
+
+    reopened = ResultCache(directory=str(tmp_path))
+    try:
+        assert reopened.get(PARAMS) == {"summary": {}}
+        assert reopened.stats()["searches_saved"] == 2
+    finally:
+        reopened.close()
+
+
+def test_expired_results_are_served_stale(cache):
+    """Expired results are a miss but can be served stale until max_stale."""
+
+    cache.set(PARAMS, {"summary": {}})
+    expire(cache, 30)
+
+    assert cache.get(PARAMS) is None
+    assert cache.get_stale(PARAMS) == {"summary": {}}
+
+    expire(cache, 90)
+    assert cache.get_stale(PARAMS) is None
+
+
+def test_least_recently_used_results_are_evicted(cache):
+    """The cache evicts the least recently used results over max_bytes."""
+
+    # Each result takes about 4 kB, so two fit
+    for q in ("a", "b", "c"):
+        cache.set({**PARAMS, "q": q}, {"data": q * 4000})
+
+    assert cache.get({**PARAMS, "q": "a"}) is None
+    assert cache.get({**PARAMS, "q": "c"}) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_engines_with_no_ttl_are_not_cached(cache, monkeypatch):
+    """An engine with a TTL of 0 is never cached."""
+
+    monkeypatch.setenv("SERPAPI_CACHE_TTL_GOOGLE_FINANCE", "0")
+    cache.set(PARAMS, {"summary": {}})
+
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,58 @@
+"""
+Tests for the retry module of serpapi-google-mcp-server.
+"""
+
+# Third party imports
+import pytest
+import requests
+
+# Local imports
+from serpapi_google_mcp_server.utils.retry import RetryPolicy
+
+
+@pytest.mark.parametrize(
+    "status_code, error, retried",
+    [
+        (200, None, False),
+        (400, None, False),
+        (401, None, False),
+        (429, None, True),
+        (503, None, True),
+        (None, requests.ConnectionError(), True),
+        (None, requests.Timeout(), True),
+        (None, ValueError("bad JSON"), False),
+    ],
+)
+def test_should_retry(status_code, error, retried):
+    """Throttling, server errors, connection failures and timeouts are retried."""
+
+    assert RetryPolicy.should_retry(status_code, error) is retried
+
+
+def test_delays_are_jittered_and_capped():
+    """Delays stay between 0 and the capped exponential backoff."""
+
+    policy = RetryPolicy(attempts=10, base_delay=0.1, max_delay=0.3)
+
+    for attempt, cap in ((1, 0.1), (2, 0.2), (3, 0.3), (6, 0.3)):
+        delays = [policy.next_delay(attempt, remaining=10) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+
+
+def test_attempts_run_out():
+    """No delay is given once the last attempt failed."""
+
+    policy = RetryPolicy(attempts=2, base_delay=0.1, max_delay=1)
+
+    assert policy.next_delay(1, remaining=10) is not None
+    assert policy.next_delay(2, remaining=10) is None
+    assert policy.stats() == {"retries": 1, "exhausted": 1}
+
+
+def test_time_runs_out():
+    """No delay is given when the next attempt could not start before the timeout."""
+
+    policy = RetryPolicy(attempts=5, base_delay=1, max_delay=1)
+
+    assert policy.next_delay(1, remaining=0) is None
+    assert policy.stats()["exhausted"] == 1
@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the tests of the utilities every server keeps its own copy of.
+"""
+
+# Standard library imports
+import importlib
+from types import ModuleType
+from typing import Callable
+
+# Third party imports
+import pytest
+
+# Server packages whose utilities are tested
+PACKAGES = (
+    "news_api_mcp_server",
+    "open_weather_mcp_server",
+    "serpapi_google_mcp_server",
+)
+
+# Server packages calling their upstream through httpx transports, SerpApi searches go
+# through its own executor instead
+HTTPX_PACKAGES = PACKAGES[:2]
+
+
+# Register the markers
+def pytest_configure(config) -> None:
+    """
+    Register the markers of the shared tests.
+
+    Args:
+        config: The pytest configuration
+    """
+
+    # Register the marker of the tests of the httpx transports
+    config.addinivalue_line(
+        "markers", "httpx: run only for the servers with httpx transports"
+    )
+
+
+# Run the tests once per server package
+def pytest_generate_tests(metafunc) -> None:
+    """
+    Run every test using the package fixture once per server package, or once per
+    server with httpx transports for the tests marked httpx.
+
+    Args:
+        metafunc: The pytest test function metadata
+    """
+
+    # If the test runs per package
+    if "package" in metafunc.fixturenames:
+        httpx_only = metafunc.definition.get_closest_marker("httpx") is not None
+        metafunc.parametrize("package", HTTPX_PACKAGES if httpx_only else PACKAGES)
+
+
+# Backend of the async tests
+@pytest.fixture
+def anyio_backend() -> str:
+    """
+    Run the async tests on asyncio, the event loop the servers run on.
+
+    Returns:
+        str: The backend name
+    """
+
+    # Return the backend
+    return "asyncio"
+
+
+# Importer of the utilities of the package under test
+@pytest.fixture
+def utils(package: str) -> Callable[[str], ModuleType]:
+    """
+    Import the utility modules of the package under test.
+
+    Args:
+        package (str): The import name of the package
+
+    Returns:
+        Callable[[str], ModuleType]: Imports a utility module by name
+    """
+
+    # Return the importer
+    return lambda name: importlib.import_module(f"{package}.utils.{name}")
@@ -0,0 +1,271 @@
+"""
+Tests for the circuit breaker module of every server.
+"""
+
+# Standard library imports
+import asyncio
+from types import ModuleType
+from typing import Any, Callable
+
+# Third party imports
+import httpx
+import pytest
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# Breaker name of requests made outside a tool call
+BREAKER = "upstream.test/-"
+
+
+# Circuit breaker module of the package under test
+@pytest.fixture
+def circuit_breaker(utils) -> ModuleType:
+    """
+    Import the circuit breaker module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("circuit_breaker")
+
+
+# Build a client on the transport chain of create_http_client
+def chain_client(
+    utils: Callable[[str], ModuleType], delay: float, limiter: Any, breakers: Any
+) -> httpx.AsyncClient:
+    """
+    Build a client whose requests go through the breaker, retries and rate limiter to an
+    upstream answering after a delay.
+
+    Args:
+        utils (Callable[[str], ModuleType]): Imports a utility module of the package under test
+        delay (float): Seconds the upstream takes to answer
+        limiter (RateLimiter): The rate limiter
+        breakers (CircuitBreakers): The circuit breakers
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+
+    # Upstream answering after the delay
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={})
+
+    # Stack the transports as create_http_client does
+    rate_limiter, retry = utils("rate_limiter"), utils("retry")
+    transport = rate_limiter.RateLimitedTransport(
+        httpx.MockTransport(upstream), limiter
+    )
+    transport = retry.RetryTransport(transport, retry.RetryPolicy(hedge=False))
+    transport = utils("circuit_breaker").CircuitBreakerTransport(transport, breakers)
+
+    # Return the client
+    return httpx.AsyncClient(
+        transport=transport,
+        base_url="https://upstream.test",
+        event_hooks=utils("metrics").UPSTREAM_EVENT_HOOKS,
+    )
+
+
+def test_opens_on_error_rate(circuit_breaker):
+    """The breaker opens once half the recent calls failed and then refuses calls."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=4, min_calls=4, error_rate=0.5
+    )
+
+    # Two successes and two failures reach the threshold
+    for failed in (False, True, False, True):
+        breaker.record(*breaker.acquire(), failed=failed)
+
+    assert breaker.state() == "open"
+    with pytest.raises(circuit_breaker.CircuitOpenError):
+        breaker.acquire()
+    assert breaker.stats() == {"opened": 1, "rejected": 1}
+
+
+def test_stays_closed_below_min_calls(circuit_breaker):
+    """Failures do not open the breaker before enough calls were made."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=10, min_calls=5, error_rate=0.5
+    )
+
+    # Four failures are below the minimum
+    for _ in range(4):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    assert breaker.state() == "closed"
+
+
+def test_opens_on_slow_rate(circuit_breaker):
+    """Calls slower than slow_call open the breaker past the slow rate."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, slow_call=0.01, slow_rate=0.5
+    )
+
+    # Record successful calls that started long ago
+    for _ in range(2):
+        start, admission = breaker.acquire()
+        breaker.record(start - 1, admission, failed=False)
+
+    assert breaker.state() == "open"
+
+
+def test_half_open_probes_close_the_breaker(circuit_breaker):
+    """After the cool-down, successful probes close the breaker."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, open_seconds=0, probes=2
+    )
+    for _ in range(2):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    # The cool-down is over at once, so the breaker probes
+    assert breaker.state() == "half_open"
+    first, second = breaker.acquire(), breaker.acquire()
+
+    # A third call is refused while both probes are out
+    with pytest.raises(circuit_breaker.CircuitOpenError):
+        breaker.acquire()
+
+    # Both probes succeed
+    breaker.record(*first, failed=False)
+    breaker.record(*second, failed=False)
+    assert breaker.state() == "closed"
+
+
+def test_failed_probe_opens_the_breaker(circuit_breaker):
+    """A failed probe opens the breaker again."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, open_seconds=0.05, probes=1
+    )
+    for _ in range(2):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    # Wait out the cool-down, then fail the probe
+    breaker._opened_at -= 1
+    breaker.record(*breaker.acquire(), failed=True)
+
+    assert breaker.state() == "open"
+    assert breaker.stats()["opened"] == 2
+
+
+def test_abandoned_probe_is_freed(circuit_breaker):
+    """A cancelled probe frees its slot for the next call."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, open_seconds=0, probes=1
+    )
+    for _ in range(2):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    # Take the probe and abandon it
+    _, admission = breaker.acquire()
+    breaker.abandon(admission)
+
+    # The next call can probe
+    breaker.record(*breaker.acquire(), failed=False)
+    assert breaker.state() == "closed"
+
+
+def test_calls_admitted_closed_are_not_probes(circuit_breaker):
+    """A call let through closed that ends while the breaker probes does not count."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, open_seconds=0, probes=1
+    )
+
+    # A slow call is let through, then two others fail and open the breaker
+    slow = breaker.acquire()
+    for _ in range(2):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    # The cool-down is over at once, the slow call ends while the probe is out
+    probe = breaker.acquire()
+    breaker.record(*slow, failed=False)
+    assert breaker.state() == "half_open"
+
+    # Its abandon does not free the probe either
+    breaker.abandon(slow[1])
+    with pytest.raises(circuit_breaker.CircuitOpenError):
+        breaker.acquire()
+
+    # The probe itself closes the breaker
+    breaker.record(*probe, failed=False)
+    assert breaker.state() == "closed"
+
+
+def test_probes_of_an_earlier_half_open_do_not_count(circuit_breaker):
+    """A probe that ends after its half-open state was left does not count."""
+
+    breaker = circuit_breaker.CircuitBreaker(
+        "host/tool", window=2, min_calls=2, open_seconds=0, probes=2
+    )
+    for _ in range(2):
+        breaker.record(*breaker.acquire(), failed=True)
+
+    # One probe fails and opens the breaker while the other is out
+    late, failing = breaker.acquire(), breaker.acquire()
+    breaker.record(*failing, failed=True)
+
+    # The breaker probes again, the late probe of the first round ends
+    first = breaker.acquire()
+    breaker.record(*late, failed=False)
+    breaker.record(*first, failed=False)
+    assert breaker.state() == "half_open"
+
+    # Two probes of the current round are needed
+    breaker.record(*breaker.acquire(), failed=False)
+    assert breaker.state() == "closed"
+
+
+@pytest.mark.httpx
+async def test_slow_local_queue_does_not_open_the_circuit(utils, circuit_breaker):
+    """Requests that wait for rate limiter tokens are not slow calls."""
+
+    # One token every 50 ms, so the last of 20 requests waits about a second
+    limiter = utils("rate_limiter").RateLimiter(
+        rate=20, burst=1, max_queue=100, max_wait=30, hosts={}
+    )
+    breakers = circuit_breaker.CircuitBreakers(
+        window=20, min_calls=5, slow_call=0.2, slow_rate=0.5
+    )
+
+    # Send the requests at once to a fast upstream
+    async with chain_client(utils, 0.01, limiter, breakers) as client:
+        responses = await asyncio.gather(*(client.get("/data") for _ in range(20)))
+
+    assert [response.status_code for response in responses] == [200] * 20
+    assert breakers.states() == {BREAKER: "closed"}
+
+
+@pytest.mark.httpx
+async def test_slow_upstream_opens_the_circuit(utils, circuit_breaker):
+    """Requests the upstream is slow to answer still open the circuit."""
+
+    limiter = utils("rate_limiter").RateLimiter(
+        rate=0, burst=1, max_queue=100, max_wait=30, hosts={}
+    )
+    breakers = circuit_breaker.CircuitBreakers(
+        window=5, min_calls=5, slow_call=0.05, slow_rate=0.5
+    )
+
+    # Send the requests to a slow upstream
+    async with chain_client(utils, 0.1, limiter, breakers) as client:
+        await asyncio.gather(*(client.get("/data") for _ in range(5)))
+
+        # The next request fails fast
+        with pytest.raises(circuit_breaker.CircuitOpenError):
+            await client.get("/data")
+
+    assert breakers.states() == {BREAKER: "open"}
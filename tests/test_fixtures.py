@@ -0,0 +1,241 @@
+"""
+Tests for the fixtures module of every server.
+"""
+
+# Standard library imports
+import gzip
+import json
+from types import ModuleType
+
+# Third party imports
+import httpx
+import pytest
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+# API key sent to the test upstream, long enough to be scrubbed from bodies
+SECRET = "0123456789abcdef"
+
+
+# Fixtures module of the package under test
+@pytest.fixture
+def fixtures(utils) -> ModuleType:
+    """
+    Import the fixtures module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("fixtures")
+
+
+# Read the lines of a corpus file
+def read_lines(path) -> list:
+    """
+    Read the fixtures of a corpus file, one per line.
+
+    Args:
+        path: The corpus file
+
+    Returns:
+        list: The fixtures
+    """
+
+    # Return the decoded lines
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_key_drops_api_keys_and_sorts(fixtures):
+    """The key does not depend on the API key or the parameter order."""
+
+    first = fixtures.fixture_key("GET /data", {"q": "a", "appid": SECRET, "b": 1})
+    second = fixtures.fixture_key(
+        "GET /data", [("api_key", "other"), ("b", 1), ("q", "a")]
+    )
+
+    assert first == second == "GET /data?b=1&q=a"
+    assert fixtures.fixture_key("GET /data", {"apiKey": SECRET}) == "GET /data"
+
+
+def test_record_compact_reload(fixtures, tmp_path):
+    """Recorded responses survive a compaction and a reload, one per key."""
+
+    path = tmp_path / "corpus.jsonl.gz"
+    corpus = fixtures.FixtureCorpus(str(path), strict=True)
+
+    # Record a response twice, then replace it, then record another
+    corpus.put("GET /data", {"q": "a"}, 200, "application/json", '{"v": 1}')
+    corpus.put("GET /data", {"q": "a"}, 200, "application/json", '{"v": 1}')
+    corpus.put("GET /data", {"q": "a"}, 200, "application/json", '{"v": 2}')
+    corpus.put("GET /data", {"q": "b"}, 404, None, "missing")
+
+    # Each distinct response was appended
+    assert [line["body"] for line in read_lines(path)] == [
+        '{"v": 1}',
+        '{"v": 2}',
+        "missing",
+    ]
+
+    # Compaction keeps the last response of each key, sorted by key
+    corpus.compact()
+    assert [line["key"] for line in read_lines(path)] == [
+        "GET /data?q=a",
+        "GET /data?q=b",
+    ]
+
+    # A reload finds them
+    reloaded = fixtures.FixtureCorpus(str(path), strict=True)
+    assert reloaded.get("GET /data", {"q": "a"})["body"] == '{"v": 2}'
+    assert reloaded.get("GET /data", {"q": "b"})["status_code"] == 404
+    assert reloaded.fixtures() == corpus.fixtures()
+
+
+def test_secrets_echoed_in_bodies_are_scrubbed(fixtures, tmp_path):
+    """An API key echoed by the upstream is replaced, short values are left alone."""
+
+    corpus = fixtures.FixtureCorpus(str(tmp_path / "corpus.jsonl.gz"))
+
+    corpus.put(
+        "GET /data",
+        {"q": "a", "appid": SECRET},
+        200,
+        "application/json",
+        json.dumps({"url": f"/data?appid={SECRET}", "q": "a"}),
+        secrets=[SECRET, "a", None],
+    )
+
+    fixture = corpus.get("GET /data", {"q": "a"})
+    assert fixture["key"] == "GET /data?q=a"
+    assert json.loads(fixture["body"]) == {
+        "url": f"/data?appid={fixtures.REDACTED}",
+        "q": "a",
+    }
+
+
+def test_truncated_file_keeps_the_complete_lines(fixtures, tmp_path):
+    """A corpus cut short by a killed recording loads what was written in full."""
+
+    path = tmp_path / "corpus.jsonl.gz"
+    corpus = fixtures.FixtureCorpus(str(path))
+    corpus.put("GET /data", {"q": "a"}, 200, None, "first")
+    corpus.put("GET /data", {"q": "b"}, 200, None, "second")
+
+    # Cut the last gzip member short
+    content = path.read_bytes()
+    path.write_bytes(content[:-10])
+
+    reloaded = fixtures.FixtureCorpus(str(path), strict=True)
+    assert reloaded.get("GET /data", {"q": "a"})["body"] == "first"
+    assert reloaded.get("GET /data", {"q": "b"}) is None
+
+
+def test_missing_file_is_an_empty_corpus(fixtures, tmp_path):
+    """A corpus that was never recorded answers nothing."""
+
+    corpus = fixtures.FixtureCorpus(str(tmp_path / "none.jsonl.gz"))
+
+    assert corpus.fixtures() == []
+    assert corpus.get("GET /data", {"q": "a"}) is None
+
+
+def test_strict_misses_fail_and_others_fall_back(fixtures, tmp_path):
+    """
+    A miss gets a recording of the same route, the same one on every run, unless
+    strict. A route never recorded has no fallback.
+    """
+
+    path = str(tmp_path / "corpus.jsonl.gz")
+    corpus = fixtures.FixtureCorpus(path)
+    for q in ("a", "b", "c"):
+        corpus.put("GET /data", {"q": q}, 200, None, q)
+
+    # A miss falls back to a recording of its route, picked by its key
+    fallback = corpus.get("GET /data", {"q": "z"})
+    assert fallback["body"] in ("a", "b", "c")
+    assert fixtures.FixtureCorpus(path).get("GET /data", {"q": "z"}) == fallback
+    assert corpus.get("GET /other", {"q": "a"}) is None
+
+    # Strict misses fail
+    strict = fixtures.FixtureCorpus(path, strict=True)
+    assert strict.get("GET /data", {"q": "z"}) is None
+    assert strict.get("GET /data", {"q": "a"})["body"] == "a"
+
+
+@pytest.mark.httpx
+async def test_recording_then_replay(fixtures, tmp_path):
+    """Responses recorded through the transport are replayed without the network."""
+
+    path = str(tmp_path / "corpus.jsonl.gz")
+
+    # Upstream echoing the request URL, failing for the topic "down"
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("q") == "down":
+            return httpx.Response(503)
+        return httpx.Response(
+            200, json={"url": str(request.url), "key": request.headers["x-api-key"]}
+        )
+
+    # Record two requests, with the API key in the query and in a header
+    transport = fixtures.RecordingTransport(
+        httpx.MockTransport(upstream), fixtures.FixtureCorpus(path)
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="https://upstream.test",
+        headers={"X-Api-Key": SECRET},
+    ) as client:
+        recorded = await client.get("/data", params={"q": "a", "appid": SECRET})
+        assert (await client.get("/data", params={"q": "down"})).status_code == 503
+
+    # The corpus was compacted on close, server errors were not recorded and the
+    # API keys were scrubbed from the key and the body
+    lines = read_lines(path)
+    assert [line["key"] for line in lines] == ["GET /data?q=a"]
+    assert SECRET not in json.dumps(lines)
+    assert json.loads(lines[0]["body"]) == {
+        "url": f"https://upstream.test/data?q=a&appid={fixtures.REDACTED}",
+        "key": fixtures.REDACTED,
+    }
+
+    # Replay with another API key
+    corpus = fixtures.FixtureCorpus(path, strict=True)
+    async with httpx.AsyncClient(
+        transport=fixtures.ReplayTransport(corpus),
+        base_url="https://upstream.test",
+    ) as client:
+        replayed = await client.get("/data", params={"appid": "other", "q": "a"})
+
+        # A strict miss fails the request
+        with pytest.raises(fixtures.FixtureNotFoundError, match="GET /data"):
+            await client.get("/data", params={"q": "b"})
+
+    assert replayed.status_code == 200
+    assert replayed.headers["content-type"] == recorded.headers["content-type"]
+    assert replayed.json()["url"].endswith(f"appid={fixtures.REDACTED}")
+
+
+@pytest.mark.httpx
+async def test_replay_falls_back_to_the_same_route(fixtures, tmp_path):
+    """A request that was not recorded is answered with another of its route."""
+
+    path = str(tmp_path / "corpus.jsonl.gz")
+    corpus = fixtures.FixtureCorpus(path)
+    corpus.put("GET /data", {"q": "a"}, 200, "application/json", '{"q": "a"}')
+
+    async with httpx.AsyncClient(
+        transport=fixtures.ReplayTransport(corpus), base_url="https://upstream.test"
+    ) as client:
+        response = await client.get("/data", params={"q": "b"})
+
+        # A route never recorded still fails
+        with pytest.raises(fixtures.FixtureNotFoundError):
+            await client.get("/other")
+
+    assert response.json() == {"q": "a"}
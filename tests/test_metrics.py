@@ -0,0 +1,116 @@
+"""
+Tests for the metrics module of every server.
+"""
+
+# Standard library imports
+from types import ModuleType
+
+# Third party imports
+import pytest
+
+
+# Metrics module of the package under test
+@pytest.fixture
+def metrics(utils) -> ModuleType:
+    """
+    Import the metrics module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("metrics")
+
+
+def test_merge_labels_every_sample(metrics):
+    """Every sample is labeled with its process, the metadata is kept once."""
+
+    first = (
+        "# HELP calls_total Calls.\n"
+        "# TYPE calls_total counter\n"
+        'calls_total{tool="a"} 1\n'
+        "# TYPE cache_hits gauge\n"
+        "cache_hits 3\n"
+    )
+    second = first.replace(" 1\n", " 2\n").replace(" 3\n", " 4\n")
+
+    assert metrics.merge_expositions({"0": first, "1": second}).splitlines() == [
+        "# HELP calls_total Calls.",
+        "# TYPE calls_total counter",
+        'calls_total{worker="0",tool="a"} 1',
+        'calls_total{worker="1",tool="a"} 2',
+        "# TYPE cache_hits gauge",
+        'cache_hits{worker="0"} 3',
+        'cache_hits{worker="1"} 4',
+    ]
+
+
+def test_merge_keeps_histograms_together(metrics):
+    """The samples of every worker follow the metadata of their metric."""
+
+    text = metrics.Metrics(["a"]).render({"cache": {"hits": 1}})
+    merged = metrics.merge_expositions({"0": text, "1": text})
+
+    # Each metric is declared once, with twice the samples
+    lines = merged.splitlines()
+    declared = [line for line in lines if line.startswith("# TYPE")]
+    assert len(declared) == len(set(declared))
+    assert len(lines) == 2 * len(text.splitlines()) - len(
+        [line for line in text.splitlines() if line.startswith("#")]
+    )
+
+    # Samples of a metric are not separated by another metric's metadata
+    current = None
+    for line in lines:
+        if line.startswith("# TYPE"):
+            current = line.split()[2]
+        elif not line.startswith("#"):
+            assert line.startswith(current)
+
+
+def test_calls_are_exported(metrics):
+    """A success and a failure land in the histograms, the failure under its type."""
+
+    registry = metrics.Metrics(["a"])
+    tool = registry.tool("a")
+
+    # Record a success, then a failure wrapped the way the tools wrap upstream errors
+    tool.finish(tool.start(), 300)
+    start = tool.start()
+    try:
+        try:
+            raise ConnectionError("refused")
+        except ConnectionError as e:
+            raise Exception(f"Failed to call a: {e}") from e
+    except Exception as e:
+        tool.fail(start, e)
+
+    # The calls are counted, the failure under the type it was raised from
+    lines = registry.render().splitlines()
+    assert 'mcp_tool_calls_total{tool="a"} 2' in lines
+    assert 'mcp_tool_in_flight{tool="a"} 0' in lines
+    assert 'mcp_tool_errors_total{tool="a",type="ConnectionError"} 1' in lines
+    assert not any("_errors_total" in line and "Exception" in line for line in lines)
+
+    # Both calls are timed, only the success has a size
+    assert 'mcp_tool_duration_seconds_count{tool="a"} 2' in lines
+    assert 'mcp_tool_duration_seconds_bucket{tool="a",le="+Inf"} 2' in lines
+    assert 'mcp_tool_response_size_chars_bucket{tool="a",le="256"} 0' in lines
+    assert 'mcp_tool_response_size_chars_bucket{tool="a",le="1024"} 1' in lines
+    assert 'mcp_tool_response_size_chars_sum{tool="a"} 300.0' in lines
+
+
+def test_unwrapped_failures_keep_their_type(metrics):
+    """A failure raised from nothing is counted under its own type."""
+
+    registry = metrics.Metrics(["a"])
+    tool = registry.tool("a")
+    tool.fail(tool.start(), ValueError("bad argument"))
+
+    assert 'mcp_tool_errors_total{tool="a",type="ValueError"} 1' in (
+        registry.render().splitlines()
+    )
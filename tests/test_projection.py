@@ -0,0 +1,114 @@
+"""
+Tests for the projection module of every server.
+"""
+
+# Standard library imports
+import copy
+import time
+from types import ModuleType
+
+# Third party imports
+import pytest
+
+
+# Projection module of the package under test
+@pytest.fixture
+def projection(utils) -> ModuleType:
+    """
+    Import the projection module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("projection")
+
+
+@pytest.mark.parametrize(
+    "fields, parsed",
+    [
+        (None, None),
+        ([], None),
+        ("", None),
+        (["b", "a.c", "b"], (("a", "c"), ("b",))),
+        ("a, b.c", (("a",), ("b", "c"))),
+        ("a,", (("a",),)),
+        ("a,,b", (("a",), ("b",))),
+        (",", None),
+        (["$.items[*].name", "$.total"], (("items", "name"), ("total",))),
+    ],
+)
+def test_parse_fields(projection, fields, parsed):
+    """Paths are normalized, deduplicated and sorted, empty paths are dropped."""
+
+    assert projection.parse_fields(fields) == parsed
+
+
+def test_parse_fields_rejects_non_strings(projection):
+    """Fields that are not strings are refused."""
+
+    with pytest.raises(ValueError, match="list of strings"):
+        projection.parse_fields(["a", 1])
+
+
+def test_project(projection):
+    """Objects keep the requested keys, lists are projected item by item."""
+
+    data = {
+        "total": 2,
+        "items": [{"name": "a", "meta": {"x": 1, "y": 2}}, {"name": "b", "meta": {}}],
+    }
+    original = copy.deepcopy(data)
+    project, parse_fields = projection.project, projection.parse_fields
+
+    assert project(data, parse_fields(["items.name", "items.meta.x"])) == {
+        "items": [{"name": "a", "meta": {"x": 1}}, {"name": "b", "meta": {}}]
+    }
+    assert project(data, parse_fields(["items", "items.name"])) == {
+        "items": data["items"]
+    }
+    assert project(data, parse_fields(["missing"])) == {}
+    assert project(data, None) is data
+    assert data == original
+
+
+def test_cache_hits_and_evicts(projection):
+    """Projections are served until evicted by newer ones."""
+
+    cache = projection.ProjectionCache(max_entries=2, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+    assert cache.stats() == {"size": 2, "max_entries": 2, "hits": 1, "misses": 1}
+
+
+def test_cache_never_outlives_the_result(projection):
+    """A projection is cached no longer than the result it came from."""
+
+    cache = projection.ProjectionCache(max_entries=10, ttl=60)
+
+    # A result that is not cached leaves its projection uncached
+    cache.set("uncached", "text", ttl=0)
+    assert cache.get("uncached") is None
+
+    # A result about to expire caps its projection's lifetime
+    cache.set("expiring", "text", ttl=0.01)
+    cache.set("long", "text", ttl=3600)
+    time.sleep(0.02)
+    assert cache.get("expiring") is None
+    assert cache.get("long") == "text"
+
+
+def test_cache_can_be_disabled(projection):
+    """A TTL of 0 disables the cache."""
+
+    cache = projection.ProjectionCache(max_entries=10, ttl=0)
+    cache.set("a", "text")
+
+    assert cache.get("a") is None
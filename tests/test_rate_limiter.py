@@ -0,0 +1,307 @@
+"""
+Tests for the rate limiter module of every server.
+"""
+
+# Standard library imports
+import asyncio
+from types import ModuleType
+
+# Third party imports
+import httpx
+import pytest
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Rate limiter module of the package under test
+@pytest.fixture
+def rate_limiter(utils) -> ModuleType:
+    """
+    Import the rate limiter module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("rate_limiter")
+
+
+def test_parse_hosts(rate_limiter):
+    """Overrides are parsed into the rate and burst of each host."""
+
+    assert rate_limiter.parse_hosts(" a.test=1.5:3 , b.test=0:1,") == {
+        "a.test": (1.5, 3),
+        "b.test": (0.0, 1),
+    }
+
+
+def test_parse_hosts_rejects_malformed_overrides(rate_limiter):
+    """A malformed override is named in the error."""
+
+    with pytest.raises(ValueError, match="a.test=1"):
+        rate_limiter.parse_hosts("a.test=1")
+
+
+def test_pacing_is_opt_in(rate_limiter):
+    """Hosts are not paced at a rate of 0 unless an override limits them."""
+
+    limiter = rate_limiter.RateLimiter(rate=0, hosts={"limited.test": (5, 1)})
+
+    assert limiter._bucket("other.test").rate == 0
+    assert limiter._bucket("limited.test").rate == 5
+
+
+async def test_unpaced_requests_go_at_once(rate_limiter):
+    """Without a rate, requests take no token and never wait."""
+
+    limiter = rate_limiter.RateLimiter(rate=0, burst=1, max_queue=0, hosts={})
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(100):
+        await limiter.acquire("upstream.test")
+        limiter.observe("upstream.test", 200, {})
+
+    assert loop.time() - start < 0.05
+    assert limiter.stats()["rejected"] == 0
+
+
+async def test_burst_then_paced(rate_limiter):
+    """The burst goes out at once and later requests wait for their token."""
+
+    bucket = rate_limiter.TokenBucket(rate=20, burst=2, max_queue=10, max_wait=5)
+    loop = asyncio.get_running_loop()
+
+    # Take the burst and two more tokens
+    start = loop.time()
+    await bucket.acquire()
+    await bucket.acquire()
+    burst = loop.time() - start
+    await asyncio.gather(bucket.acquire(), bucket.acquire())
+    paced = loop.time() - start
+
+    # The burst is immediate, the next two tokens take 50 ms each
+    assert burst < 0.02
+    assert 0.09 <= paced < 0.3
+
+
+async def test_full_queue_rejects(rate_limiter):
+    """A request is refused once max_queue requests are waiting."""
+
+    bucket = rate_limiter.TokenBucket(rate=10, burst=1, max_queue=1, max_wait=5)
+    await bucket.acquire()
+
+    # The second request waits, the third is refused
+    waiting = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(rate_limiter.RateLimitExceeded, match="queue is full"):
+        await bucket.acquire()
+
+    await waiting
+    assert bucket.stats()["rejected"] == 1
+
+
+async def test_long_wait_rejects(rate_limiter):
+    """A request is refused when its token is further away than max_wait."""
+
+    bucket = rate_limiter.TokenBucket(rate=1, burst=1, max_queue=10, max_wait=0.5)
+    await bucket.acquire()
+
+    with pytest.raises(rate_limiter.RateLimitExceeded):
+        await bucket.acquire()
+
+
+async def test_cancelled_wait_returns_the_token(rate_limiter):
+    """A request cancelled while waiting gives its reserved token back."""
+
+    bucket = rate_limiter.TokenBucket(rate=10, burst=1, max_queue=10, max_wait=5)
+    await bucket.acquire()
+
+    # Cancel a waiting request
+    waiting = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    # The token it reserved is free again
+    assert bucket._tokens > -1
+    assert bucket.stats()["waiting"] == 0
+
+
+async def test_throttling_pauses_and_halves_the_rate(rate_limiter):
+    """A 429 pauses the bucket for Retry-After and halves its rate."""
+
+    bucket = rate_limiter.TokenBucket(rate=100, burst=5, max_queue=10, max_wait=5)
+    loop = asyncio.get_running_loop()
+
+    # The upstream throttles
+    bucket.observe(429, {"retry-after": "0.1"})
+    assert bucket.stats()["rate"] == 50
+    assert bucket.stats()["throttled"] == 1
+
+    # The next token comes after the pause
+    start = loop.time()
+    await bucket.acquire()
+    assert loop.time() - start >= 0.1
+
+
+def test_rate_recovers_after_throttling(rate_limiter):
+    """Successful responses win the rate back step by step, up to the configured rate."""
+
+    bucket = rate_limiter.TokenBucket(rate=100, burst=5, max_queue=10, max_wait=5)
+    bucket.observe(429, {"retry-after": "0"})
+
+    # One success wins back 5% of the configured rate
+    bucket.observe(200, {})
+    assert bucket.stats()["rate"] == 55
+
+    # The rate never passes the configured rate
+    for _ in range(20):
+        bucket.observe(200, {})
+    assert bucket.stats()["rate"] == 100
+
+
+async def test_remaining_header_caps_the_tokens(rate_limiter):
+    """A used-up upstream window pauses the bucket until it resets."""
+
+    bucket = rate_limiter.TokenBucket(rate=100, burst=5, max_queue=10, max_wait=5)
+    loop = asyncio.get_running_loop()
+
+    # The upstream has no requests left for 100 ms
+    bucket.observe(200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0.1"})
+
+    start = loop.time()
+    await bucket.acquire()
+    assert loop.time() - start >= 0.1
+
+
+async def test_unpaced_requests_honor_retry_after(rate_limiter):
+    """Without a rate, a 429 still pauses the host for its Retry-After delay."""
+
+    limiter = rate_limiter.RateLimiter(rate=0, hosts={})
+    loop = asyncio.get_running_loop()
+
+    # The upstream throttles
+    limiter.observe("upstream.test", 429, {"retry-after": "0.1"})
+    assert limiter.stats()["throttled"] == 1
+
+    # Requests wait out the pause together, then go at once again
+    start = loop.time()
+    await asyncio.gather(*(limiter.acquire("upstream.test") for _ in range(3)))
+    assert loop.time() - start >= 0.1
+
+    start = loop.time()
+    await limiter.acquire("upstream.test")
+    assert loop.time() - start < 0.05
+
+
+async def test_unpaced_requests_honor_a_used_up_window(rate_limiter):
+    """Without a rate, a used-up upstream window pauses the host until it resets."""
+
+    limiter = rate_limiter.RateLimiter(rate=0, hosts={})
+    loop = asyncio.get_running_loop()
+
+    # Requests left in the window do not slow anything down
+    limiter.observe("upstream.test", 200, {"x-ratelimit-remaining": "3"})
+    start = loop.time()
+    await limiter.acquire("upstream.test")
+    assert loop.time() - start < 0.05
+
+    # A used-up window pauses until it resets
+    limiter.observe(
+        "upstream.test",
+        200,
+        {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0.1"},
+    )
+    start = loop.time()
+    await limiter.acquire("upstream.test")
+    assert loop.time() - start >= 0.1
+
+
+async def test_unpaced_requests_reject_long_pauses(rate_limiter):
+    """Without a rate, a pause longer than max_wait fails the request at once."""
+
+    limiter = rate_limiter.RateLimiter(rate=0, max_wait=0.5, hosts={})
+    limiter.observe("upstream.test", 429, {"retry-after": "30"})
+
+    with pytest.raises(rate_limiter.RateLimitExceeded, match="upstream.test"):
+        await limiter.acquire("upstream.test")
+    assert limiter.stats()["rejected"] == 1
+
+
+@pytest.mark.httpx
+async def test_transport_adapts_to_responses(rate_limiter):
+    """The transport takes a token per request and slows down on a 429."""
+
+    # Upstream throttling the first request only
+    statuses = [429, 200]
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), headers={"retry-after": "0"})
+
+    limiter = rate_limiter.RateLimiter(
+        rate=100, burst=5, max_queue=10, max_wait=5, hosts={}
+    )
+    transport = rate_limiter.RateLimitedTransport(
+        httpx.MockTransport(upstream), limiter
+    )
+
+    # Send two requests
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await client.get("https://upstream.test/data")
+        second = await client.get("https://upstream.test/data")
+
+    assert (first.status_code, second.status_code) == (429, 200)
+    assert limiter.stats()["throttled"] == 1
+    assert limiter._bucket("upstream.test").stats()["rate"] == 55
+
+
+@pytest.mark.httpx
+async def test_transport_names_the_host_when_refusing(rate_limiter):
+    """A refused request names its host."""
+
+    limiter = rate_limiter.RateLimiter(
+        rate=1, burst=1, max_queue=0, max_wait=5, hosts={}
+    )
+    transport = rate_limiter.RateLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200)), limiter
+    )
+
+    # The second request finds the queue full
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://upstream.test/data")
+        with pytest.raises(rate_limiter.RateLimitExceeded, match="upstream.test"):
+            await client.get("https://upstream.test/data")
+
+
+@pytest.mark.httpx
+async def test_transport_honors_retry_after_without_a_rate(rate_limiter):
+    """By default no rate is set, and the transport still waits out a 429."""
+
+    # Upstream throttling the first request only
+    statuses = [429, 200]
+    sent = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        sent.append(asyncio.get_running_loop().time())
+        return httpx.Response(statuses.pop(0), headers={"retry-after": "0.1"})
+
+    limiter = rate_limiter.RateLimiter(rate=0, hosts={})
+    transport = rate_limiter.RateLimitedTransport(
+        httpx.MockTransport(upstream), limiter
+    )
+
+    # Send two requests
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await client.get("https://upstream.test/data")
+        second = await client.get("https://upstream.test/data")
+
+    # The second request went out once the pause was over
+    assert (first.status_code, second.status_code) == (429, 200)
+    assert sent[1] - sent[0] >= 0.1
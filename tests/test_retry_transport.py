@@ -0,0 +1,258 @@
+"""
+Tests for the retry transport of every server with httpx transports.
+"""
+
+# Standard library imports
+import asyncio
+from types import ModuleType
+from typing import List
+
+# Third party imports
+import httpx
+import pytest
+
+# Run the async tests on asyncio, against the servers with httpx transports
+pytestmark = [pytest.mark.anyio, pytest.mark.httpx]
+
+
+# Retry module of the package under test
+@pytest.fixture
+def retry(utils) -> ModuleType:
+    """
+    Import the retry module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("retry")
+
+
+# Build a client retrying through a policy
+def retry_client(retry: ModuleType, upstream, policy) -> httpx.AsyncClient:
+    """
+    Build a client whose requests are retried and hedged on their way to an upstream.
+
+    Args:
+        retry (ModuleType): The retry module of the package under test
+        upstream: The handler answering the requests, see httpx.MockTransport
+        policy: The retry policy, a RetryPolicy of that module
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+
+    # Return the client
+    return httpx.AsyncClient(
+        transport=retry.RetryTransport(httpx.MockTransport(upstream), policy),
+        base_url="https://upstream.test",
+    )
+
+
+# Build an upstream answering with a sequence of status codes
+def sequence(statuses: List[int]):
+    """
+    Build an upstream answering each request with the next status code.
+
+    Args:
+        statuses (List[int]): The status codes, consumed in order
+
+    Returns:
+        The handler, with the requests it received in its "requests" attribute
+    """
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        upstream.requests.append(request)
+        return httpx.Response(statuses.pop(0))
+
+    upstream.requests = []
+
+    # Return the handler
+    return upstream
+
+
+def test_quantile_needs_min_samples(retry):
+    """No quantile is known before min_samples latencies were recorded."""
+
+    tracker = retry.LatencyTracker(min_samples=3)
+    tracker.observe(0.1)
+    tracker.observe(0.2)
+    assert tracker.quantile(0.5) is None
+
+    tracker.observe(0.3)
+    assert tracker.quantile(0.5) == 0.2
+    assert tracker.quantile(1) == 0.3
+
+
+def test_backoff_is_jittered_and_capped(retry):
+    """Backoffs stay between 0 and the capped exponential delay."""
+
+    policy = retry.RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    for attempt, cap in ((1, 0.1), (2, 0.2), (3, 0.3), (6, 0.3)):
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+
+
+async def test_retries_server_errors(retry):
+    """A 503 is retried and the success returned."""
+
+    upstream = sequence([503, 503, 200])
+    policy = retry.RetryPolicy(attempts=3, base_delay=0.001, hedge=False)
+
+    async with retry_client(retry, upstream, policy) as client:
+        response = await client.get("/data")
+
+    assert response.status_code == 200
+    assert len(upstream.requests) == 3
+    assert policy.stats()["retries"] == 2
+
+
+async def test_returns_the_last_response_when_exhausted(retry):
+    """Once the attempts run out, the last response is returned."""
+
+    upstream = sequence([503, 502])
+    policy = retry.RetryPolicy(attempts=2, base_delay=0.001, hedge=False)
+
+    async with retry_client(retry, upstream, policy) as client:
+        response = await client.get("/data")
+
+    assert response.status_code == 502
+    assert policy.stats()["exhausted"] == 1
+
+
+async def test_client_errors_are_not_retried(retry):
+    """A 404 is returned at once."""
+
+    upstream = sequence([404])
+    policy = retry.RetryPolicy(attempts=3, base_delay=0.001, hedge=False)
+
+    async with retry_client(retry, upstream, policy) as client:
+        response = await client.get("/data")
+
+    assert response.status_code == 404
+    assert policy.stats()["retries"] == 0
+
+
+async def test_non_idempotent_requests_are_sent_once(retry):
+    """A POST is not retried."""
+
+    upstream = sequence([503])
+    policy = retry.RetryPolicy(attempts=3, base_delay=0.001, hedge=False)
+
+    async with retry_client(retry, upstream, policy) as client:
+        response = await client.post("/data")
+
+    assert response.status_code == 503
+    assert len(upstream.requests) == 1
+
+
+async def test_connection_failures_are_retried(retry):
+    """A failed connection is retried."""
+
+    # Upstream failing the first connection
+    attempts = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    policy = retry.RetryPolicy(attempts=3, base_delay=0.001, hedge=False)
+    async with retry_client(retry, upstream, policy) as client:
+        response = await client.get("/data")
+
+    assert response.status_code == 200
+    assert len(attempts) == 2
+
+
+async def test_deadline_bounds_every_attempt(retry):
+    """An upstream slower than the deadline fails with a timeout."""
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200)
+
+    policy = retry.RetryPolicy(attempts=3, deadline=0.05, hedge=False)
+    async with retry_client(retry, upstream, policy) as client:
+        with pytest.raises(httpx.TimeoutException, match="deadline"):
+            await client.get("/data")
+
+    assert policy.stats()["exhausted"] == 1
+
+
+async def test_slow_primary_is_hedged(retry):
+    """A request slower than the p95 is sent again and the faster answer wins."""
+
+    # The first 20 requests warm up the tracker, then the primary stalls
+    calls = []
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(1 if len(calls) == 21 else 0.005)
+        return httpx.Response(200)
+
+    policy = retry.RetryPolicy(hedge=True)
+    async with retry_client(retry, upstream, policy) as client:
+        for _ in range(20):
+            await client.get("/data", extensions={"hedge": True})
+        response = await client.get("/data", extensions={"hedge": True})
+
+    assert response.status_code == 200
+    assert policy.stats()["hedged"] == 1
+    assert policy.stats()["hedge_wins"] == 1
+
+
+async def test_p95_holds_during_a_slowdown(retry):
+    """
+    Primaries cancelled by their winning hedge keep their time in the window, so the
+    p95 does not drift down, and hedge more often, while the upstream slows down.
+    """
+
+    # Requests take 10 ms, then every primary stalls while its hedge takes 5 ms
+    calls = []
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        slowdown = len(calls) > 20
+        primary = (len(calls) - 20) % 2 == 1
+        await asyncio.sleep((1 if primary else 0.005) if slowdown else 0.01)
+        return httpx.Response(200)
+
+    policy = retry.RetryPolicy(hedge=True)
+    async with retry_client(retry, upstream, policy) as client:
+        # Warm up the tracker
+        for _ in range(20):
+            await client.get("/data", extensions={"hedge": True})
+        tracker = policy.tracker("/data")
+        before = tracker.quantile(retry.HEDGE_QUANTILE)
+
+        # Slow down
+        for _ in range(20):
+            await client.get("/data", extensions={"hedge": True})
+        after = tracker.quantile(retry.HEDGE_QUANTILE)
+
+    # Every request was hedged, and the stalled primaries, which ran past the old
+    # p95 before their hedge won, raised it
+    assert policy.stats()["hedged"] == 20
+    assert after > before
+
+
+async def test_failed_attempts_are_timed(retry):
+    """An attempt that fails records the time it took to fail."""
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    policy = retry.RetryPolicy(attempts=1, hedge=True)
+    async with retry_client(retry, upstream, policy) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get("/data", extensions={"hedge": True})
+
+    assert list(policy.tracker("/data")._latencies) >= [0.05]
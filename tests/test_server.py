@@ -0,0 +1,30 @@
+"""
+Tests for the server module of every server.
+"""
+
+# Standard library imports
+import os
+import subprocess
+import sys
+
+
+def test_import_does_not_build_the_server(package, tmp_path):
+    """Importing the server module builds nothing, the factory builds the server once."""
+
+    # Import in a fresh interpreter, this process may have built the server already,
+    # and in a temporary directory, so any files the server opens stay out of the tree
+    script = (
+        f"import {package}.server as module\n"
+        "print(module.get_server.cache_info().currsize)\n"
+        "print(module.server is module.get_server() is module.get_server())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+    assert result.stdout.split() == ["0", "True"]
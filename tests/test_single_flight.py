@@ -0,0 +1,118 @@
+"""
+Tests for the single-flight module of every server.
+"""
+
+# Standard library imports
+import asyncio
+from types import ModuleType
+
+# Third party imports
+import pytest
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Single-flight module of the package under test
+@pytest.fixture
+def single_flight(utils) -> ModuleType:
+    """
+    Import the single-flight module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("single_flight")
+
+
+def test_keys_ignore_argument_order(single_flight):
+    """Equal arguments in any order share a key, different ones do not."""
+
+    make_key = single_flight.SingleFlight.make_key
+
+    assert make_key("tool", {"a": 1, "b": 2}) == make_key("tool", {"b": 2, "a": 1})
+    assert make_key("tool", None) == make_key("tool", {})
+    assert make_key("tool", {"a": 1}) != make_key("other", {"a": 1})
+
+
+async def test_concurrent_calls_share_one_call(single_flight):
+    """Identical concurrent calls run the call once and all get its result."""
+
+    group = single_flight.SingleFlight()
+    calls = 0
+
+    # Call that is slow enough for the others to join it
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(group.run("key", call) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert group.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+
+async def test_finished_calls_are_not_shared(single_flight):
+    """A call made after the previous one finished runs again."""
+
+    group = single_flight.SingleFlight()
+    calls = 0
+
+    # Call that counts its runs
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await group.run("key", call) == 1
+    assert await group.run("key", call) == 2
+
+
+async def test_errors_reach_every_caller(single_flight):
+    """A failed call fails every caller that shared it."""
+
+    group = single_flight.SingleFlight()
+
+    # Call that fails once the others joined it
+    async def call() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    results = await asyncio.gather(
+        *(group.run("key", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ["upstream failed"] * 3
+    assert group.stats()["in_flight"] == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_others(single_flight):
+    """A caller that goes away leaves the shared call running for the rest."""
+
+    group = single_flight.SingleFlight()
+    release = asyncio.Event()
+
+    # Call that waits to be released
+    async def call() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(group.run("key", call))
+    second = asyncio.ensure_future(group.run("key", call))
+    await asyncio.sleep(0)
+
+    # Cancel the first caller, then let the call finish
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,235 @@
+"""
+Tests for the streamable HTTP module of every server.
+"""
+
+# Standard library imports
+from types import ModuleType
+from typing import Any, Dict, List
+
+# Third party imports
+import httpx
+import mcp.types as types
+import pytest
+from mcp.server import Server
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Streamable HTTP module of the package under test
+@pytest.fixture
+def streamable_http(utils) -> ModuleType:
+    """
+    Import the streamable HTTP module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("streamable_http")
+
+
+# Client of an echo server served over the transport
+@pytest.fixture
+async def client(streamable_http):
+    """
+    Serve a server with one echo tool over the transport of the package under test.
+
+    Args:
+        streamable_http: The streamable HTTP module of the package under test
+
+    Yields:
+        httpx.AsyncClient: A client of the app
+    """
+
+    # Build a server with one tool
+    server = Server("test")
+
+    # Function to list the tools
+    @server.list_tools()
+    async def list_tools() -> List[types.Tool]:
+        return [
+            types.Tool(
+                name="echo",
+                description="Echo the text back.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"text": {"type": "string"}},
+                    "required": ["text"],
+                },
+            )
+        ]
+
+    # Function to call a tool
+    @server.call_tool()
+    async def call_tool(
+        name: str, arguments: Dict[str, Any]
+    ) -> List[types.TextContent]:
+        return [types.TextContent(type="text", text=arguments["text"])]
+
+    # Serve it on every method, as the servers do, so the transport answers them all
+    transport = streamable_http.StreamableHTTPTransport(server)
+    app = Starlette(
+        routes=[
+            Route("/mcp", transport.handle, methods=["GET", "POST", "DELETE"]),
+        ]
+    )
+
+    # Yield the client
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+# Build a JSON-RPC request
+def request(message_id: Any, method: str, **params: Any) -> Dict[str, Any]:
+    """
+    Build a JSON-RPC request, or a notification when the id is None.
+
+    Args:
+        message_id (Any): The request id, None for a notification
+        method (str): The method name
+        **params (Any): The parameters
+
+    Returns:
+        Dict[str, Any]: The message
+    """
+
+    # Build the message, with an id unless it is a notification
+    message = {"jsonrpc": "2.0", "method": method, "params": params}
+    if message_id is not None:
+        message["id"] = message_id
+
+    # Return the message
+    return message
+
+
+# Build an initialize request
+def initialize(version: str = types.LATEST_PROTOCOL_VERSION) -> Dict[str, Any]:
+    """
+    Build an initialize request for a protocol version.
+
+    Args:
+        version (str): The protocol version the client asks for
+
+    Returns:
+        Dict[str, Any]: The message
+    """
+
+    # Return the message
+    return request(
+        1,
+        "initialize",
+        protocolVersion=version,
+        capabilities={},
+        clientInfo={"name": "test", "version": "1"},
+    )
+
+
+async def test_implemented_version_is_agreed(client):
+    """The version the installed mcp implements is agreed to."""
+
+    response = await client.post("/mcp", json=initialize())
+
+    assert response.json()["result"]["protocolVersion"] == (
+        types.LATEST_PROTOCOL_VERSION
+    )
+
+
+@pytest.mark.parametrize("version", ["2025-03-26", "1999-01-01"])
+async def test_other_versions_get_the_implemented_one(client, version):
+    """A version the installed mcp does not implement is answered with the one it does."""
+
+    response = await client.post("/mcp", json=initialize(version))
+
+    assert response.json()["result"]["protocolVersion"] == (
+        types.LATEST_PROTOCOL_VERSION
+    )
+
+
+async def test_initialize_then_call_a_tool(client):
+    """A session is initialized and a tool called, each in its own POST."""
+
+    # Initialize, then acknowledge the initialization
+    response = await client.post("/mcp", json=initialize())
+    assert response.json()["result"]["serverInfo"]["name"] == "test"
+    response = await client.post(
+        "/mcp", json=request(None, "notifications/initialized")
+    )
+    assert response.status_code == 202
+
+    # Call the tool
+    response = await client.post(
+        "/mcp", json=request(2, "tools/call", name="echo", arguments={"text": "hi"})
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "result": {"content": [{"type": "text", "text": "hi"}], "isError": False},
+    }
+
+
+async def test_batch_gets_a_reply_per_request(client):
+    """A batch is answered with a list of replies, none for its notifications."""
+
+    response = await client.post(
+        "/mcp",
+        json=[
+            initialize(),
+            request(None, "notifications/initialized"),
+            request(2, "tools/list"),
+            request(3, "no/such/method"),
+        ],
+    )
+
+    replies = response.json()
+    assert [reply["id"] for reply in replies] == [1, 2, 3]
+    assert replies[1]["result"]["tools"][0]["name"] == "echo"
+    assert replies[2]["error"]["code"] == types.METHOD_NOT_FOUND
+
+
+async def test_notifications_only_are_accepted(client):
+    """A POST of notifications only is accepted with no body."""
+
+    response = await client.post(
+        "/mcp",
+        json=[
+            request(None, "notifications/initialized"),
+            request(None, "notifications/cancelled", requestId=2),
+        ],
+    )
+
+    assert response.status_code == 202
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("method", ["GET", "DELETE"])
+async def test_stream_and_session_methods_are_not_allowed(client, method):
+    """Stateless mode has no stream to open and no session to delete."""
+
+    response = await client.request(method, "/mcp")
+
+    assert response.status_code == 405
+    assert response.headers["allow"] == "POST"
+
+
+async def test_invalid_bodies_are_refused(client):
+    """A body that is not JSON, or not sent as JSON, is refused."""
+
+    response = await client.post(
+        "/mcp", content=b"{", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == types.PARSE_ERROR
+
+    response = await client.post("/mcp", content=b"{}")
+    assert response.status_code == 415
@@ -0,0 +1,261 @@
+"""
+Tests for the workers module of every server.
+"""
+
+# Standard library imports
+from types import ModuleType
+from typing import Callable, List
+
+# Third party imports
+import httpx
+import pytest
+
+# Run the async tests on asyncio
+pytestmark = pytest.mark.anyio
+
+
+# Workers module of the package under test
+@pytest.fixture
+def workers(utils) -> ModuleType:
+    """
+    Import the workers module of the package under test.
+
+    Args:
+        utils: Imports a utility module of the package under test
+
+    Returns:
+        ModuleType: The module
+    """
+
+    # Return the module
+    return utils("workers")
+
+
+# Session id announced by the first worker
+SESSION = "0123456789abcdef0123456789abcdef"
+
+
+# Build a router over fake workers
+def make_router(
+    workers: ModuleType,
+    handlers: List[Callable[[httpx.Request], httpx.Response]],
+):
+    """
+    Build a router over one fake worker per handler.
+
+    Args:
+        workers (ModuleType): The workers module of the package under test
+        handlers (List[Callable[[httpx.Request], httpx.Response]]): Answer the requests of each worker
+
+    Returns:
+        The router, a SessionRouter of that module
+    """
+
+    # Point the router at the fake workers instead of their sockets
+    router = workers.SessionRouter([f"worker-{i}.sock" for i in range(len(handlers))])
+    router._clients = [
+        httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://worker"
+        )
+        for handler in handlers
+    ]
+
+    # Return the router
+    return router
+
+
+# Build a client of the front app
+def front(router) -> httpx.AsyncClient:
+    """
+    Build a client of the front app of a router.
+
+    Args:
+        router: The router, a SessionRouter
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+
+    # Return the client
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(router.create_app()), base_url="http://front"
+    )
+
+
+# Build a worker answering with its index
+def worker(index: int, **routes: httpx.Response) -> Callable:
+    """
+    Build a fake worker that serves some routes and answers others with its index.
+
+    Args:
+        index (int): The worker index
+        **routes (httpx.Response): Responses by path, with slashes as underscores
+
+    Returns:
+        Callable: The request handler
+    """
+
+    # Function to answer a request
+    def handler(request: httpx.Request) -> httpx.Response:
+        route = request.url.path.strip("/").replace("/", "_")
+        if route in routes:
+            return routes[route]
+        return httpx.Response(200, json={"worker": index})
+
+    # Return the handler
+    return handler
+
+
+# Build a readiness report
+def ready(*reasons: str) -> httpx.Response:
+    """
+    Build the readiness response of a worker.
+
+    Args:
+        *reasons (str): Why the worker is not ready, none when it is
+
+    Returns:
+        httpx.Response: The response
+    """
+
+    # Return the report
+    return httpx.Response(
+        503 if reasons else 200,
+        json={"status": "not_ready" if reasons else "ready", "reasons": list(reasons)},
+    )
+
+
+async def test_relay_records_the_session_owner(workers):
+    """The session id is read from the endpoint event, even split over chunks."""
+
+    # Function to stream an endpoint event in two chunks
+    async def chunks():
+        yield b"event: endpoint\r\ndata: /messages/?session_id=" + SESSION[:8].encode()
+        yield SESSION[8:].encode() + b"\r\n\r\n"
+
+    router = make_router(workers, [worker(0), worker(1)])
+    router._streams[1] += 1
+    upstream = httpx.Response(200, content=chunks())
+
+    # Relay the stream from the second worker
+    relay = router._relay(upstream, 1)
+    await relay.__anext__()
+    assert SESSION not in router._sessions
+    await relay.__anext__()
+    assert router._sessions[SESSION] == 1
+
+    # The session is forgotten once the stream ends
+    with pytest.raises(StopAsyncIteration):
+        await relay.__anext__()
+    assert router._sessions == {}
+    assert router._streams == [0, 0]
+
+
+async def test_messages_reach_the_worker_of_their_session(workers):
+    """Messages go to the worker that owns the session, other requests are spread."""
+
+    router = make_router(workers, [worker(0), worker(1)])
+    router._sessions[SESSION] = 1
+
+    async with front(router) as client:
+        # Post messages for the session
+        for _ in range(3):
+            response = await client.post(f"/messages/?session_id={SESSION}")
+            assert response.json() == {"worker": 1}
+
+        # An unknown session is refused
+        response = await client.post(f"/messages/?session_id={'f' * 32}")
+        assert response.status_code == 404
+
+        # Other requests go round-robin
+        workers = [(await client.get("/tools")).json()["worker"] for _ in range(4)]
+        assert workers == [0, 1, 0, 1]
+
+
+async def test_ready_only_when_every_worker_is(workers):
+    """Readiness asks every worker and names the workers that are not ready."""
+
+    router = make_router(
+        workers, [worker(0, ready=ready()), worker(1, ready=ready("event loop lag"))]
+    )
+
+    async with front(router) as client:
+        response = await client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["worker 1: event loop lag"]
+    assert set(response.json()["workers"]) == {"0", "1"}
+
+
+async def test_ready_with_every_worker_ready(workers):
+    """The front process is ready when every worker is."""
+
+    router = make_router(workers, [worker(0, ready=ready()), worker(1, ready=ready())])
+
+    async with front(router) as client:
+        response = await client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+async def test_unreachable_worker_is_not_ready(workers):
+    """A worker that does not answer makes the front process not ready."""
+
+    # Function to fail like a dead socket
+    def dead(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("no socket", request=request)
+
+    router = make_router(workers, [worker(0, ready=ready()), dead])
+
+    async with front(router) as client:
+        response = await client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["worker 1 unreachable"]
+
+
+async def test_circuits_keep_the_worst_state(workers):
+    """A circuit is reported in the worst state it has on any worker."""
+
+    # Function to build the circuit states of a worker
+    def circuits(**states: str) -> httpx.Response:
+        return httpx.Response(200, json={"status": "ok", "circuits": states})
+
+    router = make_router(
+        workers,
+        [
+            worker(0, health_circuits=circuits(a="closed", b="half_open")),
+            worker(1, health_circuits=circuits(a="open", b="closed")),
+        ],
+    )
+
+    async with front(router) as client:
+        response = await client.get("/health/circuits")
+
+    assert response.json()["status"] == "degraded"
+    assert response.json()["circuits"] == {"a": "open", "b": "half_open"}
+
+
+async def test_metrics_are_scraped_from_every_worker(workers):
+    """The metrics of every worker are merged, each sample labeled with its worker."""
+
+    # Function to build the metrics of a worker
+    def metrics(calls: int) -> httpx.Response:
+        return httpx.Response(
+            200, text=f"# TYPE calls_total counter\ncalls_total {calls}\n"
+        )
+
+    router = make_router(
+        workers, [worker(0, metrics=metrics(1)), worker(1, metrics=metrics(2))]
+    )
+
+    async with front(router) as client:
+        response = await client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == (
+        "# TYPE calls_total counter\n"
+        'calls_total{worker="0"} 1\n'
+        'calls_total{worker="1"} 2\n'
+    )